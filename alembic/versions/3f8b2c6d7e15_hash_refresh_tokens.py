@@ -0,0 +1,64 @@
+"""hash refresh tokens
+
+Revision ID: 3f8b2c6d7e15
+Revises: 9d2f4b6a1c83
+Create Date: 2026-10-18 13:26:05.117842
+
+Existing tokens are backfilled in place with sha256(), so sessions survive the
+upgrade. Expired and revoked rows are dropped first – nothing can use them.
+The downgrade cannot restore raw tokens: every refresh token is invalidated and
+users have to log in again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b2c6d7e15'
+down_revision: Union[str, Sequence[str], None] = '9d2f4b6a1c83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DELETE FROM refresh_tokens WHERE is_revoked OR expires_at < now()")
+
+    op.add_column(
+        'refresh_tokens',
+        sa.Column('token_hash', sa.String(length=64), nullable=True),
+    )
+    op.execute(
+        "UPDATE refresh_tokens "
+        "SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+    )
+    op.alter_column('refresh_tokens', 'token_hash', nullable=False)
+
+    op.create_index(
+        op.f('ix_refresh_tokens_token_hash'),
+        'refresh_tokens',
+        ['token_hash'],
+        unique=True,
+    )
+    op.drop_index(op.f('ix_refresh_tokens_token'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM refresh_tokens")
+
+    op.add_column(
+        'refresh_tokens',
+        sa.Column('token', sa.String(length=255), nullable=False),
+    )
+    op.create_index(
+        op.f('ix_refresh_tokens_token'),
+        'refresh_tokens',
+        ['token'],
+        unique=True,
+    )
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
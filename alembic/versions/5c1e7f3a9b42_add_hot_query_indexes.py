@@ -0,0 +1,91 @@
+"""add hot query indexes
+
+Revision ID: 5c1e7f3a9b42
+Revises: 8a709e9dd738
+Create Date: 2026-10-18 10:12:41.530117
+
+Indexes are built with CREATE INDEX CONCURRENTLY, so tables stay writable
+while they build. CONCURRENTLY cannot run inside a transaction, so every
+statement runs in an autocommit block. If a concurrent build fails it leaves an
+INVALID index behind: drop it and rerun the migration.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7f3a9b42'
+down_revision: Union[str, Sequence[str], None] = '8a709e9dd738'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sessions_center_id_start_time_active',
+            'sessions',
+            ['center_id', 'start_time'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_sessions_start_time_active',
+            'sessions',
+            ['start_time'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_bookings_session_id_status_created_at',
+            'bookings',
+            ['session_id', 'status', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_tickets_user_id_center_id_valid_until_active',
+            'tickets',
+            ['user_id', 'center_id', sa.text('valid_until DESC')],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_orders_user_id_status',
+            'orders',
+            ['user_id', 'status'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_refresh_tokens_user_id'),
+            'refresh_tokens',
+            ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in [
+            ('ix_refresh_tokens_user_id', 'refresh_tokens'),
+            ('ix_orders_user_id_status', 'orders'),
+            ('ix_tickets_user_id_center_id_valid_until_active', 'tickets'),
+            ('ix_bookings_session_id_status_created_at', 'bookings'),
+            ('ix_sessions_start_time_active', 'sessions'),
+            ('ix_sessions_center_id_start_time_active', 'sessions'),
+        ]:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,75 @@
+"""add stats rollups
+
+Revision ID: 7b4e9a2d5c60
+Revises: 3f8b2c6d7e15
+Create Date: 2026-10-18 14:05:48.902315
+
+Creates the admin dashboard rollup tables and fills them from the full
+history (same aggregation as app.services.stats_rollups.rebuild_rollups).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b4e9a2d5c60'
+down_revision: Union[str, Sequence[str], None] = '3f8b2c6d7e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stats_signups_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('signups', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.create_table('stats_bookings_hourly',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('hour', sa.SmallInteger(), nullable=False),
+    sa.Column('class_type_id', sa.Integer(), nullable=False),
+    sa.Column('active_bookings', sa.Integer(), nullable=False),
+    sa.Column('total_bookings', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['class_type_id'], ['class_types.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('day', 'hour', 'class_type_id')
+    )
+    op.create_table('stats_revenue_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('revenue_cents', sa.Integer(), nullable=False),
+    sa.Column('tickets_sold', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+
+    op.execute("""
+        INSERT INTO stats_signups_daily (day, signups)
+        SELECT date(created_at), count(*)
+        FROM users
+        GROUP BY 1
+    """)
+    op.execute("""
+        INSERT INTO stats_bookings_hourly
+            (day, hour, class_type_id, active_bookings, total_bookings)
+        SELECT date(s.start_time), extract(hour FROM s.start_time)::int,
+               s.class_type_id,
+               count(*) FILTER (WHERE b.status = 'active'), count(*)
+        FROM bookings b
+        JOIN sessions s ON s.id = b.session_id
+        GROUP BY 1, 2, 3
+    """)
+    op.execute("""
+        INSERT INTO stats_revenue_daily (day, revenue_cents, tickets_sold)
+        SELECT date(t.created_at), sum(p.price_cents), count(*)
+        FROM tickets t
+        JOIN ticket_plans p ON p.id = t.plan_id
+        GROUP BY 1
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stats_revenue_daily')
+    op.drop_table('stats_bookings_hourly')
+    op.drop_table('stats_signups_daily')
@@ -0,0 +1,50 @@
+"""add keyset pagination indexes
+
+Revision ID: a61c3d8e2f47
+Revises: 7b4e9a2d5c60
+Create Date: 2026-10-18 14:48:12.660391
+
+(created_at, id) indexes for the paginated admin lists, built CONCURRENTLY
+like the hot query indexes (see 5c1e7f3a9b42).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a61c3d8e2f47'
+down_revision: Union[str, Sequence[str], None] = '7b4e9a2d5c60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_bookings_created_at_id', 'bookings'),
+    ('ix_tickets_created_at_id', 'tickets'),
+    ('ix_users_created_at_id', 'users'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in INDEXES:
+            op.create_index(
+                name,
+                table,
+                ['created_at', 'id'],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,38 @@
+"""add ai explanations
+
+Revision ID: b8d2f6a3c915
+Revises: f7c3a1e9b204
+Create Date: 2026-10-18 19:24:10.518734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f6a3c915'
+down_revision: Union[str, Sequence[str], None] = 'f7c3a1e9b204'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ai_explanations',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('explanation', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_ai_explanations_created_at'), 'ai_explanations', ['created_at'], unique=False)
+    op.create_index(op.f('ix_ai_explanations_expires_at'), 'ai_explanations', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ai_explanations_expires_at'), table_name='ai_explanations')
+    op.drop_index(op.f('ix_ai_explanations_created_at'), table_name='ai_explanations')
+    op.drop_table('ai_explanations')
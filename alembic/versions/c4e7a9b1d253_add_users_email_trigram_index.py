@@ -0,0 +1,59 @@
+"""add users email trigram index
+
+Revision ID: c4e7a9b1d253
+Revises: a61c3d8e2f47
+Create Date: 2026-10-18 15:31:07.214805
+
+GIN (gin_trgm_ops) index on users.email for member search and the admin
+email filters, built CONCURRENTLY (see 5c1e7f3a9b42). pg_trgm ships with
+postgres contrib; if the server does not provide it the migration only warns
+and member search keeps using ILIKE scans (app/services/member_search.py).
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a9b1d253'
+down_revision: Union[str, Sequence[str], None] = 'a61c3d8e2f47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        logger.warning('pg_trgm is not available, skipping ix_users_email_trgm')
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_trgm',
+            'users',
+            ['email'],
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # the extension is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_email_trgm',
+            table_name='users',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,81 @@
+"""add session templates
+
+Revision ID: e2b5d8f4a716
+Revises: c4e7a9b1d253
+Create Date: 2026-10-18 16:04:52.918344
+
+sessions.template_id is added as a nullable column without default (no table
+rewrite); its unique index is built CONCURRENTLY (see 5c1e7f3a9b42).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b5d8f4a716'
+down_revision: Union[str, Sequence[str], None] = 'c4e7a9b1d253'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('session_templates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('center_id', sa.Integer(), nullable=False),
+    sa.Column('class_type_id', sa.Integer(), nullable=False),
+    sa.Column('weekday', sa.SmallInteger(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('valid_from', sa.Date(), nullable=False),
+    sa.Column('valid_until', sa.Date(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.CheckConstraint('weekday BETWEEN 0 AND 6', name='ck_session_templates_weekday'),
+    sa.ForeignKeyConstraint(['center_id'], ['centers.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['class_type_id'], ['class_types.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_session_templates_center_id'),
+        'session_templates',
+        ['center_id'],
+        unique=False,
+    )
+
+    op.add_column('sessions', sa.Column('template_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'sessions_template_id_fkey',
+        'sessions',
+        'session_templates',
+        ['template_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_sessions_template_id_start_time',
+            'sessions',
+            ['template_id', 'start_time'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_sessions_template_id_start_time',
+            table_name='sessions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_constraint('sessions_template_id_fkey', 'sessions', type_='foreignkey')
+    op.drop_column('sessions', 'template_id')
+    op.drop_index(op.f('ix_session_templates_center_id'), table_name='session_templates')
+    op.drop_table('session_templates')
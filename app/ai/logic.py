@@ -1,15 +1,36 @@
 # app/ai/logic.py
-from collections import defaultdict
-from app.models.session import Session
+from datetime import time
+from typing import Iterable, NamedTuple
+
 from app.ai.rules import GOAL_CLASS_PRIORITY
 
 
+class WeeklySlot(NamedTuple):
+    weekday: int  # ISO, 1 = Monday
+    class_name: str
+    start_time: time
+
+
+# (weekday, class_name) -> start times, earliest first
+SlotIndex = dict[tuple[int, str], list[time]]
+
+
+def index_slots(rows: Iterable) -> SlotIndex:
+    """Index weekly template rows (weekday, class_name, start_time)."""
+    index: SlotIndex = {}
+    for r in rows:
+        index.setdefault((r.weekday, r.class_name), []).append(r.start_time)
+
+    # the same slot may appear once per end time (duration changes)
+    return {key: sorted(set(times)) for key, times in index.items()}
+
+
 def recommend_sessions(
     *,
     goal: str,
     days_per_week: int,
-    sessions: list[Session],
-) -> list[Session]:
+    slots: SlotIndex,
+) -> list[WeeklySlot]:
     """
     Weekly recommendation:
     - max 1 session per weekday
@@ -18,26 +39,22 @@ def recommend_sessions(
     """
 
     priority = GOAL_CLASS_PRIORITY.get(goal, [])
+    weekdays = sorted({weekday for weekday, _ in slots})
 
-    sessions_by_weekday: dict[int, list[Session]] = defaultdict(list)
-    for s in sessions:
-        sessions_by_weekday[s.start_time.weekday()].append(s)
-
-    selected: list[Session] = []
+    selected: list[WeeklySlot] = []
     used_weekdays = set()
 
     for class_name in priority:
-        for weekday in sorted(sessions_by_weekday.keys()):
+        for weekday in weekdays:
             if len(selected) >= days_per_week:
                 return selected
 
             if weekday in used_weekdays:
                 continue
 
-            for session in sessions_by_weekday[weekday]:
-                if session.class_type.name == class_name:
-                    selected.append(session)
-                    used_weekdays.add(weekday)
-                    break
+            times = slots.get((weekday, class_name))
+            if times:
+                selected.append(WeeklySlot(weekday, class_name, times[0]))
+                used_weekdays.add(weekday)
 
-    return selected
\ No newline at end of file
+    return selected
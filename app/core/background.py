@@ -0,0 +1,30 @@
+# app/core/background.py
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker(threading.Thread):
+    """
+    Runs `job()` every `interval` seconds in a daemon thread until stopped.
+    A failing run is logged and retried on the next tick.
+    """
+
+    def __init__(self, name: str, job: Callable[[], object], *, interval: float):
+        super().__init__(name=name, daemon=True)
+        self.job = job
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        self.join(timeout)
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.job()
+            except Exception:
+                logger.exception("Background job %s failed", self.name)
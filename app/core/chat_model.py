@@ -0,0 +1,144 @@
+# app/core/chat_model.py
+"""
+Streaming chat model layer (AI chat over server-sent events).
+
+Routers stream tokens with `get_chat_model().stream(...)`:
+
+- one `AsyncOpenAI` client per process (pooled connections, timeouts), so a
+  generation in progress holds neither a worker thread nor a DB connection;
+- a concurrency limit: at most AI_CHAT_MAX_CONCURRENT_STREAMS generations
+  at once. A request that gets no slot within AI_CHAT_ACQUIRE_TIMEOUT_SECONDS
+  fails with `ChatModelBusy` (503) before the response starts;
+- AI_CHAT_PROVIDER=fake swaps in the local `FakeChatModel` (tests,
+  time-to-first-token measurements).
+
+Responses go out as `SSEResponse` with one `sse_event` per token.
+"""
+import asyncio
+import json
+import threading
+from typing import AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+from openai import AsyncOpenAI
+
+from app.core.config import settings
+
+
+class ChatModelBusy(Exception):
+    """No free generation slot (→ 503)."""
+
+
+class StreamLimiter:
+    def __init__(self, *, max_concurrent: int, acquire_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.acquire_timeout = acquire_timeout
+
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._active = 0
+        self._rejected = 0
+
+    async def acquire(self) -> None:
+        """Take a slot or raise ChatModelBusy; pair with release()."""
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.acquire_timeout)
+        except TimeoutError:
+            self._rejected += 1
+            raise ChatModelBusy("No free chat generation slot") from None
+        self._active += 1
+
+    def release(self) -> None:
+        self._active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "active": self._active,
+            "max_concurrent": self.max_concurrent,
+            "rejected": self._rejected,
+        }
+
+
+class OpenAIChatModel:
+    def __init__(self, limiter: StreamLimiter):
+        self.limiter = limiter
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.AI_CHAT_TIMEOUT_SECONDS,
+        )
+
+    async def stream(
+        self,
+        messages: list[dict],
+        *,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Yield content deltas as the model produces them."""
+        stream = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    def stats(self) -> dict:
+        return {"provider": "openai", "streams": self.limiter.stats()}
+
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_chat_model():
+    global _model
+    with _model_lock:
+        if _model is None:
+            limiter = StreamLimiter(
+                max_concurrent=settings.AI_CHAT_MAX_CONCURRENT_STREAMS,
+                acquire_timeout=settings.AI_CHAT_ACQUIRE_TIMEOUT_SECONDS,
+            )
+            if settings.AI_CHAT_PROVIDER == "fake":
+                from app.core.chat_model_fake import FakeChatModel
+
+                _model = FakeChatModel(
+                    limiter,
+                    first_token_delay=settings.AI_CHAT_FAKE_FIRST_TOKEN_MS / 1000,
+                    token_delay=settings.AI_CHAT_FAKE_TOKEN_MS / 1000,
+                )
+            else:
+                _model = OpenAIChatModel(limiter)
+        return _model
+
+
+def sse_event(data: dict, event: str | None = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class SSEResponse(StreamingResponse):
+    """
+    Unbuffered event stream. `on_close` runs exactly once when the response
+    ends, fails or the client disconnects (even before the body started).
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(self, content, *, on_close: Callable[[], None]):
+        super().__init__(
+            content,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.on_close()
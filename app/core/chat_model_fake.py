@@ -0,0 +1,47 @@
+# app/core/chat_model_fake.py
+import asyncio
+from typing import AsyncIterator
+
+from app.core.chat_model import StreamLimiter
+
+DEFAULT_TOKENS = ["Priporočam ", "jogo ", "v ", "ponedeljek ", "ob ", "18:00."]
+
+
+class FakeChatModel:
+    """
+    Local stand-in for a streaming chat model (tests / TTFT measurements).
+
+    `first_token_delay` simulates the time to first token, `token_delay` the
+    gap between further tokens (seconds). `fail_after` raises after that many
+    tokens, as if the provider dropped the stream.
+    """
+
+    def __init__(
+        self,
+        limiter: StreamLimiter,
+        *,
+        tokens: list[str] | None = None,
+        first_token_delay: float = 0.0,
+        token_delay: float = 0.0,
+        fail_after: int | None = None,
+    ):
+        self.limiter = limiter
+        self.tokens = tokens or DEFAULT_TOKENS
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.fail_after = fail_after
+        self.calls: list[dict] = []
+
+    async def stream(self, messages: list[dict], **params) -> AsyncIterator[str]:
+        self.calls.append({"messages": messages, **params})
+
+        for i, token in enumerate(self.tokens):
+            if i == self.fail_after:
+                raise ConnectionError("fake stream dropped")
+            delay = self.first_token_delay if i == 0 else self.token_delay
+            if delay:
+                await asyncio.sleep(delay)
+            yield token
+
+    def stats(self) -> dict:
+        return {"provider": "fake", "streams": self.limiter.stats()}
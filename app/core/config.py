@@ -30,6 +30,36 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # bcrypt cost factor (each +1 doubles hashing time, see benchmarks/bcrypt_rounds.py)
+    BCRYPT_ROUNDS: int = Field(default=12, validation_alias="BCRYPT_ROUNDS")
+
+    # dedicated hashing pool; workers + queue must stay well below the
+    # request threadpool (40) – further logins get 503
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4,
+        validation_alias="PASSWORD_HASH_WORKERS",
+    )
+    PASSWORD_HASH_MAX_QUEUE: int = Field(
+        default=16,
+        validation_alias="PASSWORD_HASH_MAX_QUEUE",
+    )
+
+    # expired / revoked refresh tokens are deleted in batches by a worker
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = Field(
+        default=3600,
+        validation_alias="REFRESH_TOKEN_PURGE_INTERVAL_SECONDS",
+    )
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = Field(
+        default=1000,
+        validation_alias="REFRESH_TOKEN_PURGE_BATCH_SIZE",
+    )
+
+    # per-IP limits on login/bookings/AI; disable only for load tests
+    RATE_LIMIT_ENABLED: bool = Field(
+        default=True,
+        validation_alias="RATE_LIMIT_ENABLED",
+    )
+
     # -------------------------------------------------
     # Database
     # -------------------------------------------------
@@ -45,6 +75,30 @@ class Settings(BaseSettings):
     STRIPE_SECRET_KEY: str = Field(..., validation_alias="STRIPE_SECRET_KEY")
     STRIPE_WEBHOOK_SECRET: str = Field(..., validation_alias="STRIPE_WEBHOOK_SECRET")
 
+    # checkout gateway: "stripe" or "fake" (in-memory, tests / offline benchmarks)
+    PAYMENT_PROVIDER: str = Field(default="stripe", validation_alias="PAYMENT_PROVIDER")
+    PAYMENT_FAKE_LATENCY_MS: int = Field(default=0, validation_alias="PAYMENT_FAKE_LATENCY_MS")
+    STRIPE_CONNECT_TIMEOUT_SECONDS: float = Field(
+        default=3.0,
+        validation_alias="STRIPE_CONNECT_TIMEOUT_SECONDS",
+    )
+    STRIPE_READ_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        validation_alias="STRIPE_READ_TIMEOUT_SECONDS",
+    )
+    STRIPE_MAX_NETWORK_RETRIES: int = Field(
+        default=2,
+        validation_alias="STRIPE_MAX_NETWORK_RETRIES",
+    )
+    PAYMENT_BREAKER_FAILURES: int = Field(
+        default=5,
+        validation_alias="PAYMENT_BREAKER_FAILURES",
+    )
+    PAYMENT_BREAKER_RESET_SECONDS: float = Field(
+        default=30.0,
+        validation_alias="PAYMENT_BREAKER_RESET_SECONDS",
+    )
+
     # -------------------------------------------------
     # Email / SMTP
     # -------------------------------------------------
@@ -54,6 +108,43 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: Optional[str] = Field(default=None, validation_alias="SMTP_PASSWORD")
     EMAIL_FROM: Optional[str] = Field(default=None, validation_alias="EMAIL_FROM")
 
+    # outbox worker: "resend" or "fake" (in-memory, local runs)
+    EMAIL_PROVIDER: str = Field(default="resend", validation_alias="EMAIL_PROVIDER")
+    EMAIL_OUTBOX_POLL_SECONDS: float = Field(
+        default=2.0,
+        validation_alias="EMAIL_OUTBOX_POLL_SECONDS",
+    )
+    EMAIL_OUTBOX_BATCH_SIZE: int = Field(
+        default=50,
+        validation_alias="EMAIL_OUTBOX_BATCH_SIZE",
+    )
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = Field(
+        default=6,
+        validation_alias="EMAIL_OUTBOX_MAX_ATTEMPTS",
+    )
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = Field(
+        default=30,
+        validation_alias="EMAIL_OUTBOX_RETRY_BASE_SECONDS",
+    )
+
+    # webhook inbox worker (verified provider events, see webhook_inbox.py)
+    WEBHOOK_INBOX_POLL_SECONDS: float = Field(
+        default=1.0,
+        validation_alias="WEBHOOK_INBOX_POLL_SECONDS",
+    )
+    WEBHOOK_INBOX_BATCH_SIZE: int = Field(
+        default=20,
+        validation_alias="WEBHOOK_INBOX_BATCH_SIZE",
+    )
+    WEBHOOK_INBOX_MAX_ATTEMPTS: int = Field(
+        default=8,
+        validation_alias="WEBHOOK_INBOX_MAX_ATTEMPTS",
+    )
+    WEBHOOK_INBOX_RETRY_BASE_SECONDS: int = Field(
+        default=10,
+        validation_alias="WEBHOOK_INBOX_RETRY_BASE_SECONDS",
+    )
+
     # -------------------------------------------------
     # AI / OpenAI
     # -------------------------------------------------
@@ -62,6 +153,132 @@ class Settings(BaseSettings):
         validation_alias="OPENAI_API_KEY",
     )
 
+    # streaming /ai/chat: "openai" or "fake" (local model, tests / TTFT runs)
+    AI_CHAT_PROVIDER: str = Field(default="openai", validation_alias="AI_CHAT_PROVIDER")
+    AI_CHAT_FAKE_FIRST_TOKEN_MS: int = Field(default=0, validation_alias="AI_CHAT_FAKE_FIRST_TOKEN_MS")
+    AI_CHAT_FAKE_TOKEN_MS: int = Field(default=0, validation_alias="AI_CHAT_FAKE_TOKEN_MS")
+    AI_CHAT_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        validation_alias="AI_CHAT_TIMEOUT_SECONDS",
+    )
+    # concurrent generations per worker; further requests wait up to the
+    # acquire timeout, then get 503
+    AI_CHAT_MAX_CONCURRENT_STREAMS: int = Field(
+        default=20,
+        validation_alias="AI_CHAT_MAX_CONCURRENT_STREAMS",
+    )
+    AI_CHAT_ACQUIRE_TIMEOUT_SECONDS: float = Field(
+        default=2.0,
+        validation_alias="AI_CHAT_ACQUIRE_TIMEOUT_SECONDS",
+    )
+    # /ai/recommend builds the weekly template from sessions within ± this many days
+    AI_SCHEDULE_WINDOW_DAYS: int = Field(
+        default=28,
+        validation_alias="AI_SCHEDULE_WINDOW_DAYS",
+    )
+
+    # memoized /ai/recommend explanations (see explanation_cache.py)
+    AI_EXPLANATION_CACHE_TTL_SECONDS: int = Field(
+        default=7 * 24 * 3600,
+        validation_alias="AI_EXPLANATION_CACHE_TTL_SECONDS",
+    )
+    AI_EXPLANATION_CACHE_MAX_ENTRIES: int = Field(
+        default=1024,
+        validation_alias="AI_EXPLANATION_CACHE_MAX_ENTRIES",
+    )
+    AI_EXPLANATION_CACHE_MAX_ROWS: int = Field(
+        default=10_000,
+        validation_alias="AI_EXPLANATION_CACHE_MAX_ROWS",
+    )
+    AI_EXPLANATION_PURGE_INTERVAL_SECONDS: int = Field(
+        default=3600,
+        validation_alias="AI_EXPLANATION_PURGE_INTERVAL_SECONDS",
+    )
+
+    # -------------------------------------------------
+    # Caching
+    # -------------------------------------------------
+    SCHEDULE_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        validation_alias="SCHEDULE_CACHE_TTL_SECONDS",
+    )
+    SCHEDULE_CACHE_MAX_ENTRIES: int = Field(
+        default=512,
+        validation_alias="SCHEDULE_CACHE_MAX_ENTRIES",
+    )
+
+    # rendered AI chat system prompt (weekly schedule) per center
+    PROMPT_CACHE_TTL_SECONDS: int = Field(
+        default=600,
+        validation_alias="PROMPT_CACHE_TTL_SECONDS",
+    )
+    PROMPT_CACHE_MAX_ENTRIES: int = Field(
+        default=256,
+        validation_alias="PROMPT_CACHE_MAX_ENTRIES",
+    )
+
+    # authenticated user (id, email, role, is_active) per access token
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        validation_alias="PRINCIPAL_CACHE_TTL_SECONDS",
+    )
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000,
+        validation_alias="PRINCIPAL_CACHE_MAX_ENTRIES",
+    )
+
+    # Cache-Control max-age for public GETs (0 = always revalidate via ETag)
+    CATALOG_HTTP_MAX_AGE: int = Field(
+        default=60,
+        validation_alias="CATALOG_HTTP_MAX_AGE",
+    )
+    SCHEDULE_HTTP_MAX_AGE: int = Field(
+        default=0,
+        validation_alias="SCHEDULE_HTTP_MAX_AGE",
+    )
+
+    # session templates: wall-clock times are in this zone (DST-aware)
+    SCHEDULE_TIMEZONE: str = Field(
+        default="Europe/Ljubljana",
+        validation_alias="SCHEDULE_TIMEZONE",
+    )
+    SESSION_GENERATE_MAX_DAYS: int = Field(
+        default=366,
+        validation_alias="SESSION_GENERATE_MAX_DAYS",
+    )
+
+    # admin list endpoints (keyset pagination)
+    ADMIN_PAGE_SIZE: int = Field(default=50, validation_alias="ADMIN_PAGE_SIZE")
+    ADMIN_PAGE_SIZE_MAX: int = Field(default=500, validation_alias="ADMIN_PAGE_SIZE_MAX")
+
+    # max users per POST /admin/tickets/assign-bulk
+    TICKET_BULK_ASSIGN_MAX: int = Field(default=1000, validation_alias="TICKET_BULK_ASSIGN_MAX")
+
+    # rows per server-side cursor fetch / streamed chunk in admin exports
+    EXPORT_BATCH_SIZE: int = Field(default=1000, validation_alias="EXPORT_BATCH_SIZE")
+
+    # admin member typeahead (GET /admin/users/search)
+    MEMBER_SEARCH_LIMIT: int = Field(default=10, validation_alias="MEMBER_SEARCH_LIMIT")
+    MEMBER_SEARCH_LIMIT_MAX: int = Field(default=50, validation_alias="MEMBER_SEARCH_LIMIT_MAX")
+
+    # -------------------------------------------------
+    # Background workers (cache invalidation listener, ...)
+    # -------------------------------------------------
+    BACKGROUND_WORKERS_ENABLED: bool = Field(
+        default=True,
+        validation_alias="BACKGROUND_WORKERS_ENABLED",
+    )
+
+    # admin dashboard rollups: periodic rebuild of the most recent days
+    STATS_ROLLUP_CATCH_UP_INTERVAL_SECONDS: int = Field(
+        default=3600,
+        validation_alias="STATS_ROLLUP_CATCH_UP_INTERVAL_SECONDS",
+    )
+    STATS_ROLLUP_CATCH_UP_DAYS: int = Field(
+        default=35,
+        validation_alias="STATS_ROLLUP_CATCH_UP_DAYS",
+    )
+
     # -------------------------------------------------
     # Pydantic settings behavior
     # -------------------------------------------------
@@ -9,12 +9,13 @@ from app.core.security import oauth2_scheme
 from app.db import get_db
 from app.models.user import User
 from app.models.ticket import Ticket
+from app.services.principal_cache import Principal, load_principal
 
 
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
-) -> User:
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -28,21 +29,40 @@ def get_current_user(
             algorithms=[settings.ALGORITHM],
         )
         email: str | None = payload.get("sub")
+        user_id: int | None = payload.get("uid")
         if email is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
+    if user_id is not None:
+        # ⚡ cached – no query on a hit
+        principal = load_principal(db, user_id)
+    else:
+        # tokens issued before the "uid" claim
+        user = db.query(User).filter(User.email == email).first()
+        principal = Principal.from_user(user) if user else None
+
+    # 🔌 a cache miss opened a read transaction: end it so the connection
+    #    goes back to the pool instead of idling until the handler runs
+    if db.in_transaction():
+        db.commit()
+
+    if not principal:
         raise credentials_exception
 
-    return user
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user",
+        )
+
+    return principal
 
 
 def require_admin(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -52,7 +72,7 @@ def require_admin(
 
 def require_active_ticket(
     center_id: int = Query(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> Ticket:
     now = datetime.now(UTC)
@@ -82,7 +102,7 @@ def require_active_ticket(
 
 def require_active_ticket_for_session(
     session: Session,
-    current_user: User,
+    current_user: Principal,
     db: Session,
 ) -> Ticket:
     now = datetime.now(UTC)
@@ -0,0 +1,22 @@
+# app/core/email_fake.py
+class FakeEmailProvider:
+    """
+    In-memory stand-in for the Resend batch API (tests / local runs).
+
+    `fail_times` makes the next N batches fail for every message in them.
+    """
+
+    def __init__(self, *, fail_times: int = 0):
+        self.fail_times = fail_times
+        self.sent: list[dict] = []
+        self.batches: list[int] = []
+
+    def send_batch(self, messages: list[dict]) -> list[str | None]:
+        self.batches.append(len(messages))
+
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            return ["fake provider failure"] * len(messages)
+
+        self.sent.extend(messages)
+        return [None] * len(messages)
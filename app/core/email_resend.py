@@ -37,4 +37,50 @@ def send_email(
             print("Resend error:", response.text)
 
     except Exception as e:
-        print("Resend exception:", e)
\ No newline at end of file
+        print("Resend exception:", e)
+
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+RESEND_BATCH_LIMIT = 100
+
+
+def send_batch(messages: list[dict]) -> list[str | None]:
+    """
+    Sends messages ({to_email, subject, html_body}) with the batch API,
+    RESEND_BATCH_LIMIT per request. Resend batches are all-or-nothing, so every
+    message of a request gets the same result (error string or None = sent).
+    """
+    if not RESEND_API_KEY or not EMAIL_FROM:
+        return ["Resend not configured"] * len(messages)
+
+    if len(messages) > RESEND_BATCH_LIMIT:
+        return [
+            error
+            for start in range(0, len(messages), RESEND_BATCH_LIMIT)
+            for error in send_batch(messages[start:start + RESEND_BATCH_LIMIT])
+        ]
+
+    try:
+        response = requests.post(
+            RESEND_BATCH_URL,
+            headers={
+                "Authorization": f"Bearer {RESEND_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            json=[
+                {
+                    "from": EMAIL_FROM,
+                    "to": [m["to_email"]],
+                    "subject": m["subject"],
+                    "html": m["html_body"],
+                }
+                for m in messages
+            ],
+            timeout=10,
+        )
+    except Exception as e:
+        return [f"Resend exception: {e}"] * len(messages)
+
+    if response.status_code >= 400:
+        return [f"Resend error {response.status_code}: {response.text}"] * len(messages)
+
+    return [None] * len(messages)
@@ -3,6 +3,10 @@ from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 
+from app.core.chat_model import ChatModelBusy
+from app.core.password_hashing import PasswordHasherBusy
+from app.core.payment_gateway import PaymentGatewayUnavailable
+
 def register_exception_handlers(app):
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
@@ -18,6 +22,30 @@ def register_exception_handlers(app):
             content={"detail": "Too many requests"},
         )
 
+    @app.exception_handler(PasswordHasherBusy)
+    async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Server busy, please retry"},
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(PaymentGatewayUnavailable)
+    async def payment_gateway_unavailable_handler(request: Request, exc: PaymentGatewayUnavailable):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Payment provider unavailable, please retry"},
+            headers={"Retry-After": "5"},
+        )
+
+    @app.exception_handler(ChatModelBusy)
+    async def chat_model_busy_handler(request: Request, exc: ChatModelBusy):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "AI chat busy, please retry"},
+            headers={"Retry-After": "2"},
+        )
+
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception):
         return JSONResponse(
@@ -0,0 +1,93 @@
+# app/core/http_cache.py
+"""
+Conditional GET support (ETag / If-None-Match) for read-heavy endpoints.
+
+The validator is cheap: a hash of the request URL and the in-process version
+counters of the tables the response depends on. Counters are bumped by the
+invalidation bus (local commits + LISTEN/NOTIFY from other workers), so an
+unchanged table answers `304 Not Modified` without touching the database.
+
+A per-process boot id is mixed in because counters are process-local: two
+workers may have the same counter value for different data.
+"""
+import hashlib
+import secrets
+import threading
+
+from fastapi import Request, Response
+
+from app.core.invalidation import subscribe
+
+_BOOT_ID = secrets.token_hex(8)
+
+
+class TableVersions:
+    def __init__(self, topics: tuple[str, ...]):
+        self._versions = {topic: 0 for topic in topics}
+        self._lock = threading.Lock()
+
+        for topic in topics:
+            subscribe(topic, self._bumper(topic))
+
+    def _bumper(self, topic: str):
+        def bump(key: str | None = None) -> None:
+            with self._lock:
+                self._versions[topic] += 1
+
+        return bump
+
+    def get(self, *topics: str) -> tuple[int, ...]:
+        with self._lock:
+            return tuple(self._versions[t] for t in topics)
+
+
+table_versions = TableVersions(
+    ("centers", "class_types", "ticket_plans", "sessions", "bookings")
+)
+
+
+def make_etag(request: Request, *topics: str) -> str:
+    raw = "|".join(
+        [
+            _BOOT_ID,
+            request.url.path,
+            str(sorted(request.query_params.multi_items())),
+            *map(str, table_versions.get(*topics)),
+        ]
+    )
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def _cache_control(max_age: int) -> str:
+    if max_age <= 0:
+        # may be stored, but must be revalidated on every use
+        return "no-cache"
+    return f"public, max-age={max_age}"
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # weak comparison (RFC 9110 §13.1.2)
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def not_modified_response(etag: str, *, max_age: int) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": _cache_control(max_age)},
+    )
+
+
+def set_cache_headers(response: Response, etag: str, *, max_age: int) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _cache_control(max_age)
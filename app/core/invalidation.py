@@ -0,0 +1,168 @@
+# app/core/invalidation.py
+"""
+Cross-process cache invalidation over Postgres LISTEN/NOTIFY.
+
+Writers call `publish(db, topic, key)` *before* committing. This does two things:
+
+- queues `pg_notify(...)` in the same transaction, so every worker on every
+  host hears about the change only if (and when) the transaction commits
+- dispatches the topic to local subscribers right after this session commits,
+  so the writing worker never serves its own stale data
+
+Each worker runs one `InvalidationListener` thread that LISTENs on the channel
+and dispatches incoming payloads to the subscribers registered with
+`subscribe(topic, handler)`. Handlers receive the key (or None = "everything").
+"""
+import logging
+import select
+import threading
+from collections import defaultdict
+from typing import Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+
+Handler = Callable[[str | None], None]
+
+_handlers: dict[str, list[Handler]] = defaultdict(list)
+
+
+# -------------------------------------------------
+# Subscribers
+# -------------------------------------------------
+def subscribe(topic: str, handler: Handler) -> None:
+    if handler not in _handlers[topic]:
+        _handlers[topic].append(handler)
+
+
+def dispatch(topic: str, key: str | None = None) -> None:
+    for handler in list(_handlers.get(topic, ())):
+        try:
+            handler(key)
+        except Exception:
+            logger.exception("Invalidation handler failed for %s:%s", topic, key)
+
+
+def dispatch_payload(payload: str) -> None:
+    topic, _, key = payload.partition(":")
+    dispatch(topic, key or None)
+
+
+def invalidate_all() -> None:
+    """Used after a listener reconnect: notifications may have been missed."""
+    for topic in list(_handlers):
+        dispatch(topic, None)
+
+
+# -------------------------------------------------
+# Publishers
+# -------------------------------------------------
+def publish(db: Session, topic: str, key: str | int | None = None) -> None:
+    payload = topic if key is None else f"{topic}:{key}"
+
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": CHANNEL, "payload": payload},
+    )
+    db.info.setdefault("pending_invalidations", []).append(payload)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session: Session) -> None:
+    for payload in session.info.pop("pending_invalidations", []):
+        dispatch_payload(payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop("pending_invalidations", None)
+
+
+# -------------------------------------------------
+# Listener
+# -------------------------------------------------
+class InvalidationListener(threading.Thread):
+    """
+    Background LISTEN loop. Reconnects with exponential backoff and
+    invalidates every subscribed cache after each (re)connect.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        channel: str = CHANNEL,
+        poll_interval: float = 5.0,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+    ):
+        super().__init__(name="cache-invalidation-listener", daemon=True)
+        self.engine = engine
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.listening = threading.Event()
+        self.backend_pid: int | None = None
+        self._stop_event = threading.Event()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        self.join(timeout)
+
+    def run(self) -> None:
+        delay = self.reconnect_delay
+
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+                delay = self.reconnect_delay
+            except Exception:
+                logger.exception(
+                    "Invalidation listener lost its connection, retrying in %.1fs",
+                    delay,
+                )
+            finally:
+                self.listening.clear()
+                self.backend_pid = None
+
+            if self._stop_event.wait(delay):
+                break
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _listen(self) -> None:
+        raw = self.engine.raw_connection()
+        conn = raw.driver_connection
+        # dedicated connection, never handed back to the pool
+        raw.detach()
+
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+
+            invalidate_all()
+            self.backend_pid = conn.get_backend_pid()
+            self.listening.set()
+
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([conn], [], [], self.poll_interval)
+
+                if readable:
+                    conn.poll()
+                else:
+                    # idle → make sure the connection is still alive
+                    with conn.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    dispatch_payload(notify.payload)
+        finally:
+            raw.close()
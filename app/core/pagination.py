@@ -0,0 +1,116 @@
+# app/core/pagination.py
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are cut on a unique, stable sort key such as (created_at, id): the next
+page is `WHERE (created_at, id) < (:last_created_at, :last_id)`, which an index
+on the same columns answers without scanning skipped rows (unlike OFFSET).
+The cursor is an opaque base64 token of the last row's key values.
+
+Totals come from the planner's row estimate (EXPLAIN), not COUNT(*): exact
+counts over large tables cost a full scan on every page load.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, tuple_
+from sqlalchemy.orm import Query, Session
+
+
+def encode_cursor(values: list[Any]) -> str:
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: tuple) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+
+        return [_decode_value(key, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _decode_value(key, value: Any) -> Any:
+    if isinstance(key.type, DateTime):
+        return datetime.fromisoformat(value)
+
+    # a tampered cursor must not reach the query as a wrong-typed parameter
+    python_type = key.type.python_type
+    if isinstance(value, bool) or not isinstance(value, python_type):
+        raise TypeError
+    return value
+
+
+def paginate(
+    query: Query,
+    *,
+    keys: tuple,
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> tuple[list, str | None]:
+    """
+    Return one page of `query` ordered by `keys` and the cursor of the next
+    page (None on the last page). The last key must be unique (the id).
+    """
+    if cursor is not None:
+        after = tuple_(*decode_cursor(cursor, keys))
+        row = tuple_(*keys)
+        query = query.filter(row < after if descending else row > after)
+
+    order = [key.desc() if descending else key.asc() for key in keys]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([getattr(items[-1], key.key) for key in keys])
+
+    return items, next_cursor
+
+
+def estimate_count(db: Session, query: Query) -> int:
+    """Planner estimate of the number of rows `query` returns (no scan)."""
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    plan = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}",
+        compiled.params,
+    ).scalar_one()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def build_page(
+    db: Session,
+    query: Query,
+    *,
+    keys: tuple,
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> dict:
+    """Page envelope (see app.schemas.pagination.Page) for a filtered query."""
+    items, next_cursor = paginate(
+        query,
+        keys=keys,
+        cursor=cursor,
+        limit=limit,
+        descending=descending,
+    )
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "total_estimate": estimate_count(db, query) if cursor is None else None,
+    }
@@ -0,0 +1,116 @@
+# app/core/password_hashing.py
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool and its queue are full (→ 503)."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, size-limited thread pool.
+
+    bcrypt releases the GIL, so threads give real parallelism. At most
+    `max_workers + max_queue` calls are admitted at once; anything beyond
+    that fails immediately with PasswordHasherBusy instead of queueing
+    behind a login burst. Callers block while their hash runs, so the
+    admission limit also caps how many request threads auth can hold.
+    """
+
+    def __init__(self, *, max_workers: int, max_queue: int, window: int = 1000):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hasher",
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+        self.rejected = 0
+        # op -> call count and recent (queue wait, total) latencies in seconds
+        self._window = window
+        self._calls: dict[str, int] = {"hash": 0, "verify": 0}
+        self._latencies: dict[str, deque[tuple[float, float]]] = {
+            op: deque(maxlen=window) for op in self._calls
+        }
+
+    def hash(self, password: str) -> str:
+        return self.run("hash", get_password_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self.run("verify", verify_password, plain_password, hashed_password)
+
+    def run(self, op: str, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self._in_flight += 1
+
+        submitted = time.perf_counter()
+        started: list[float] = []
+
+        def job():
+            started.append(time.perf_counter())
+            return fn(*args)
+
+        try:
+            return self._executor.submit(job).result()
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._in_flight -= 1
+                self._calls[op] = self._calls.get(op, 0) + 1
+                self._latencies.setdefault(op, deque(maxlen=self._window)).append(
+                    (
+                        (started[0] if started else finished) - submitted,
+                        finished - submitted,
+                    )
+                )
+
+    def stats(self) -> dict:
+        with self._lock:
+            ops = {
+                op: _summarize(self._calls[op], list(samples))
+                for op, samples in self._latencies.items()
+            }
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "rejected": self.rejected,
+                **ops,
+            }
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def _summarize(calls: int, samples: list[tuple[float, float]]) -> dict:
+    waits = sorted(wait for wait, _ in samples)
+    totals = sorted(total for _, total in samples)
+    return {
+        "calls": calls,
+        "p50_ms": round(_percentile(totals, 50) * 1000, 1),
+        "p95_ms": round(_percentile(totals, 95) * 1000, 1),
+        "p99_ms": round(_percentile(totals, 99) * 1000, 1),
+        "queue_wait_p95_ms": round(_percentile(waits, 95) * 1000, 1),
+    }
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
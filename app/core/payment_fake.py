@@ -0,0 +1,53 @@
+# app/core/payment_fake.py
+import asyncio
+import itertools
+import threading
+
+from app.core.payment_gateway import CheckoutSession, CircuitBreaker, PaymentGatewayUnavailable
+
+
+class FakePaymentGateway:
+    """
+    In-memory stand-in for Stripe checkout (tests / offline benchmarks).
+
+    `latency` simulates the provider round trip (seconds); `fail_times` makes
+    the next N calls fail as if the provider were unreachable. Failures go
+    through the same circuit breaker as the real gateway.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, *, latency: float = 0.0, fail_times: int = 0):
+        self.breaker = breaker
+        self.latency = latency
+        self.fail_times = fail_times
+        self.sessions: list[dict] = []
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    async def create_checkout_session(self, *, order_id: int, **params) -> CheckoutSession:
+        self.breaker.before_call()
+
+        if self.latency:
+            try:
+                await asyncio.sleep(self.latency)
+            except BaseException:  # asyncio.CancelledError
+                self.breaker.record_aborted()
+                raise
+
+        with self._lock:
+            failing = self.fail_times > 0
+            if failing:
+                self.fail_times -= 1
+            else:
+                session_id = f"cs_fake_{next(self._ids)}"
+                self.sessions.append({"id": session_id, "order_id": order_id, **params})
+
+        if failing:
+            self.breaker.record_failure()
+            raise PaymentGatewayUnavailable("fake provider failure")
+
+        self.breaker.record_success()
+        return CheckoutSession(id=session_id, url=f"https://checkout.fake/{session_id}")
+
+    def stats(self) -> dict:
+        return {"provider": "fake", "breaker": self.breaker.stats()}
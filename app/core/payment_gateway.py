@@ -0,0 +1,209 @@
+# app/core/payment_gateway.py
+"""
+Payment gateway layer (Stripe checkout).
+
+Routers `await get_payment_gateway().create_checkout_session(...)` instead of
+calling the global `stripe` module:
+
+- one `StripeClient` per process on stripe's async HTTPX client: a single
+  pooled `httpx.AsyncClient` (keep-alive connections reused across
+  requests), explicit connect/read timeouts and `max_network_retries`
+  (stripe retries connection errors, 409/429/5xx with backoff and idempotency
+  keys). The provider round trip holds neither a worker thread nor a DB
+  connection;
+- a circuit breaker: after PAYMENT_BREAKER_FAILURES consecutive failures,
+  calls fail fast with `PaymentGatewayUnavailable` (503) for
+  PAYMENT_BREAKER_RESET_SECONDS instead of holding a worker thread for the
+  full timeout, then one trial call decides whether to close it again;
+- PAYMENT_PROVIDER=fake swaps in the in-memory `FakePaymentGateway`
+  (tests, offline benchmarks).
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+import httpx
+import stripe
+
+from app.core.config import settings
+
+
+class PaymentGatewayUnavailable(Exception):
+    """The provider is down or the circuit breaker is open (→ 503)."""
+
+
+@dataclass(frozen=True, slots=True)
+class CheckoutSession:
+    id: str
+    url: str
+
+
+class CircuitBreaker:
+    def __init__(self, *, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise PaymentGatewayUnavailable unless a call may go through."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return
+            self._rejected += 1
+        raise PaymentGatewayUnavailable("Payment provider unavailable")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def record_aborted(self) -> None:
+        """The call was cancelled without an answer (client gone, shutdown).
+
+        Not the provider's fault, so it does not count in the closed state;
+        an aborted trial counts as failed, otherwise the breaker would stay
+        half-open with a trial that never finishes.
+        """
+        with self._lock:
+            if self._trial_running:
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._state(),
+                "consecutive_failures": self._failures,
+                "rejected": self._rejected,
+            }
+
+
+# connection problems / provider-side errors count against the breaker;
+# invalid requests (our bug) do not
+_UNAVAILABLE_ERRORS = (
+    stripe.error.APIConnectionError,
+    stripe.error.RateLimitError,
+    stripe.error.APIError,
+)
+
+
+class StripeGateway:
+    def __init__(self, breaker: CircuitBreaker):
+        self.breaker = breaker
+
+        self.client = stripe.StripeClient(
+            settings.STRIPE_SECRET_KEY,
+            http_client=stripe.HTTPXClient(
+                timeout=httpx.Timeout(
+                    settings.STRIPE_READ_TIMEOUT_SECONDS,
+                    connect=settings.STRIPE_CONNECT_TIMEOUT_SECONDS,
+                ),
+            ),
+            max_network_retries=settings.STRIPE_MAX_NETWORK_RETRIES,
+        )
+
+    async def create_checkout_session(
+        self,
+        *,
+        order_id: int,
+        product_name: str,
+        amount_cents: int,
+        currency: str,
+        success_url: str,
+        cancel_url: str,
+    ) -> CheckoutSession:
+        self.breaker.before_call()
+
+        try:
+            session = await self.client.v1.checkout.sessions.create_async(
+                params={
+                    "mode": "payment",
+                    "payment_method_types": ["card"],
+                    "line_items": [
+                        {
+                            "price_data": {
+                                "currency": currency.lower(),
+                                "product_data": {"name": product_name},
+                                "unit_amount": amount_cents,
+                            },
+                            "quantity": 1,
+                        }
+                    ],
+                    "success_url": success_url,
+                    "cancel_url": cancel_url,
+                    "metadata": {"order_id": str(order_id)},
+                },
+                # one checkout session per order, even across our own retries
+                options={"idempotency_key": f"checkout-order-{order_id}"},
+            )
+        except _UNAVAILABLE_ERRORS as exc:
+            self.breaker.record_failure()
+            raise PaymentGatewayUnavailable(str(exc)) from exc
+        except stripe.error.StripeError:
+            self.breaker.record_success()  # the provider answered (bad request, auth, ...)
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:  # asyncio.CancelledError
+            self.breaker.record_aborted()
+            raise
+
+        self.breaker.record_success()
+        return CheckoutSession(id=session.id, url=session.url)
+
+    def stats(self) -> dict:
+        return {"provider": "stripe", "breaker": self.breaker.stats()}
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_payment_gateway():
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            breaker = CircuitBreaker(
+                failure_threshold=settings.PAYMENT_BREAKER_FAILURES,
+                reset_timeout=settings.PAYMENT_BREAKER_RESET_SECONDS,
+            )
+            if settings.PAYMENT_PROVIDER == "fake":
+                from app.core.payment_fake import FakePaymentGateway
+
+                _gateway = FakePaymentGateway(
+                    breaker,
+                    latency=settings.PAYMENT_FAKE_LATENCY_MS / 1000,
+                )
+            else:
+                _gateway = StripeGateway(breaker)
+        return _gateway
@@ -10,7 +10,11 @@ from app.core.config import settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 # ---------- PASSWORD ----------
 def get_password_hash(password: str) -> str:
@@ -26,6 +30,7 @@ def create_access_token(
     subject: str,
     role: str,
     expires_delta: Optional[timedelta] = None,
+    user_id: Optional[int] = None,
 ) -> str:
     if expires_delta:
         expire = datetime.now(UTC) + expires_delta
@@ -40,12 +45,17 @@ def create_access_token(
         "exp": expire,
     }
 
+    # lets get_current_user resolve the user from the principal cache
+    if user_id is not None:
+        to_encode["uid"] = user_id
+
     return jwt.encode(
         to_encode,
         settings.SECRET_KEY,
         algorithm=settings.ALGORITHM,
     )
 
+import hashlib
 import secrets
 from datetime import datetime, timedelta, UTC
 
@@ -54,5 +64,10 @@ def create_refresh_token() -> str:
     return secrets.token_urlsafe(48)
 
 
+def hash_refresh_token(token: str) -> str:
+    # tokens are 384-bit random values – a plain digest is enough (no salt)
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def refresh_token_expires() -> datetime:
     return datetime.now(UTC) + timedelta(days=30)
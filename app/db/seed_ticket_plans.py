@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from app.db import SessionLocal
+from app.core.invalidation import publish
 from app.models.ticket_plan import TicketPlan
 
 
@@ -45,6 +46,8 @@ def seed():
 
         db.add(TicketPlan(**plan))
 
+    # running API workers drop their cached ticket-plan ETags
+    publish(db, "ticket_plans")
     db.commit()
     db.close()
     print("Ticket plans seeded")
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -7,6 +9,14 @@ from slowapi.middleware import SlowAPIMiddleware
 
 from app.core.limiter import limiter
 from app.core.config import settings
+from app.core.background import PeriodicWorker
+from app.core.invalidation import InvalidationListener
+from app.db.database import engine
+from app.services.email_outbox import run_outbox_worker_once
+from app.services.explanation_cache import run_explanation_purge_once
+from app.services.refresh_tokens import run_refresh_token_purge_once
+from app.services.stats_rollups import run_rollup_catch_up_once
+from app.services.webhook_inbox import run_webhook_worker_once
 from app.routers import (
     auth,
     users,
@@ -22,7 +32,59 @@ from app.routers import (
     debug,
 )
 
-app = FastAPI(title="Group Fitness Booking API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    workers = []
+
+    if settings.BACKGROUND_WORKERS_ENABLED:
+        workers.append(InvalidationListener(engine))
+        workers.append(
+            PeriodicWorker(
+                "email-outbox",
+                run_outbox_worker_once,
+                interval=settings.EMAIL_OUTBOX_POLL_SECONDS,
+            )
+        )
+        workers.append(
+            PeriodicWorker(
+                "webhook-inbox",
+                run_webhook_worker_once,
+                interval=settings.WEBHOOK_INBOX_POLL_SECONDS,
+            )
+        )
+        workers.append(
+            PeriodicWorker(
+                "refresh-token-purge",
+                run_refresh_token_purge_once,
+                interval=settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+            )
+        )
+        workers.append(
+            PeriodicWorker(
+                "ai-explanation-purge",
+                run_explanation_purge_once,
+                interval=settings.AI_EXPLANATION_PURGE_INTERVAL_SECONDS,
+            )
+        )
+        workers.append(
+            PeriodicWorker(
+                "stats-rollup-catch-up",
+                run_rollup_catch_up_once,
+                interval=settings.STATS_ROLLUP_CATCH_UP_INTERVAL_SECONDS,
+            )
+        )
+
+    for worker in workers:
+        worker.start()
+
+    yield
+
+    for worker in workers:
+        worker.stop(timeout=5)
+
+
+app = FastAPI(title="Group Fitness Booking API", lifespan=lifespan)
 
 register_exception_handlers(app)
 
@@ -36,6 +98,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 app.include_router(auth.router)
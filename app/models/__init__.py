@@ -2,7 +2,12 @@ from .user import User
 from .center import Center
 from .class_type import ClassType
 from .session import Session
+from .session_template import SessionTemplate
 from .booking import Booking
 from .refresh_token import RefreshToken
 from .ticket import Ticket
-from .ticket_plan import TicketPlan
\ No newline at end of file
+from .ticket_plan import TicketPlan
+from .email_outbox import EmailOutbox
+from .stats_rollup import StatsSignupsDaily, StatsBookingsHourly, StatsRevenueDaily
+from .webhook_event import WebhookEvent
+from .ai_explanation import AiExplanation
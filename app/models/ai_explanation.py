@@ -0,0 +1,30 @@
+from datetime import datetime, UTC
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AiExplanation(Base):
+    """LLM explanation of a recommendation, keyed by a hash of its prompt inputs."""
+
+    __tablename__ = "ai_explanations"
+
+    # sha256 hex of model, parameters and rendered prompt
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    explanation: Mapped[str] = mapped_column(Text, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        index=True,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
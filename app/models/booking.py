@@ -1,6 +1,6 @@
 from datetime import datetime, UTC
 
-from sqlalchemy import ForeignKey, DateTime, String
+from sqlalchemy import ForeignKey, DateTime, String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -8,6 +8,17 @@ from app.db.base import Base
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # waitlist promotion: next waiting booking of a session
+        Index(
+            "ix_bookings_session_id_status_created_at",
+            "session_id",
+            "status",
+            "created_at",
+        ),
+        # admin list: keyset pagination, newest first
+        Index("ix_bookings_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
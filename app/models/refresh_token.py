@@ -10,8 +10,9 @@ class RefreshToken(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
-    token: Mapped[str] = mapped_column(
-        String(255),
+    # sha256 hex digest – the raw token is only ever held by the client
+    token_hash: Mapped[str] = mapped_column(
+        String(64),
         unique=True,
         index=True,
         nullable=False,
@@ -19,6 +20,7 @@ class RefreshToken(Base):
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id"),
+        index=True,
         nullable=False,
     )
 
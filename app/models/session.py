@@ -1,4 +1,4 @@
-from sqlalchemy import DateTime, ForeignKey, Integer, Boolean
+from sqlalchemy import DateTime, ForeignKey, Integer, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, UTC
 
@@ -7,6 +7,27 @@ from app.db.base import Base
 
 class Session(Base):
     __tablename__ = "sessions"
+    __table_args__ = (
+        # schedule listing: by center + day, or by day only
+        Index(
+            "ix_sessions_center_id_start_time_active",
+            "center_id",
+            "start_time",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_sessions_start_time_active",
+            "start_time",
+            postgresql_where=text("is_active"),
+        ),
+        # template generator: one session per template occurrence (idempotent reruns)
+        Index(
+            "uq_sessions_template_id_start_time",
+            "template_id",
+            "start_time",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -20,6 +41,12 @@ class Session(Base):
         nullable=False,
     )
 
+    # set when materialized from a SessionTemplate
+    template_id: Mapped[int | None] = mapped_column(
+        ForeignKey("session_templates.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
     start_time: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -0,0 +1,71 @@
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, Boolean, SmallInteger, Time, CheckConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import date, datetime, time, UTC
+
+from app.db.base import Base
+
+
+class SessionTemplate(Base):
+    """Weekly recurring session; materialized by services.session_generator."""
+
+    __tablename__ = "session_templates"
+    __table_args__ = (
+        CheckConstraint("weekday BETWEEN 0 AND 6", name="ck_session_templates_weekday"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    center_id: Mapped[int] = mapped_column(
+        ForeignKey("centers.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    class_type_id: Mapped[int] = mapped_column(
+        ForeignKey("class_types.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # 0 = Monday ... 6 = Sunday (date.weekday())
+    weekday: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+    )
+
+    # wall-clock time in settings.SCHEDULE_TIMEZONE
+    start_time: Mapped[time] = mapped_column(
+        Time,
+        nullable=False,
+    )
+
+    capacity: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=10,
+    )
+
+    valid_from: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+
+    # inclusive; NULL = open-ended
+    valid_until: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+    )
+
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    # relationships
+    class_type = relationship("ClassType")
@@ -0,0 +1,69 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+# Daily rollups behind /api/v1/admin/stats, maintained by
+# app.services.stats_rollups (deltas on write + periodic rebuild).
+# Days are dates in the database time zone, same as func.date() on the
+# source timestamps.
+
+
+class StatsSignupsDaily(Base):
+    __tablename__ = "stats_signups_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    signups: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+
+
+class StatsBookingsHourly(Base):
+    __tablename__ = "stats_bookings_hourly"
+
+    # day / hour of the session start
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    hour: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+
+    class_type_id: Mapped[int] = mapped_column(
+        ForeignKey("class_types.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # bookings currently active
+    active_bookings: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+
+    # every booking ever made (any status) – class popularity
+    total_bookings: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+
+
+class StatsRevenueDaily(Base):
+    __tablename__ = "stats_revenue_daily"
+
+    # day the ticket was created
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    revenue_cents: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+
+    tickets_sold: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
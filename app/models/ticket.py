@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, DateTime, String, Boolean, Integer
+from sqlalchemy import ForeignKey, DateTime, String, Boolean, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, UTC
 from app.models.ticket_plan import TicketPlan
@@ -8,6 +8,18 @@ from app.models.center import Center
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        # active ticket lookup on every booking
+        Index(
+            "ix_tickets_user_id_center_id_valid_until_active",
+            "user_id",
+            "center_id",
+            text("valid_until DESC"),
+            postgresql_where=text("is_active"),
+        ),
+        # admin list: keyset pagination, newest first
+        Index("ix_tickets_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
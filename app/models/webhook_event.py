@@ -0,0 +1,61 @@
+from datetime import datetime, UTC
+
+from sqlalchemy import DateTime, Integer, String, Text, Index, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class WebhookEvent(Base):
+    """Inbox of verified provider events, processed by the webhook worker."""
+
+    __tablename__ = "webhook_events"
+    __table_args__ = (
+        # provider event id: a redelivered event is stored once
+        UniqueConstraint("provider", "event_id", name="uq_webhook_events_provider_event_id"),
+        # worker: due pending events, oldest first
+        Index(
+            "ix_webhook_events_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    event_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="pending",
+        nullable=False,
+    )
+    # pending | processed | dead
+
+    # handler result for processed events ("ticket created", "ignored", ...)
+    outcome: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    received_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    processed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
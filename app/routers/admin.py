@@ -1,25 +1,80 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from datetime import datetime, timedelta, date, UTC
+from sqlalchemy import func
+from datetime import datetime, timedelta, date, time, UTC
+from zoneinfo import ZoneInfo
+from typing import Literal
 from sqlalchemy.orm import selectinload
 from app.db import get_db
 from app.core.dependencies import require_admin
 from app.models.session import Session as TrainingSession
 from app.models.class_type import ClassType
 from app.models.booking import Booking
-from app.schemas.session import SessionCreate, SessionOut, SessionCapacityUpdate
+from app.schemas.session import (
+    SessionCancelBulk,
+    SessionCancelOut,
+    SessionCapacityUpdate,
+    SessionCreate,
+    SessionOut,
+)
+from app.models.session_template import SessionTemplate
+from app.schemas.session_template import (
+    SessionGenerateOut,
+    SessionGenerateRequest,
+    SessionTemplateCreate,
+    SessionTemplateOut,
+)
+from app.services.session_generator import generate_sessions
+from app.services.session_cancellation import cancel_sessions
 from app.schemas.booking import AdminBookingOut
 from app.models.user import User
 from app.schemas.ticket_plan import TicketPlanOut
-from app.schemas.user import AdminUserOut
+from app.schemas.user import AdminUserOut, MemberSearchResult
 from app.models.ticket import Ticket
 from app.schemas.ticket import AdminTicketOut
-from app.schemas.ticket import AdminAssignTicket
+from app.schemas.ticket import AdminAssignTicket, AdminAssignTicketBulk, BulkAssignOut
+from app.services.ticket_assignment import assign_tickets_bulk
 from app.models.ticket_plan import TicketPlan
 from app.models.center import Center
 from app.schemas.center import CenterCreate, CenterOut
 from app.schemas.class_type import ClassTypeCreate, ClassTypeOut
+from app.core.config import settings
+from app.core.invalidation import publish
+from app.core.pagination import build_page
+from app.services.admin_export import (
+    EXPORT_FORMATS,
+    bookings_query,
+    gzip_stream,
+    orders_query,
+    stream_rows,
+    tickets_query,
+    users_query,
+)
+from app.services.admin_filters import (
+    BookingFilters,
+    OrderFilters,
+    TicketFilters,
+    UserFilters,
+)
+from app.schemas.pagination import Page
+from app.models.webhook_event import WebhookEvent
+from app.schemas.webhook_event import WebhookEventOut
+from app.services.member_search import search_members
+from app.services.schedule_cache import schedule_cache
+from app.core.password_hashing import password_hasher
+from app.core.chat_model import get_chat_model
+from app.core.payment_gateway import get_payment_gateway
+from app.services.principal_cache import principal_cache
+from app.services.prompt_cache import prompt_cache
+from app.services.explanation_cache import explanation_cache, explanation_flights
+from app.services.refresh_tokens import last_purge
+from app.services.stats_rollups import rebuild_rollups, record_ticket_sale
+from app.models.stats_rollup import (
+    StatsBookingsHourly,
+    StatsRevenueDaily,
+    StatsSignupsDaily,
+)
 router = APIRouter(
     prefix="/api/v1/admin",
     tags=["admin"],
@@ -63,6 +118,8 @@ def create_session(
     )
 
     db.add(session)
+    db.flush()
+    publish(db, "sessions", session.id)
     db.commit()
     db.refresh(session)
 
@@ -97,6 +154,7 @@ def update_session_capacity(
         )
 
     session.capacity = data.capacity
+    publish(db, "sessions", session.id)
     db.commit()
     db.refresh(session)
 
@@ -109,30 +167,167 @@ def cancel_session(
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
-    session = db.query(TrainingSession).filter(
-        TrainingSession.id == session_id,
-        TrainingSession.is_active.is_(True),
-    ).first()
+    # ❌ Cancels the bookings too: entries refunded, members notified
+    result = cancel_sessions(db, TrainingSession.id == session_id)
 
-    if not session:
+    if not result["session_ids"]:
         raise HTTPException(
             status_code=404,
             detail="Active session not found",
         )
 
-    session.is_active = False
+    publish(db, "sessions", session_id)
+    publish(db, "bookings", session_id)
     db.commit()
-    db.refresh(session)
 
-    return session
+    return db.get(TrainingSession, session_id)
 
-@router.get("/bookings", response_model=list[AdminBookingOut])
-def view_bookings(
-    session_id: int | None = None,
+
+# 🚫 Day / center closure: every active session in the range, set-based
+@router.post("/sessions/cancel-bulk", response_model=SessionCancelOut)
+def cancel_sessions_bulk(
+    data: SessionCancelBulk,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    date_to = data.date_to or data.date_from
+    if date_to < data.date_from:
+        raise HTTPException(status_code=400, detail="date_to must not be before date_from")
+
+    # local days, like the session templates
+    tz = ZoneInfo(settings.SCHEDULE_TIMEZONE)
+    criteria = [
+        TrainingSession.start_time >= datetime.combine(data.date_from, time(), tz),
+        TrainingSession.start_time < datetime.combine(date_to + timedelta(days=1), time(), tz),
+    ]
+    if data.center_id is not None:
+        criteria.append(TrainingSession.center_id == data.center_id)
+
+    result = cancel_sessions(db, *criteria)
+
+    if result["session_ids"]:
+        publish(db, "sessions")
+        publish(db, "bookings")
+    db.commit()
+
+    return {
+        "sessions_cancelled": len(result["session_ids"]),
+        "bookings_cancelled": result["bookings_cancelled"],
+        "entries_refunded": result["entries_refunded"],
+        "notifications": result["notifications"],
+    }
+
+# 🔁 Recurring session templates
+@router.get("/session-templates", response_model=list[SessionTemplateOut])
+def list_session_templates(
     center_id: int | None = None,
-    day: date | None = None,
-    status: str | None = None,
-    email: str | None = None,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    query = db.query(SessionTemplate)
+    if center_id is not None:
+        query = query.filter(SessionTemplate.center_id == center_id)
+
+    return query.order_by(
+        SessionTemplate.center_id,
+        SessionTemplate.weekday,
+        SessionTemplate.start_time,
+    ).all()
+
+
+@router.post("/session-templates", response_model=SessionTemplateOut)
+def create_session_template(
+    data: SessionTemplateCreate,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    if data.valid_until is not None and data.valid_until < data.valid_from:
+        raise HTTPException(
+            status_code=400,
+            detail="valid_until must not be before valid_from",
+        )
+
+    class_type = db.query(ClassType).filter(
+        ClassType.id == data.class_type_id,
+        ClassType.is_active.is_(True),
+    ).first()
+
+    if not class_type:
+        raise HTTPException(status_code=404, detail="Class type not found")
+
+    center = db.query(Center).filter(
+        Center.id == data.center_id,
+        Center.is_active.is_(True),
+    ).first()
+
+    if not center:
+        raise HTTPException(status_code=404, detail="Center not found")
+
+    if class_type.center_id != data.center_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Class type does not belong to this center",
+        )
+
+    template = SessionTemplate(**data.model_dump(), is_active=True)
+    db.add(template)
+    db.commit()
+    db.refresh(template)
+
+    return template
+
+
+@router.patch("/session-templates/{template_id}/deactivate")
+def deactivate_session_template(
+    template_id: int,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    template = db.get(SessionTemplate, template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Session template not found")
+
+    # already generated sessions stay; cancel them separately if needed
+    template.is_active = False
+    db.commit()
+    return {"status": "deactivated"}
+
+
+@router.post("/session-templates/generate", response_model=SessionGenerateOut)
+def generate_template_sessions(
+    data: SessionGenerateRequest,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    if data.date_to < data.date_from:
+        raise HTTPException(status_code=400, detail="date_to must not be before date_from")
+
+    if (data.date_to - data.date_from).days >= settings.SESSION_GENERATE_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range is limited to {settings.SESSION_GENERATE_MAX_DAYS} days",
+        )
+
+    session_ids = generate_sessions(
+        db,
+        data.date_from,
+        data.date_to,
+        center_id=data.center_id,
+        template_ids=data.template_ids,
+    )
+
+    if session_ids:
+        publish(db, "sessions")
+    db.commit()
+
+    return {"created": len(session_ids), "session_ids": session_ids}
+
+
+@router.get("/bookings", response_model=Page[AdminBookingOut])
+def view_bookings(
+    filters: BookingFilters = Depends(),
+    cursor: str | None = None,
+    limit: int = Query(settings.ADMIN_PAGE_SIZE, ge=1, le=settings.ADMIN_PAGE_SIZE_MAX),
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
@@ -145,34 +340,23 @@ def view_bookings(
         .join(TrainingSession)
         .join(User)
     )
-
-    if session_id is not None:
-        query = query.filter(Booking.session_id == session_id)
-
-    if center_id is not None:
-        query = query.filter(TrainingSession.center_id == center_id)
-
-    if status is not None:
-        query = query.filter(Booking.status == status)
-
-    if email is not None:
-        query = query.filter(User.email.ilike(f"%{email}%"))
-
-    if day is not None:
-        start = datetime(day.year, day.month, day.day, tzinfo=UTC)
-        end = start + timedelta(days=1)
-        query = query.filter(
-            TrainingSession.start_time >= start,
-            TrainingSession.start_time < end,
-        )
-
-    return query.order_by(Booking.created_at.desc()).all()
+    query = filters.apply(query)
+
+    return build_page(
+        db,
+        query,
+        keys=(Booking.created_at, Booking.id),
+        cursor=cursor,
+        limit=limit,
+    )
 
 
-@router.get("/sessions", response_model=list[SessionOut])
+@router.get("/sessions", response_model=Page[SessionOut])
 def list_sessions(
     center_id: int | None = None,
     day: date | None = None,
+    cursor: str | None = None,
+    limit: int = Query(settings.ADMIN_PAGE_SIZE, ge=1, le=settings.ADMIN_PAGE_SIZE_MAX),
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
@@ -189,49 +373,55 @@ def list_sessions(
             TrainingSession.start_time < end,
         )
 
-    return query.order_by(TrainingSession.start_time).all()
+    # 📄 schedule order: (start_time, id) ascending
+    return build_page(
+        db,
+        query,
+        keys=(TrainingSession.start_time, TrainingSession.id),
+        cursor=cursor,
+        limit=limit,
+        descending=False,
+    )
 
 
 
-@router.get("/users", response_model=list[AdminUserOut])
+@router.get("/users", response_model=Page[AdminUserOut])
 def list_users(
-    has_valid_ticket: bool | None = None,
+    filters: UserFilters = Depends(),
+    cursor: str | None = None,
+    limit: int = Query(settings.ADMIN_PAGE_SIZE, ge=1, le=settings.ADMIN_PAGE_SIZE_MAX),
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
-    now = datetime.now(UTC)
-
-    query = db.query(User)
-
-    if has_valid_ticket is not None:
-        valid_ticket_subquery = (
-            db.query(Ticket.user_id)
-            .filter(
-                Ticket.is_active.is_(True),
-                Ticket.valid_from <= now,
-                Ticket.valid_until >= now,
-                or_(
-                    Ticket.remaining_entries.is_(None),
-                    Ticket.remaining_entries > 0,
-                ),
-            )
-            .subquery()
-        )
+    query = filters.apply(db.query(User))
+
+    return build_page(
+        db,
+        query,
+        keys=(User.created_at, User.id),
+        cursor=cursor,
+        limit=limit,
+    )
 
-        if has_valid_ticket:
-            query = query.filter(User.id.in_(valid_ticket_subquery))
-        else:
-            query = query.filter(~User.id.in_(valid_ticket_subquery))
 
-    return query.order_by(User.created_at.desc()).all()
+# 🔎 Typeahead: ranked email matches (trigram index when pg_trgm is installed)
+@router.get("/users/search", response_model=list[MemberSearchResult])
+def search_users(
+    q: str = Query(..., min_length=2, max_length=255),
+    limit: int = Query(settings.MEMBER_SEARCH_LIMIT, ge=1, le=settings.MEMBER_SEARCH_LIMIT_MAX),
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    return [
+        {**AdminUserOut.model_validate(user).model_dump(), "score": score}
+        for user, score in search_members(db, q, limit)
+    ]
 
-@router.get("/tickets", response_model=list[AdminTicketOut])
+@router.get("/tickets", response_model=Page[AdminTicketOut])
 def list_tickets(
-    email: str | None = None,
-    plan_id: int | None = None,
-    status: str | None = None,
-    from_date: date | None = None,
-    to_date: date | None = None,
+    filters: TicketFilters = Depends(),
+    cursor: str | None = None,
+    limit: int = Query(settings.ADMIN_PAGE_SIZE, ge=1, le=settings.ADMIN_PAGE_SIZE_MAX),
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
@@ -240,25 +430,15 @@ def list_tickets(
         .join(User)
         .options(selectinload(Ticket.plan), selectinload(Ticket.user))
     )
-
-    if email:
-        query = query.filter(User.email.ilike(f"%{email}%"))
-
-    if plan_id:
-        query = query.filter(Ticket.plan_id == plan_id)
-
-    if status == "active":
-        query = query.filter(Ticket.is_active.is_(True))
-    elif status == "inactive":
-        query = query.filter(Ticket.is_active.is_(False))
-
-    if from_date:
-        query = query.filter(Ticket.valid_from >= from_date)
-
-    if to_date:
-        query = query.filter(Ticket.valid_from <= to_date)
-
-    return query.order_by(Ticket.created_at.desc()).all()
+    query = filters.apply(query)
+
+    return build_page(
+        db,
+        query,
+        keys=(Ticket.created_at, Ticket.id),
+        cursor=cursor,
+        limit=limit,
+    )
 
 @router.post("/tickets/assign")
 def assign_ticket(
@@ -290,14 +470,66 @@ def assign_ticket(
         valid_until=valid_until,
         remaining_entries=plan.max_entries,
         is_active=True,
+        created_at=now,
     )
 
     db.add(ticket)
+    record_ticket_sale(db, now, plan.price_cents)
+    publish(db, "tickets", data.user_id)
     db.commit()
 
     return {"status": "ticket assigned"}
 
 
+# 📦 Bulk assignment: one user lookup, one multi-row insert, per-row report
+@router.post("/tickets/assign-bulk", response_model=BulkAssignOut)
+def assign_tickets_bulk_endpoint(
+    data: AdminAssignTicketBulk,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    requested = len(data.user_ids) + len(data.emails)
+    if not requested:
+        raise HTTPException(400, "Provide user_ids or emails")
+    if requested > settings.TICKET_BULK_ASSIGN_MAX:
+        raise HTTPException(
+            400,
+            f"At most {settings.TICKET_BULK_ASSIGN_MAX} users per request",
+        )
+
+    plan = db.query(TicketPlan).filter(
+        TicketPlan.id == data.plan_id,
+        TicketPlan.is_active.is_(True),
+    ).first()
+
+    if not plan:
+        raise HTTPException(404, "Ticket plan not found")
+
+    center = db.query(Center).filter(
+        Center.id == data.center_id,
+        Center.is_active.is_(True),
+    ).first()
+
+    if not center:
+        raise HTTPException(404, "Center not found")
+
+    results = assign_tickets_bulk(
+        db,
+        plan,
+        center.id,
+        datetime.now(UTC),
+        user_ids=data.user_ids,
+        emails=data.emails,
+    )
+    assigned = sum(1 for r in results if r["status"] == "assigned")
+
+    if assigned:
+        publish(db, "tickets")
+    db.commit()
+
+    return {"assigned": assigned, "results": results}
+
+
 
 @router.patch("/tickets/{ticket_id}/deactivate")
 def deactivate_ticket(
@@ -314,23 +546,33 @@ def deactivate_ticket(
         raise HTTPException(404, "Active ticket not found")
 
     ticket.is_active = False
+    publish(db, "tickets", ticket.user_id)
     db.commit()
 
     return {"status": "ticket deactivated"}
 
 
 
-@router.get("/users/{user_id}/tickets", response_model=list[AdminTicketOut])
+@router.get("/users/{user_id}/tickets", response_model=Page[AdminTicketOut])
 def user_ticket_history(
     user_id: int,
+    cursor: str | None = None,
+    limit: int = Query(settings.ADMIN_PAGE_SIZE, ge=1, le=settings.ADMIN_PAGE_SIZE_MAX),
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
-    return (
+    query = (
         db.query(Ticket)
+        .options(selectinload(Ticket.plan), selectinload(Ticket.user))
         .filter(Ticket.user_id == user_id)
-        .order_by(Ticket.created_at.desc())
-        .all()
+    )
+
+    return build_page(
+        db,
+        query,
+        keys=(Ticket.created_at, Ticket.id),
+        cursor=cursor,
+        limit=limit,
     )
 
 
@@ -357,6 +599,7 @@ def update_user_role(
         raise HTTPException(404, "User not found")
 
     user.role = role
+    publish(db, "users", user_id)
     db.commit()
     return {"status": "updated"}
 
@@ -370,6 +613,7 @@ def deactivate_user(
 ):
     user = db.query(User).get(user_id)
     user.is_active = False
+    publish(db, "users", user_id)
     db.commit()
 
 
@@ -391,6 +635,7 @@ def update_ticket_entries(
     ticket.remaining_entries = remaining_entries
     ticket.is_active = remaining_entries > 0 or ticket.remaining_entries is None
 
+    publish(db, "tickets", ticket.user_id)
     db.commit()
     return {"status": "updated"}
 
@@ -413,6 +658,7 @@ def update_ticket_validity(
     ticket.valid_until = valid_until
     ticket.is_active = valid_until >= datetime.now(UTC)
 
+    publish(db, "tickets", ticket.user_id)
     db.commit()
     return {"status": "validity updated"}
 
@@ -434,6 +680,7 @@ def create_center(
 ):
     center = Center(name=data.name, is_active=True)
     db.add(center)
+    publish(db, "centers")
     db.commit()
     db.refresh(center)
     return center
@@ -451,6 +698,7 @@ def update_center(
         raise HTTPException(404, "Center not found")
 
     center.name = data.name
+    publish(db, "centers", center_id)
     db.commit()
     db.refresh(center)
     return center
@@ -467,6 +715,7 @@ def deactivate_center(
         raise HTTPException(404, "Center not found")
 
     center.is_active = False
+    publish(db, "centers", center_id)
     db.commit()
     return {"status": "deactivated"}
 
@@ -494,6 +743,7 @@ def create_class_type(
         is_active=True,
     )
     db.add(ct)
+    publish(db, "class_types")
     db.commit()
     db.refresh(ct)
     return ct
@@ -512,6 +762,7 @@ def update_class_type(
 
     ct.name = data.name
     ct.duration = data.duration
+    publish(db, "class_types", class_type_id)
     db.commit()
     db.refresh(ct)
     return ct
@@ -525,29 +776,119 @@ def deactivate_class_type(
 ):
     ct = db.query(ClassType).get(class_type_id)
     ct.is_active = False
+    publish(db, "class_types", class_type_id)
     db.commit()
     return {"status": "deactivated"}
 
 
 
 
+# 📥 Webhook inbox: inspect and requeue dead-lettered events
+@router.get("/webhook-events", response_model=Page[WebhookEventOut])
+def list_webhook_events(
+    status: Literal["pending", "processed", "dead"] | None = None,
+    cursor: str | None = None,
+    limit: int = Query(settings.ADMIN_PAGE_SIZE, ge=1, le=settings.ADMIN_PAGE_SIZE_MAX),
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    query = db.query(WebhookEvent)
+    if status is not None:
+        query = query.filter(WebhookEvent.status == status)
+
+    return build_page(
+        db,
+        query,
+        keys=(WebhookEvent.received_at, WebhookEvent.id),
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+@router.post("/webhook-events/{event_id}/retry", response_model=WebhookEventOut)
+def retry_webhook_event(
+    event_id: int,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    event = db.get(WebhookEvent, event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Webhook event not found")
+
+    if event.status != "dead":
+        raise HTTPException(status_code=400, detail="Only dead events can be retried")
+
+    event.status = "pending"
+    event.attempts = 0
+    event.next_attempt_at = datetime.now(UTC)
+    db.commit()
+    db.refresh(event)
+
+    return event
+
+
+@router.get("/metrics")
+def admin_metrics(
+    admin=Depends(require_admin),
+):
+    return {
+        "schedule_cache": schedule_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "prompt_cache": prompt_cache.stats(),
+        "explanation_cache": {
+            **explanation_cache.stats(),
+            "single_flight": explanation_flights.stats(),
+        },
+        "password_hasher": password_hasher.stats(),
+        "refresh_token_purge": last_purge,
+        "payment_gateway": get_payment_gateway().stats(),
+        "ai_chat": get_chat_model().stats(),
+    }
+
+
+@router.get("/export/{entity}")
+def export_entity(
+    entity: Literal["bookings", "tickets", "orders", "users"],
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    gzip: bool = False,
+    booking_filters: BookingFilters = Depends(),
+    ticket_filters: TicketFilters = Depends(),
+    order_filters: OrderFilters = Depends(),
+    user_filters: UserFilters = Depends(),
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    # 📤 Streamed through a server-side cursor – memory stays flat
+    query = {
+        "bookings": lambda: bookings_query(db, booking_filters),
+        "tickets": lambda: tickets_query(db, ticket_filters),
+        "orders": lambda: orders_query(db, order_filters),
+        "users": lambda: users_query(db, user_filters),
+    }[entity]()
+
+    body = stream_rows(query, fmt)
+    headers = {"Content-Disposition": f'attachment; filename="{entity}.{fmt}"'}
+
+    if gzip:
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=EXPORT_FORMATS[fmt], headers=headers)
+
+
 @router.get("/stats")
 def admin_stats(
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
+    # 📊 Reads the daily rollups (app/services/stats_rollups.py) – cost does
+    #    not grow with the size of users / bookings / tickets
     now = datetime.now(UTC)
-    start_month = now.replace(day=1)
-
-    total_users = db.query(func.count(User.id)).scalar()
+    start_month = now.replace(day=1).date()
 
     users_by_day_raw = (
-        db.query(
-            func.date(User.created_at).label("day"),
-            func.count(User.id).label("count"),
-        )
-        .group_by(func.date(User.created_at))
-        .order_by("day")
+        db.query(StatsSignupsDaily.day, StatsSignupsDaily.signups)
+        .order_by(StatsSignupsDaily.day)
         .all()
     )
 
@@ -556,6 +897,9 @@ def admin_stats(
         for day, count in users_by_day_raw
     ]
 
+    total_users = sum(count for _, count in users_by_day_raw)
+
+    # live count, but only over active tickets (partial index)
     active_tickets = (
         db.query(func.count(Ticket.id))
         .filter(
@@ -565,47 +909,30 @@ def admin_stats(
         .scalar()
     )
 
-    total_bookings = (
-        db.query(func.count(Booking.id))
-        .filter(Booking.status == "active")
-        .scalar()
-    )
+    weekday = func.extract("dow", StatsBookingsHourly.day)
+    active_sum = func.sum(StatsBookingsHourly.active_bookings)
 
     bookings_by_weekday_raw = (
         db.query(
-            func.extract("dow", TrainingSession.start_time).label("weekday"),
-            func.count(Booking.id).label("count"),
+            weekday.label("weekday"),
+            active_sum.label("count"),
         )
-        .select_from(Booking)
-        .join(TrainingSession, Booking.session_id == TrainingSession.id)
-        .filter(Booking.status == "active")
-        .group_by("weekday")
-        .order_by("weekday")
+        .group_by(weekday)
+        .having(active_sum > 0)
+        .order_by(weekday)
         .all()
     )
 
     bookings_by_weekday = [
-        {"weekday": int(weekday), "count": count}
+        {"weekday": int(weekday), "count": int(count)}
         for weekday, count in bookings_by_weekday_raw
     ]
 
-    revenue_this_month = (
-        db.query(func.coalesce(func.sum(TicketPlan.price_cents), 0))
-        .select_from(Ticket)
-        .join(TicketPlan, Ticket.plan_id == TicketPlan.id)
-        .filter(Ticket.created_at >= start_month)
-        .scalar()
-    )
+    total_bookings = sum(item["count"] for item in bookings_by_weekday)
 
     revenue_by_day_raw = (
-        db.query(
-            func.date(Ticket.created_at).label("day"),
-            func.sum(TicketPlan.price_cents).label("revenue"),
-        )
-        .select_from(Ticket)
-        .join(TicketPlan, Ticket.plan_id == TicketPlan.id)
-        .group_by(func.date(Ticket.created_at))
-        .order_by("day")
+        db.query(StatsRevenueDaily.day, StatsRevenueDaily.revenue_cents)
+        .order_by(StatsRevenueDaily.day)
         .all()
     )
 
@@ -614,22 +941,28 @@ def admin_stats(
         for day, revenue in revenue_by_day_raw
     ]
 
+    revenue_this_month = sum(
+        revenue for day, revenue in revenue_by_day_raw if day >= start_month
+    )
+
+    total_sum = func.sum(StatsBookingsHourly.total_bookings)
+
     popular_classes_raw = (
         db.query(
             ClassType.name,
-            func.count(Booking.id).label("count"),
+            total_sum.label("count"),
         )
-        .select_from(Booking)
-        .join(TrainingSession, Booking.session_id == TrainingSession.id)
-        .join(ClassType, TrainingSession.class_type_id == ClassType.id)
+        .select_from(StatsBookingsHourly)
+        .join(ClassType, StatsBookingsHourly.class_type_id == ClassType.id)
         .group_by(ClassType.name)
-        .order_by(func.count(Booking.id).desc())
+        .having(total_sum > 0)
+        .order_by(total_sum.desc())
         .limit(5)
         .all()
     )
 
     popular_classes = [
-        {"name": name, "count": count}
+        {"name": name, "count": int(count)}
         for name, count in popular_classes_raw
     ]
 
@@ -644,4 +977,14 @@ def admin_stats(
         "revenue_by_day": revenue_by_day,
         "bookings_by_weekday": bookings_by_weekday,
         "popular_classes": popular_classes,
-    }
\ No newline at end of file
+    }
+
+
+@router.post("/stats/rebuild")
+def rebuild_stats(
+    since: date | None = None,
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    # 🔁 Full (or from `since`) recompute of the dashboard rollups
+    return rebuild_rollups(db, since=since)
\ No newline at end of file
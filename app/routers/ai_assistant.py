@@ -1,16 +1,19 @@
 from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from app.core.chat_model import SSEResponse, get_chat_model
+from app.core.config import settings
 from app.core.limiter import limiter
 from app.db import get_db
-from app.models.session import Session as TrainingSession
 from app.models.ticket_plan import TicketPlan
-from app.models.user import User
+from app.services.principal_cache import Principal
 from app.core.dependencies import get_current_user
 from app.schemas.ai_assistant import AssistantRequest, AiChatRequest
-from app.ai.logic import recommend_sessions
+from app.ai.logic import index_slots, recommend_sessions
 from app.ai.ticket_logic import recommend_ticket
-from app.services.ai_chat import chat_with_ai
+from app.services.ai_chat import chat_with_ai, load_system_prompt, stream_chat
+from app.services.schedule_service import WEEKDAYS_SI, get_weekly_schedule
 from app.services.ai_fitness_assistant import (
     explain_recommendation,
     explain_recommendation_test,
@@ -18,16 +21,6 @@ from app.services.ai_fitness_assistant import (
 
 router = APIRouter(prefix="/api/v1/ai", tags=["AI Assistant"])
 
-WEEKDAYS_SI = [
-    "Ponedeljek",
-    "Torek",
-    "Sreda",
-    "Četrtek",
-    "Petek",
-    "Sobota",
-    "Nedelja",
-]
-
 
 @router.post("/recommend")
 @limiter.limit("5/minute")
@@ -35,19 +28,18 @@ def ai_recommendation(
     request: Request,
     data: AssistantRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
-    # 1️⃣ Load sessions (ignore capacity & dates)
-    query = db.query(TrainingSession).filter(
-        TrainingSession.is_active.is_(True)
-    )
-
-    if data.preferred_center_id:
-        query = query.filter(
-            TrainingSession.center_id == data.preferred_center_id
+    # 1️⃣ Weekly template: distinct (weekday, time, class) slots from one
+    #    grouped query over a bounded window (ignore capacity & dates)
+    slots = index_slots(
+        get_weekly_schedule(
+            db,
+            data.preferred_center_id,
+            days_back=settings.AI_SCHEDULE_WINDOW_DAYS,
+            days_ahead=settings.AI_SCHEDULE_WINDOW_DAYS,
         )
-
-    sessions = query.all()
+    )
 
     plans = (
         db.query(TicketPlan)
@@ -59,7 +51,7 @@ def ai_recommendation(
     recommended_sessions = recommend_sessions(
         goal=data.goal,
         days_per_week=data.days_per_week,
-        sessions=sessions,
+        slots=slots,
     )
 
     ticket = recommend_ticket(
@@ -70,8 +62,8 @@ def ai_recommendation(
     # 3️⃣ Serialize weekly plan (NO dates)
     session_payload = [
         {
-            "day": WEEKDAYS_SI[s.start_time.weekday()],
-            "class": s.class_type.name,
+            "day": WEEKDAYS_SI[s.weekday],
+            "class": s.class_name,
             "time": s.start_time.strftime("%H:%M"),
         }
         for s in recommended_sessions
@@ -102,6 +94,7 @@ def ai_recommendation(
 
     # 5️⃣ AI explanation (soft layer)
     ai_explanation = explain_recommendation(
+        db,
         goal=data.goal,
         days_per_week=data.days_per_week,
         experience_level=data.experience_level,
@@ -125,12 +118,26 @@ def ai_test():
 
 @router.post("/chat")
 @limiter.limit("10/minute")
-def ai_chat(
+async def ai_chat(
     request: Request,
     data: AiChatRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     messages = [m.model_dump() for m in data.messages]
-    reply = chat_with_ai(db, messages)
-    return {"reply": reply}
\ No newline at end of file
+
+    if not data.stream:
+        reply = await run_in_threadpool(chat_with_ai, db, messages, data.center_id)
+        return {"reply": reply}
+
+    # 📡 SSE: tokens are forwarded as the model produces them; the
+    #    generation holds neither a worker thread nor a DB connection
+    system_prompt = await run_in_threadpool(load_system_prompt, db, data.center_id)
+
+    model = get_chat_model()
+    await model.limiter.acquire()  # ChatModelBusy → 503 before the stream starts
+
+    return SSEResponse(
+        stream_chat(model, system_prompt, messages),
+        on_close=model.limiter.release,
+    )
@@ -9,15 +9,16 @@ from sqlalchemy.orm import Session
 from app.core.dependencies import require_admin
 from app.core.limiter import limiter
 from app.models.refresh_token import RefreshToken
-from app.core.security import create_refresh_token, refresh_token_expires
+from app.core.security import create_refresh_token, hash_refresh_token, refresh_token_expires
 from app.core.config import settings
 from app.core.security import oauth2_scheme
 from app.db import get_db
 from app.schemas.token import TokenPayload, RefreshTokenRequest
 from app.models.user import User
 from app.schemas.user import UserCreate, UserOut
-from app.core.security import get_password_hash
-from app.core.security import verify_password, create_access_token
+from app.core.password_hashing import password_hasher
+from app.services.stats_rollups import record_signup
+from app.core.security import create_access_token
 from app.db import get_db
 from app.models.user import User
 from app.schemas.token import Token
@@ -34,15 +35,20 @@ def login(
 ):
     user = db.query(User).filter(User.email == form_data.username).first()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # 🔐 bcrypt on the bounded hashing pool (503 when saturated)
+    if not user or not password_hasher.verify(form_data.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Incorrect email or password")
 
-    access_token = create_access_token(subject=user.email,role=user.role)
+    access_token = create_access_token(
+        subject=user.email,
+        role=user.role,
+        user_id=user.id,
+    )
 
     refresh_token_value = create_refresh_token()
 
     refresh_token = RefreshToken(
-        token=refresh_token_value,
+        token_hash=hash_refresh_token(refresh_token_value),
         user_id=user.id,
         expires_at=refresh_token_expires(),
     )
@@ -74,11 +80,13 @@ def register(
 
     user = User(
         email=data.email,
-        hashed_password=get_password_hash(data.password),
+        hashed_password=password_hasher.hash(data.password),
         role="user",
     )
 
     db.add(user)
+    db.flush()
+    record_signup(db, user.created_at)
     db.commit()
     db.refresh(user)
 
@@ -95,7 +103,7 @@ def refresh_access_token(
     token_db = (
         db.query(RefreshToken)
         .filter(
-            RefreshToken.token == data.refresh_token,
+            RefreshToken.token_hash == hash_refresh_token(data.refresh_token),
         )
         .first()
     )
@@ -119,7 +127,7 @@ def refresh_access_token(
     # 2) create new refresh token for same user
     new_refresh_value = create_refresh_token()
     new_refresh = RefreshToken(
-        token=new_refresh_value,
+        token_hash=hash_refresh_token(new_refresh_value),
         user_id=token_db.user_id,
         expires_at=refresh_token_expires(),
         is_revoked=False,
@@ -130,6 +138,7 @@ def refresh_access_token(
     access_token = create_access_token(
         subject=token_db.user.email,
         role=token_db.user.role,
+        user_id=token_db.user_id,
     )
     db.commit()
 
@@ -145,7 +154,7 @@ def logout(
     db: Session = Depends(get_db),
 ):
     token_db = db.query(RefreshToken).filter(
-        RefreshToken.token == data.refresh_token
+        RefreshToken.token_hash == hash_refresh_token(data.refresh_token)
     ).first()
 
     if token_db:
@@ -1,18 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.orm import Session as DBSession, joinedload
 from sqlalchemy.exc import IntegrityError
 from fastapi import Request
 from app.db import get_db
 from app.core.limiter import limiter
 from app.models.booking import Booking
+from app.models.class_type import ClassType
 from app.models.session import Session
 from app.models.ticket import Ticket
-from app.models.user import User
+from app.services.principal_cache import Principal
 from app.schemas.booking import BookingOut
 from app.core.dependencies import get_current_user, require_active_ticket_for_session
 
-from app.core.email_resend import send_email
 from app.core.email import render_template
+from app.core.invalidation import publish
+from app.services.booking_service import claim_seat, consume_entry, lock_active_session
+from app.services.email_outbox import enqueue_email
+from app.services.stats_rollups import record_bookings
 
 
 router = APIRouter(
@@ -30,13 +34,13 @@ def create_booking(
     request: Request,
     session_id: int,
     db: DBSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
-    # 🔒 Lock session
+    # 🔍 Validate (no locks taken yet)
     session = (
         db.query(Session)
+        .options(joinedload(Session.class_type).joinedload(ClassType.center))
         .filter(Session.id == session_id, Session.is_active.is_(True))
-        .with_for_update()
         .first()
     )
 
@@ -50,14 +54,21 @@ def create_booking(
         db=db,
     )
 
-    # ⏳ WAITING LIST
-    if session.booked_count >= session.capacity:
+    # 💺 Claim a seat in ONE conditional UPDATE – the session row is locked
+    #    only from here to the commit below
+    if not claim_seat(db, session_id):
+        # 🔒 full – or cancelled since the validation above
+        if not lock_active_session(db, session_id):
+            raise HTTPException(status_code=404, detail="Session not available")
+
+        # ⏳ WAITING LIST
         booking = Booking(
             user_id=current_user.id,
             session_id=session_id,
             status="waiting",
         )
         db.add(booking)
+        record_bookings(db, session_id, total=1)
         db.commit()
         db.refresh(booking)
         return booking
@@ -68,42 +79,36 @@ def create_booking(
         session_id=session_id,
         status="active",
     )
-
     db.add(booking)
-    session.booked_count += 1
-
-    # 🎟️ Consume entry (only limited tickets)
-    if ticket.remaining_entries is not None:
-        ticket.remaining_entries -= 1
-        if ticket.remaining_entries <= 0:
-            ticket.is_active = False
 
     try:
         db.flush()
     except IntegrityError:
         raise HTTPException(status_code=400, detail="Already booked")
 
-    db.commit()
-    db.refresh(booking)
-
-    # 📧 EMAIL — NEVER BREAK FLOW
-    try:
-        html = render_template(
+    # 🎟️ Consume entry (only limited tickets)
+    if ticket.remaining_entries is not None and not consume_entry(db, ticket.id):
+        raise HTTPException(status_code=403, detail="Active ticket required")
+
+    # 📧 EMAIL → outbox, committed together with the booking
+    enqueue_email(
+        db,
+        to_email=current_user.email,
+        subject="Booking confirmed ✅",
+        html_body=render_template(
             "booking_confirmation.html",
             email=current_user.email,
             class_name=session.class_type.name,
             date=session.start_time.strftime("%d.%m.%Y"),
             time=session.start_time.strftime("%H:%M"),
             center_name=session.class_type.center.name,
-        )
+        ),
+    )
 
-        send_email(
-            to_email=current_user.email,
-            subject="Booking confirmed ✅",
-            html_body=html,
-        )
-    except Exception as e:
-        print("Booking email failed:", e)
+    record_bookings(db, session_id, active=1, total=1)
+    publish(db, "bookings", session_id)
+    db.commit()
+    db.refresh(booking)
 
     return booking
 
@@ -117,31 +122,40 @@ def cancel_booking(
     request: Request,
     booking_id: int,
     db: DBSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
+    # 🔒 Lock order: session first, then its bookings (as cancel_sessions)
+    session_id = (
+        db.query(Booking.session_id)
+        .filter(
+            Booking.id == booking_id,
+            Booking.user_id == current_user.id,
+        )
+        .scalar()
+    )
+
+    session = (
+        db.query(Session)
+        .filter(Session.id == session_id)
+        .with_for_update()
+        .first()
+    )
+
     booking = (
         db.query(Booking)
         .filter(
             Booking.id == booking_id,
-            Booking.user_id == current_user.id,
             Booking.status.in_(["active", "waiting"]),
         )
         .with_for_update()
         .first()
     )
 
-    if not booking:
+    if not session or not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
 
     was_active = booking.status == "active"
 
-    session = (
-        db.query(Session)
-        .filter(Session.id == booking.session_id)
-        .with_for_update()
-        .first()
-    )
-
     ticket = (
         db.query(Ticket)
         .filter(
@@ -180,17 +194,18 @@ def cancel_booking(
             next_waiting.status = "active"
             session.booked_count += 1
 
-    db.commit()
+        record_bookings(db, session.id, active=0 if next_waiting else -1)
+        publish(db, "bookings", session.id)
 
-    # 📧 EMAIL (OPTIONAL)
-    try:
-        send_email(
-            to_email=current_user.email,
-            subject="Booking cancelled ❌",
-            html_body="<p>Your booking was successfully cancelled.</p>",
-        )
-    except Exception as e:
-        print("Cancel email failed:", e)
+    # 📧 EMAIL → outbox
+    enqueue_email(
+        db,
+        to_email=current_user.email,
+        subject="Booking cancelled ❌",
+        html_body="<p>Your booking was successfully cancelled.</p>",
+    )
+
+    db.commit()
 
     return {"status": "cancelled"}
 
@@ -201,7 +216,7 @@ def cancel_booking(
 @router.get("/me", response_model=list[BookingOut])
 def my_bookings(
     db: DBSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     return (
         db.query(Booking)
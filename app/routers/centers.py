@@ -1,8 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from starlette import status
 
 from app.db import get_db
+from app.core.config import settings
+from app.core.http_cache import (
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    set_cache_headers,
+)
+from app.core.invalidation import publish
 from app.models.center import Center
 from app.schemas.center import CenterCreate, CenterOut
 from app.core.dependencies import require_admin
@@ -21,6 +29,7 @@ def create_center(
 ):
     center = Center(**data.dict())
     db.add(center)
+    publish(db, "centers")
     db.commit()
     db.refresh(center)
     return center
@@ -28,6 +37,13 @@ def create_center(
 
 @router.get("/", response_model=list[CenterOut])
 def list_centers(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
+    etag = make_etag(request, "centers")
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, max_age=settings.CATALOG_HTTP_MAX_AGE)
+
+    set_cache_headers(response, etag, max_age=settings.CATALOG_HTTP_MAX_AGE)
     return db.query(Center).filter(Center.is_active == True).all()
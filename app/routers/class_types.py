@@ -1,7 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.db import get_db
+from app.core.config import settings
+from app.core.http_cache import (
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    set_cache_headers,
+)
+from app.core.invalidation import publish
 from app.models.class_type import ClassType
 from app.models.center import Center
 from app.schemas.class_type import ClassTypeCreate, ClassTypeOut
@@ -25,6 +33,7 @@ def create_class_type(
 
     class_type = ClassType(**data.dict())
     db.add(class_type)
+    publish(db, "class_types")
     db.commit()
     db.refresh(class_type)
     return class_type
@@ -32,9 +41,17 @@ def create_class_type(
 
 @router.get("/", response_model=list[ClassTypeOut])
 def list_class_types(
+    request: Request,
+    response: Response,
     center_id: int | None = None,
     db: Session = Depends(get_db),
 ):
+    etag = make_etag(request, "class_types")
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, max_age=settings.CATALOG_HTTP_MAX_AGE)
+
+    set_cache_headers(response, etag, max_age=settings.CATALOG_HTTP_MAX_AGE)
+
     query = db.query(ClassType)
     if center_id:
         query = query.filter(ClassType.center_id == center_id)
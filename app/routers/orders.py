@@ -1,17 +1,16 @@
-import stripe
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.db import get_db
 from app.core.config import settings
 from app.core.dependencies import get_current_user
+from app.core.payment_gateway import get_payment_gateway
 from app.models.order import Order
 from app.models.ticket_plan import TicketPlan
 
-# 🔑 STRIPE KEY
-stripe.api_key = settings.STRIPE_SECRET_KEY
-
 router = APIRouter(
     prefix="/api/v1/orders",
     tags=["orders"],
@@ -23,16 +22,11 @@ class CheckoutRequest(BaseModel):
     plan_id: int
 
 
-@router.post("/checkout")
-def create_checkout(
-    data: CheckoutRequest,
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
-):
+def _create_order(db: Session, user_id: int, plan_id: int) -> dict:
     plan = (
         db.query(TicketPlan)
         .filter(
-            TicketPlan.id == data.plan_id,
+            TicketPlan.id == plan_id,
             TicketPlan.is_active.is_(True),
         )
         .first()
@@ -43,7 +37,7 @@ def create_checkout(
 
     # 🧾 CREATE ORDER
     order = Order(
-        user_id=user.id,
+        user_id=user_id,
         ticket_plan_id=plan.id,
         price_cents=plan.price_cents,
         currency="EUR",
@@ -51,31 +45,57 @@ def create_checkout(
     )
     db.add(order)
     db.commit()
-    db.refresh(order)
-
-    # 💳 STRIPE CHECKOUT
-    session = stripe.checkout.Session.create(
-        mode="payment",
-        payment_method_types=["card"],
-        line_items=[
-            {
-                "price_data": {
-                    "currency": "eur",
-                    "product_data": {"name": plan.name},
-                    "unit_amount": plan.price_cents,
-                },
-                "quantity": 1,
-            }
-        ],
-        success_url=(
-            f"{settings.FRONTEND_URL}/"
-            f"{settings.DEFAULT_LOCALE}/success?order_id={order.id}"
-        ),
-        cancel_url=(
-            f"{settings.FRONTEND_URL}/"
-            f"{settings.DEFAULT_LOCALE}/cart"
-        ),
-        metadata={"order_id": str(order.id)},
+
+    checkout = {
+        "order_id": order.id,
+        "product_name": plan.name,
+        "amount_cents": plan.price_cents,
+        "currency": order.currency,
+    }
+
+    # 🔌 Give the connection back to the pool before the Stripe round trip;
+    #    the session reconnects lazily if it is needed again
+    db.close()
+    return checkout
+
+
+def _mark_order_failed(db: Session, order_id: int) -> None:
+    db.execute(
+        update(Order)
+        .where(Order.id == order_id, Order.status == "pending")
+        .values(status="failed")
     )
+    db.commit()
+
+
+@router.post("/checkout")
+async def create_checkout(
+    data: CheckoutRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    # DB work stays on the threadpool; the provider call is awaited on the
+    # event loop and holds neither a worker thread nor a connection
+    checkout = await run_in_threadpool(_create_order, db, user.id, data.plan_id)
+    order_id = checkout["order_id"]
+
+    # 💳 CHECKOUT (pooled client, timeouts, retries, circuit breaker)
+    try:
+        session = await get_payment_gateway().create_checkout_session(
+            **checkout,
+            success_url=(
+                f"{settings.FRONTEND_URL}/"
+                f"{settings.DEFAULT_LOCALE}/success?order_id={order_id}"
+            ),
+            cancel_url=(
+                f"{settings.FRONTEND_URL}/"
+                f"{settings.DEFAULT_LOCALE}/cart"
+            ),
+        )
+    except Exception:
+        # unavailable (→ 503), rejected by the provider or a bug (→ 500):
+        # either way no checkout session exists for this order
+        await run_in_threadpool(_mark_order_failed, db, order_id)
+        raise
 
-    return {"url": session.url}
\ No newline at end of file
+    return {"url": session.url}
@@ -1,42 +1,54 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session as DBSession, joinedload
-from sqlalchemy import func
-from datetime import date, datetime, timedelta, UTC
+from datetime import date, datetime, timedelta
 
 from app.db import get_db
+from app.core.config import settings
+from app.core.http_cache import (
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    set_cache_headers,
+)
+from app.models.class_type import ClassType
 from app.models.session import Session
-from app.models.booking import Booking
-from app.schemas.session import SessionOut
+from app.schemas.session import SessionOut, SessionRangeOut
+from app.services.schedule_cache import schedule_cache
 
 router = APIRouter(
     prefix="/api/v1/sessions",
     tags=["sessions"],
 )
 
+MAX_RANGE_DAYS = 31
+
 
 @router.get("/", response_model=list[SessionOut])
 def list_sessions(
+    request: Request,
+    response: Response,
     center_id: int | None = None,
     day: date | None = None,
     db: DBSession = Depends(get_db),
 ):
-    # 🔹 subquery za booked_count
-    booked_count_subq = (
-        db.query(
-            Booking.session_id,
-            func.count(Booking.id).label("booked_count"),
-        )
-        .filter(Booking.status == "active")
-        .group_by(Booking.session_id)
-        .subquery()
-    )
+    etag = make_etag(request, "sessions", "bookings", "class_types")
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, max_age=settings.SCHEDULE_HTTP_MAX_AGE)
 
+    set_cache_headers(response, etag, max_age=settings.SCHEDULE_HTTP_MAX_AGE)
+
+    cache_key = (center_id or None, day)
+    cached = schedule_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # version BEFORE the query → a concurrent write makes set() a no-op
+    version = schedule_cache.version
+
+    # 🔹 booked_count je denormaliziran na Session (vzdržuje ga bookings router),
+    #    class_type pa naložimo z JOIN-om → en sam SELECT
     query = (
         db.query(Session)
-        .outerjoin(
-            booked_count_subq,
-            Session.id == booked_count_subq.c.session_id,
-        )
         .options(joinedload(Session.class_type))
         .filter(Session.is_active.is_(True))
     )
@@ -52,17 +64,108 @@ def list_sessions(
             Session.start_time < end,
         )
 
-    sessions = query.order_by(Session.start_time).all()
-
-    # 🔹 ročno pripnemo booked_count (ker je subquery)
-    for s in sessions:
-        s.booked_count = (
-            db.query(func.count(Booking.id))
-            .filter(
-                Booking.session_id == s.id,
-                Booking.status == "active",
-            )
-            .scalar()
+    sessions = [
+        SessionOut.model_validate(s).model_dump()
+        for s in query.order_by(Session.start_time).all()
+    ]
+
+    schedule_cache.set(cache_key, sessions, version=version)
+    return sessions
+
+
+@router.get("/range", response_model=SessionRangeOut)
+def list_sessions_range(
+    request: Request,
+    response: Response,
+    from_: date = Query(..., alias="from"),
+    to: date = Query(...),
+    center_id: int | None = None,
+    db: DBSession = Depends(get_db),
+):
+    """
+    Whole week (or any range up to MAX_RANGE_DAYS, both ends inclusive) in one
+    round trip. Class types are sent once in a dictionary, sessions as parallel
+    arrays referencing them by class_type_id.
+    """
+    if to < from_:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+
+    if (to - from_).days >= MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range cannot be longer than {MAX_RANGE_DAYS} days",
+        )
+
+    etag = make_etag(request, "sessions", "bookings", "class_types")
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, max_age=settings.SCHEDULE_HTTP_MAX_AGE)
+
+    set_cache_headers(response, etag, max_age=settings.SCHEDULE_HTTP_MAX_AGE)
+
+    cache_key = ("range", center_id or None, from_, to)
+    cached = schedule_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    version = schedule_cache.version
+
+    start = datetime.combine(from_, datetime.min.time())
+    end = datetime.combine(to, datetime.min.time()) + timedelta(days=1)
+
+    # 🔹 projection (no ORM objects) – sessions + their class type in one SELECT
+    query = (
+        db.query(
+            Session.id,
+            Session.center_id,
+            Session.class_type_id,
+            Session.start_time,
+            Session.end_time,
+            Session.capacity,
+            Session.booked_count,
+            ClassType.name,
+            ClassType.description,
+            ClassType.center_id.label("class_type_center_id"),
+            ClassType.duration,
+        )
+        .join(ClassType, Session.class_type_id == ClassType.id)
+        .filter(
+            Session.is_active.is_(True),
+            Session.start_time >= start,
+            Session.start_time < end,
         )
+    )
+
+    if center_id:
+        query = query.filter(Session.center_id == center_id)
+
+    class_types = {}
+    columns = {
+        "id": [],
+        "center_id": [],
+        "class_type_id": [],
+        "start_time": [],
+        "end_time": [],
+        "capacity": [],
+        "booked_count": [],
+    }
+
+    for row in query.order_by(Session.start_time, Session.id):
+        for name, values in columns.items():
+            values.append(getattr(row, name))
+
+        if row.class_type_id not in class_types:
+            class_types[row.class_type_id] = {
+                "id": row.class_type_id,
+                "name": row.name,
+                "description": row.description,
+                "center_id": row.class_type_center_id,
+                "duration": row.duration,
+            }
+
+    payload = SessionRangeOut(
+        class_types=class_types,
+        sessions=columns,
+    ).model_dump()
 
-    return sessions
\ No newline at end of file
+    schedule_cache.set(cache_key, payload, version=version)
+    return payload
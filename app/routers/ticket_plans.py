@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app.db import get_db
+from app.core.config import settings
+from app.core.http_cache import (
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    set_cache_headers,
+)
 from app.models.ticket_plan import TicketPlan
 from app.schemas.ticket_plan import TicketPlanOut
 
@@ -12,7 +19,16 @@ router = APIRouter(
 
 
 @router.get("/", response_model=list[TicketPlanOut])
-def list_ticket_plans(db: Session = Depends(get_db)):
+def list_ticket_plans(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    etag = make_etag(request, "ticket_plans")
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, max_age=settings.CATALOG_HTTP_MAX_AGE)
+
+    set_cache_headers(response, etag, max_age=settings.CATALOG_HTTP_MAX_AGE)
     return (
         db.query(TicketPlan)
         .filter(TicketPlan.is_active == True)
@@ -6,7 +6,7 @@ from app.db import get_db
 from app.models.ticket import Ticket
 from app.schemas.ticket import TicketOut
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.services.principal_cache import Principal
 
 router = APIRouter(
     prefix="/api/v1/tickets",
@@ -17,7 +17,7 @@ router = APIRouter(
 def get_active_ticket(
     center_id: int = Query(...),
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     now = datetime.now(UTC)
 
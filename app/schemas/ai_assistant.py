@@ -17,4 +17,7 @@ class AiChatMessage(BaseModel):
 
 
 class AiChatRequest(BaseModel):
-    messages: List[AiChatMessage]
\ No newline at end of file
+    messages: List[AiChatMessage]
+    center_id: Optional[int] = None
+    # True: answer as server-sent events (token deltas) instead of JSON
+    stream: bool = False
\ No newline at end of file
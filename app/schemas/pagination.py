@@ -0,0 +1,13 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    # pass as ?cursor= to get the next page; None on the last page
+    next_cursor: str | None = None
+    # planner estimate of all matching rows, first page only
+    total_estimate: int | None = None
@@ -1,10 +1,22 @@
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date, datetime
 from app.schemas.class_type import ClassTypeOut
 
 class SessionCapacityUpdate(BaseModel):
     capacity: int = Field(gt=0)
 
+class SessionCancelBulk(BaseModel):
+    date_from: date
+    date_to: date | None = None  # inclusive, defaults to date_from
+    center_id: int | None = None  # None = every center
+
+
+class SessionCancelOut(BaseModel):
+    sessions_cancelled: int
+    bookings_cancelled: int
+    entries_refunded: int
+    notifications: int
+
 class SessionBase(BaseModel):
     class_type_id: int
     start_time: datetime
@@ -27,9 +39,25 @@ class SessionOut(BaseModel):
     capacity: int
     booked_count: int
     is_active: bool
+    template_id: int | None = None
 
     class_type: ClassTypeOut
 
     class Config:
         from_attributes = True
 
+
+class SessionColumns(BaseModel):
+    """Parallel arrays: the i-th element of every list describes one session."""
+    id: list[int]
+    center_id: list[int]
+    class_type_id: list[int]
+    start_time: list[datetime]
+    end_time: list[datetime]
+    capacity: list[int]
+    booked_count: list[int]
+
+
+class SessionRangeOut(BaseModel):
+    class_types: dict[int, ClassTypeOut]
+    sessions: SessionColumns
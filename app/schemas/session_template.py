@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from datetime import date, time
+
+
+class SessionTemplateCreate(BaseModel):
+    center_id: int
+    class_type_id: int
+    weekday: int = Field(ge=0, le=6)  # 0 = Monday
+    start_time: time  # wall-clock time in SCHEDULE_TIMEZONE
+    capacity: int = Field(default=10, gt=0)
+    valid_from: date
+    valid_until: date | None = None
+
+
+class SessionTemplateOut(SessionTemplateCreate):
+    id: int
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+
+
+class SessionGenerateRequest(BaseModel):
+    date_from: date
+    date_to: date
+    center_id: int | None = None
+    template_ids: list[int] | None = None
+
+
+class SessionGenerateOut(BaseModel):
+    created: int
+    session_ids: list[int]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 from pydantic import BaseModel
 from app.schemas.ticket_plan import TicketPlanOut
 from app.schemas.user import AdminUserOut
@@ -32,4 +33,23 @@ class AdminTicketOut(BaseModel):
 class AdminAssignTicket(BaseModel):
     user_id: int
     center_id: int
-    plan_id: int
\ No newline at end of file
+    plan_id: int
+
+
+class AdminAssignTicketBulk(BaseModel):
+    center_id: int
+    plan_id: int
+    user_ids: list[int] = []
+    emails: list[str] = []
+
+
+class BulkAssignResult(BaseModel):
+    ref: int | str  # the user id or email as sent
+    user_id: int | None = None
+    status: Literal["assigned", "not_found", "inactive", "duplicate"]
+    ticket_id: int | None = None
+
+
+class BulkAssignOut(BaseModel):
+    assigned: int
+    results: list[BulkAssignResult]
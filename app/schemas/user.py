@@ -25,4 +25,8 @@ class AdminUserOut(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class MemberSearchResult(AdminUserOut):
+    score: float
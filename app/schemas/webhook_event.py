@@ -0,0 +1,19 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class WebhookEventOut(BaseModel):
+    id: int
+    provider: str
+    event_id: str
+    event_type: str
+    status: str
+    outcome: str | None
+    attempts: int
+    next_attempt_at: datetime
+    last_error: str | None
+    received_at: datetime
+    processed_at: datetime | None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,159 @@
+# app/services/admin_export.py
+"""
+Streaming admin exports (CSV / NDJSON, optionally gzip-compressed).
+
+Rows are flat column projections read through a server-side cursor
+(`yield_per`), formatted and sent chunk by chunk, so memory use depends on
+EXPORT_BATCH_SIZE and not on the number of rows exported.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Iterable, Iterator
+
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+from app.models.booking import Booking
+from app.models.class_type import ClassType
+from app.models.order import Order
+from app.models.session import Session as TrainingSession
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+from app.services.admin_filters import (
+    BookingFilters,
+    OrderFilters,
+    TicketFilters,
+    UserFilters,
+)
+
+EXPORT_ENTITIES = ("bookings", "tickets", "orders", "users")
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+# -------------------------------------------------
+# Queries (column projections, stable order)
+# -------------------------------------------------
+def bookings_query(db: Session, filters: BookingFilters) -> Query:
+    query = (
+        db.query(
+            Booking.id,
+            Booking.status,
+            Booking.created_at,
+            Booking.user_id,
+            User.email.label("user_email"),
+            Booking.session_id,
+            TrainingSession.center_id,
+            TrainingSession.start_time.label("session_start_time"),
+            ClassType.name.label("class_name"),
+        )
+        .select_from(Booking)
+        .join(TrainingSession, Booking.session_id == TrainingSession.id)
+        .join(ClassType, TrainingSession.class_type_id == ClassType.id)
+        .join(User, Booking.user_id == User.id)
+    )
+    return filters.apply(query).order_by(Booking.created_at, Booking.id)
+
+
+def tickets_query(db: Session, filters: TicketFilters) -> Query:
+    query = (
+        db.query(
+            Ticket.id,
+            Ticket.user_id,
+            User.email.label("user_email"),
+            Ticket.center_id,
+            Ticket.plan_id,
+            TicketPlan.code.label("plan_code"),
+            Ticket.valid_from,
+            Ticket.valid_until,
+            Ticket.remaining_entries,
+            Ticket.is_active,
+            Ticket.created_at,
+        )
+        .select_from(Ticket)
+        .join(User, Ticket.user_id == User.id)
+        .join(TicketPlan, Ticket.plan_id == TicketPlan.id)
+    )
+    return filters.apply(query).order_by(Ticket.created_at, Ticket.id)
+
+
+def orders_query(db: Session, filters: OrderFilters) -> Query:
+    query = (
+        db.query(
+            Order.id,
+            Order.user_id,
+            User.email.label("user_email"),
+            Order.ticket_plan_id,
+            Order.price_cents,
+            Order.currency,
+            Order.status,
+            Order.created_at,
+        )
+        .select_from(Order)
+        .join(User, Order.user_id == User.id)
+    )
+    return filters.apply(query).order_by(Order.created_at, Order.id)
+
+
+def users_query(db: Session, filters: UserFilters) -> Query:
+    query = db.query(
+        User.id,
+        User.email,
+        User.role,
+        User.is_active,
+        User.created_at,
+    )
+    return filters.apply(query).order_by(User.created_at, User.id)
+
+
+# -------------------------------------------------
+# Streaming
+# -------------------------------------------------
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def stream_rows(query: Query, fmt: str, batch_size: int | None = None) -> Iterator[bytes]:
+    """Yield the formatted export, one chunk per `batch_size` rows."""
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    columns = [column["name"] for column in query.column_descriptions]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == "csv":
+        writer.writerow(columns)
+
+    for i, row in enumerate(query.yield_per(batch_size), start=1):
+        if fmt == "csv":
+            writer.writerow(
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row
+            )
+        else:
+            buffer.write(json.dumps(dict(zip(columns, row)), default=_json_default))
+            buffer.write("\n")
+
+        if i % batch_size == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)  # gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
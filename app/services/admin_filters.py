@@ -0,0 +1,140 @@
+# app/services/admin_filters.py
+"""
+Filters shared by the admin list endpoints and the streaming export.
+
+Each class is a FastAPI dependency (`filters: BookingFilters = Depends()`), so
+the query parameters are declared once and both endpoints filter identically.
+`apply()` works on any query that selects from (or joins) the tables it
+filters on – ORM entities for the paginated lists, column projections for
+the export. Email filters go through member_search.email_contains, which
+the trigram index on users.email serves.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, UTC
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Query
+
+from app.models.booking import Booking
+from app.models.order import Order
+from app.models.session import Session as TrainingSession
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.services.member_search import email_contains
+
+
+@dataclass
+class BookingFilters:
+    """Query must join TrainingSession and User."""
+
+    session_id: int | None = None
+    center_id: int | None = None
+    day: date | None = None
+    status: str | None = None
+    email: str | None = None
+
+    def apply(self, query: Query) -> Query:
+        if self.session_id is not None:
+            query = query.filter(Booking.session_id == self.session_id)
+
+        if self.center_id is not None:
+            query = query.filter(TrainingSession.center_id == self.center_id)
+
+        if self.status is not None:
+            query = query.filter(Booking.status == self.status)
+
+        if self.email is not None:
+            query = query.filter(email_contains(self.email))
+
+        if self.day is not None:
+            start = datetime(self.day.year, self.day.month, self.day.day, tzinfo=UTC)
+            end = start + timedelta(days=1)
+            query = query.filter(
+                TrainingSession.start_time >= start,
+                TrainingSession.start_time < end,
+            )
+
+        return query
+
+
+@dataclass
+class TicketFilters:
+    """Query must join User."""
+
+    email: str | None = None
+    plan_id: int | None = None
+    status: str | None = None
+    from_date: date | None = None
+    to_date: date | None = None
+
+    def apply(self, query: Query) -> Query:
+        if self.email:
+            query = query.filter(email_contains(self.email))
+
+        if self.plan_id:
+            query = query.filter(Ticket.plan_id == self.plan_id)
+
+        if self.status == "active":
+            query = query.filter(Ticket.is_active.is_(True))
+        elif self.status == "inactive":
+            query = query.filter(Ticket.is_active.is_(False))
+
+        if self.from_date:
+            query = query.filter(Ticket.valid_from >= self.from_date)
+
+        if self.to_date:
+            query = query.filter(Ticket.valid_from <= self.to_date)
+
+        return query
+
+
+@dataclass
+class UserFilters:
+    has_valid_ticket: bool | None = None
+
+    def apply(self, query: Query) -> Query:
+        if self.has_valid_ticket is None:
+            return query
+
+        now = datetime.now(UTC)
+        valid_ticket_subquery = (
+            select(Ticket.user_id)
+            .where(
+                Ticket.is_active.is_(True),
+                Ticket.valid_from <= now,
+                Ticket.valid_until >= now,
+                or_(
+                    Ticket.remaining_entries.is_(None),
+                    Ticket.remaining_entries > 0,
+                ),
+            )
+        )
+
+        if self.has_valid_ticket:
+            return query.filter(User.id.in_(valid_ticket_subquery))
+        return query.filter(~User.id.in_(valid_ticket_subquery))
+
+
+@dataclass
+class OrderFilters:
+    """Query must join User."""
+
+    email: str | None = None
+    status: str | None = None
+    from_date: date | None = None
+    to_date: date | None = None
+
+    def apply(self, query: Query) -> Query:
+        if self.email:
+            query = query.filter(email_contains(self.email))
+
+        if self.status:
+            query = query.filter(Order.status == self.status)
+
+        if self.from_date:
+            query = query.filter(Order.created_at >= self.from_date)
+
+        if self.to_date:
+            query = query.filter(Order.created_at < self.to_date + timedelta(days=1))
+
+        return query
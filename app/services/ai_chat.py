@@ -1,21 +1,32 @@
 # app/services/ai_chat.py
+import logging
+from typing import AsyncIterator
+
 from sqlalchemy.orm import Session
+from app.services.prompt_cache import prompt_cache
 from app.services.schedule_service import get_weekly_schedule_text
 from openai import OpenAI
-from typing import List, Dict
 
+from app.core.chat_model import sse_event
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # -------------------------------------------------
 # OpenAI client
 # -------------------------------------------------
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+CHAT_MODEL = "gpt-4.1-mini"
+CHAT_TEMPERATURE = 0.1
+CHAT_MAX_TOKENS = 300
+
 # -------------------------------------------------
 # System prompt (VERY IMPORTANT)
 # -------------------------------------------------
-def build_system_prompt(schedule_text: str) -> str:
-    return f"""
+# Static rules first, the per-center schedule last: every request shares the
+# same prompt prefix, which the provider can serve from its prompt cache.
+SYSTEM_PROMPT_PREFIX = """
 Si AI fitnes svetovalec znotraj aplikacije fitnes centra.
 
 POMEMBNA PRAVILA (BREZ IZJEM):
@@ -27,9 +38,6 @@ POMEMBNA PRAVILA (BREZ IZJEM):
 - Predpostaviš, da je uporabnik že v aplikaciji
 - Urnik je enak vsak teden
 
-TEDENSKI URNIK SKUPINSKIH VADB:
-{schedule_text}
-
 TVOJA NALOGA:
 - pomagaj uporabniku izbrati primerne skupinske vadbe
 - pojasni, katere vadbe so primerne za njegov cilj
@@ -44,20 +52,69 @@ TVOJA NALOGA:
 - Če nisi 100 % prepričan, da termin obstaja v urniku, ga NE omenjaj.
 """
 
+
+def build_system_prompt(schedule_text: str) -> str:
+    return f"""{SYSTEM_PROMPT_PREFIX}
+TEDENSKI URNIK SKUPINSKIH VADB:
+{schedule_text}
+"""
+
+
+def get_system_prompt(db: Session, center_id: int | None = None) -> str:
+    # ⚡ cached per center – no schedule query on a hit
+    cached = prompt_cache.get(center_id)
+    if cached is not None:
+        return cached
+
+    version = prompt_cache.version
+    system_prompt = build_system_prompt(get_weekly_schedule_text(db, center_id))
+    prompt_cache.set(center_id, system_prompt, version=version)
+    return system_prompt
+
+
 # -------------------------------------------------
 # Chat function
 # -------------------------------------------------
-def chat_with_ai(db: Session, messages: list[dict]) -> str:
-    schedule_text = get_weekly_schedule_text(db)
-    system_prompt = build_system_prompt(schedule_text)
+def chat_with_ai(db: Session, messages: list[dict], center_id: int | None = None) -> str:
+    system_prompt = get_system_prompt(db, center_id)
 
     response = client.chat.completions.create(
-        model="gpt-4.1-mini",
+        model=CHAT_MODEL,
         messages=[
             {"role": "system", "content": system_prompt},
             *messages,
         ],
-        temperature=0.1,
-        max_tokens=300,
+        temperature=CHAT_TEMPERATURE,
+        max_tokens=CHAT_MAX_TOKENS,
     )
     return response.choices[0].message.content
+
+
+# -------------------------------------------------
+# Streaming (server-sent events)
+# -------------------------------------------------
+def load_system_prompt(db: Session, center_id: int | None = None) -> str:
+    """System prompt for a stream; the DB connection is released before it starts."""
+    system_prompt = get_system_prompt(db, center_id)
+    db.close()
+    return system_prompt
+
+
+async def stream_chat(model, system_prompt: str, messages: list[dict]) -> AsyncIterator[str]:
+    """
+    Forward the model's tokens as SSE `data` events, then `done` (or `error`
+    if the stream breaks after the response has started).
+    """
+    try:
+        async for token in model.stream(
+            [{"role": "system", "content": system_prompt}, *messages],
+            model=CHAT_MODEL,
+            temperature=CHAT_TEMPERATURE,
+            max_tokens=CHAT_MAX_TOKENS,
+        ):
+            yield sse_event({"delta": token})
+        yield sse_event({}, event="done")
+    except Exception:
+        logger.exception("AI chat stream failed")
+        yield sse_event({"detail": "AI chat unavailable"}, event="error")
+
@@ -1,10 +1,19 @@
 from openai import OpenAI
+from sqlalchemy.orm import Session
+
 from app.core.config import settings
+from app.services.explanation_cache import explanation_key, get_or_create_explanation
 
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+EXPLANATION_MODEL = "gpt-4.1-mini"
+EXPLANATION_SYSTEM_PROMPT = "You are a helpful fitness assistant."
+EXPLANATION_TEMPERATURE = 0.6
+EXPLANATION_MAX_TOKENS = 200
+
 
 def explain_recommendation(
+    db: Session,
     *,
     goal: str,
     days_per_week: int,
@@ -14,6 +23,7 @@ def explain_recommendation(
 ) -> str:
     """
     Generates a human-friendly explanation for a WEEKLY training plan.
+    Memoized by the exact prompt inputs (see explanation_cache.py).
     """
 
     # ✅ FIX: use day instead of date
@@ -47,17 +57,31 @@ Na kratko pojasni:
 - dodaj eno motivacijsko misel
 """
 
-    try:
+    key = explanation_key(
+        model=EXPLANATION_MODEL,
+        system=EXPLANATION_SYSTEM_PROMPT,
+        temperature=EXPLANATION_TEMPERATURE,
+        max_tokens=EXPLANATION_MAX_TOKENS,
+        prompt=prompt,
+    )
+
+    def generate() -> str:
         response = client.chat.completions.create(
-            model="gpt-4.1-mini",
+            model=EXPLANATION_MODEL,
             messages=[
-                {"role": "system", "content": "You are a helpful fitness assistant."},
+                {"role": "system", "content": EXPLANATION_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
-            temperature=0.6,
-            max_tokens=200,
+            temperature=EXPLANATION_TEMPERATURE,
+            max_tokens=EXPLANATION_MAX_TOKENS,
         )
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("Empty completion")  # fallback, not cached
+        return content
+
+    try:
+        return get_or_create_explanation(db, key, generate)
 
     except Exception:
         # 🔒 graceful fallback (VERY IMPORTANT for prod)
@@ -0,0 +1,71 @@
+# app/services/booking_service.py
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session as DBSession
+
+from app.models.session import Session
+from app.models.ticket import Ticket
+
+
+def claim_seat(db: DBSession, session_id: int) -> bool:
+    """
+    Atomically take one seat of an active session.
+
+    A single conditional UPDATE replaces SELECT ... FOR UPDATE + check +
+    increment: concurrent claims serialize only on this statement, and the
+    `booked_count < capacity` predicate is re-checked against the latest row
+    version, so the session can never be overbooked.
+    Returns False when the session is full (→ waiting list).
+    """
+    claimed = db.execute(
+        update(Session)
+        .where(
+            Session.id == session_id,
+            Session.is_active.is_(True),
+            Session.booked_count < Session.capacity,
+        )
+        .values(booked_count=Session.booked_count + 1)
+        .returning(Session.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+    return claimed is not None
+
+
+def lock_active_session(db: DBSession, session_id: int) -> bool:
+    """
+    Share-lock the session row if it is still active (waiting-list path).
+
+    Like the seat claim, this serializes with `cancel_sessions`, which
+    deactivates the session row before cancelling its bookings: a waiting
+    booking either commits first and is cancelled with the session, or sees
+    the session inactive. Returns False when the session was cancelled.
+    """
+    locked = db.execute(
+        select(Session.id)
+        .where(Session.id == session_id, Session.is_active.is_(True))
+        .with_for_update(read=True)
+    ).first()
+
+    return locked is not None
+
+
+def consume_entry(db: DBSession, ticket_id: int) -> bool:
+    """
+    Atomically use one entry of a limited ticket (deactivates it at zero).
+    Returns False if the ticket ran out in the meantime.
+    """
+    consumed = db.execute(
+        update(Ticket)
+        .where(
+            Ticket.id == ticket_id,
+            Ticket.remaining_entries > 0,
+        )
+        .values(
+            remaining_entries=Ticket.remaining_entries - 1,
+            is_active=Ticket.remaining_entries > 1,
+        )
+        .returning(Ticket.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+    return consumed is not None
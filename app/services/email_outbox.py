@@ -0,0 +1,112 @@
+# app/services/email_outbox.py
+"""
+Transactional email outbox.
+
+Routers call `enqueue_email(db, ...)` inside the request transaction, so a
+message exists if and only if the booking (or cancellation) committed, and the
+request never waits for the email provider.
+
+A background worker drains the table with `FOR UPDATE SKIP LOCKED` (any number
+of workers can run side by side), sends due messages in batches and records the
+delivery state. Failed messages are retried with exponential backoff and marked
+`failed` after EMAIL_OUTBOX_MAX_ATTEMPTS.
+"""
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core import email_resend
+from app.core.config import settings
+from app.core.email_fake import FakeEmailProvider
+from app.db import SessionLocal
+from app.models.email_outbox import EmailOutbox
+
+_fake_provider = FakeEmailProvider()
+
+
+def get_email_provider():
+    if settings.EMAIL_PROVIDER == "fake":
+        return _fake_provider
+    return email_resend
+
+
+def enqueue_email(db: Session, *, to_email: str, subject: str, html_body: str) -> None:
+    db.add(EmailOutbox(to_email=to_email, subject=subject, html_body=html_body))
+
+
+def enqueue_emails(db: Session, messages: list[dict]) -> None:
+    """Bulk variant: one multi-row INSERT for {to_email, subject, html_body} dicts."""
+    if messages:
+        db.execute(insert(EmailOutbox), messages)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+
+
+def drain_outbox(
+    db: Session,
+    provider=None,
+    *,
+    batch_size: int | None = None,
+    max_attempts: int | None = None,
+) -> dict:
+    """Sends ONE batch of due messages. Returns counts for this batch."""
+    provider = provider or get_email_provider()
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    max_attempts = max_attempts or settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+    now = datetime.now(UTC)
+
+    messages = (
+        db.query(EmailOutbox)
+        .filter(
+            EmailOutbox.status == "pending",
+            EmailOutbox.next_attempt_at <= now,
+        )
+        .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    result = {"sent": 0, "retried": 0, "failed": 0}
+    if not messages:
+        db.commit()
+        return result
+
+    errors = provider.send_batch(
+        [
+            {"to_email": m.to_email, "subject": m.subject, "html_body": m.html_body}
+            for m in messages
+        ]
+    )
+
+    for message, error in zip(messages, errors):
+        message.attempts += 1
+
+        if error is None:
+            message.status = "sent"
+            message.sent_at = now
+            message.last_error = None
+            result["sent"] += 1
+        elif message.attempts >= max_attempts:
+            message.status = "failed"
+            message.last_error = error
+            result["failed"] += 1
+        else:
+            message.next_attempt_at = now + retry_delay(message.attempts)
+            message.last_error = error
+            result["retried"] += 1
+
+    db.commit()
+    return result
+
+
+def run_outbox_worker_once() -> None:
+    """Background job: drain until there is nothing due."""
+    with SessionLocal() as db:
+        while True:
+            result = drain_outbox(db)
+            if sum(result.values()) < settings.EMAIL_OUTBOX_BATCH_SIZE:
+                break
@@ -0,0 +1,142 @@
+# app/services/explanation_cache.py
+"""
+Memoized LLM explanations for /ai/recommend.
+
+The explanation depends only on its prompt inputs (goal, level, days per
+week, the recommended slots and ticket), so it is cached under a sha256 of
+the model, its parameters and the rendered prompt:
+
+- in process: a TTLCache (AI_EXPLANATION_CACHE_MAX_ENTRIES)
+- in postgres: `ai_explanations`, shared by all workers and restarts;
+  rows expire after AI_EXPLANATION_CACHE_TTL_SECONDS and a periodic purge
+  keeps at most AI_EXPLANATION_CACHE_MAX_ROWS
+
+Concurrent misses for the same key in one process share a single LLM call
+(`SingleFlight`). The read transaction is ended before the call, so neither
+the caller nor the waiters hold a DB connection during generation. Failed
+calls are not cached.
+"""
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, UTC
+from typing import Callable
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import SingleFlight, TTLCache
+from app.core.config import settings
+from app.db import SessionLocal
+from app.models.ai_explanation import AiExplanation
+
+logger = logging.getLogger(__name__)
+
+# key -> explanation
+explanation_cache = TTLCache(
+    maxsize=settings.AI_EXPLANATION_CACHE_MAX_ENTRIES,
+    ttl=settings.AI_EXPLANATION_CACHE_TTL_SECONDS,
+)
+
+explanation_flights = SingleFlight()
+
+
+def explanation_key(**inputs) -> str:
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _load(db: Session, key: str) -> str | None:
+    return db.execute(
+        select(AiExplanation.explanation).where(
+            AiExplanation.key == key,
+            AiExplanation.expires_at > datetime.now(UTC),
+        )
+    ).scalar_one_or_none()
+
+
+def _store(db: Session, key: str, explanation: str) -> None:
+    now = datetime.now(UTC)
+    expires_at = now + timedelta(seconds=settings.AI_EXPLANATION_CACHE_TTL_SECONDS)
+
+    stmt = insert(AiExplanation).values(
+        key=key,
+        explanation=explanation,
+        created_at=now,
+        expires_at=expires_at,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AiExplanation.key],
+            set_={
+                "explanation": stmt.excluded.explanation,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+    )
+    db.commit()
+
+
+def get_or_create_explanation(db: Session, key: str, generate: Callable[[], str]) -> str:
+    """Cached explanation for `key`, calling `generate()` once on a miss."""
+    # ⚡ in-process hit – no query
+    cached = explanation_cache.get(key)
+    if cached is not None:
+        return cached
+
+    version = explanation_cache.version
+    stored = _load(db, key)
+
+    # 🔌 end the read transaction: the LLM call must not pin a connection
+    db.commit()
+
+    if stored is not None:
+        explanation_cache.set(key, stored, version=version)
+        return stored
+
+    def generate_and_store() -> str:
+        # a previous flight may have finished while we were loading
+        cached = explanation_cache.get(key)
+        if cached is not None:
+            return cached
+
+        explanation = generate()
+        _store(db, key, explanation)
+        explanation_cache.set(key, explanation)
+        return explanation
+
+    return explanation_flights.do(key, generate_and_store)
+
+
+# -------------------------------------------------
+# Purge
+# -------------------------------------------------
+def purge_explanations(db: Session, *, max_rows: int | None = None) -> int:
+    """Delete expired rows and the oldest rows beyond max_rows."""
+    max_rows = max_rows or settings.AI_EXPLANATION_CACHE_MAX_ROWS
+
+    expired = db.execute(
+        delete(AiExplanation).where(AiExplanation.expires_at <= datetime.now(UTC))
+    ).rowcount
+
+    overflow = (
+        select(AiExplanation.key)
+        .order_by(AiExplanation.created_at.desc())
+        .offset(max_rows)
+    )
+    trimmed = db.execute(
+        delete(AiExplanation).where(AiExplanation.key.in_(overflow))
+    ).rowcount
+    db.commit()
+
+    if expired or trimmed:
+        logger.info("Purged %s expired and %s surplus AI explanations", expired, trimmed)
+    return expired + trimmed
+
+
+def run_explanation_purge_once() -> None:
+    """Background job."""
+    with SessionLocal() as db:
+        purge_explanations(db)
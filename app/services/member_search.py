@@ -0,0 +1,72 @@
+# app/services/member_search.py
+"""
+Member search by email (admin typeahead and the admin list filters).
+
+With the pg_trgm extension installed, `ix_users_email_trgm` (GIN,
+gin_trgm_ops) serves both substring ILIKE and word-similarity matches, so a
+search no longer scans the users table. Results are ranked prefix matches
+first, then by word similarity, which also catches typos ("jhon" -> "john").
+
+Without pg_trgm the same API falls back to an escaped substring ILIKE, ranked
+the same way by prefix and then by how much of the address the query covers.
+"""
+import logging
+
+from sqlalchemy import Float, case, cast, func, literal, text
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# None until the first search checks pg_extension (per process)
+_trigram_available: bool | None = None
+
+
+def trigram_available(db: Session) -> bool:
+    global _trigram_available
+    if _trigram_available is None:
+        _trigram_available = bool(
+            db.execute(
+                text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            ).scalar()
+        )
+        if not _trigram_available:
+            logger.warning("pg_trgm not installed; member search falls back to ILIKE scans")
+    return _trigram_available
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def email_contains(value: str):
+    """Substring match on User.email with LIKE wildcards escaped (trigram-indexable)."""
+    return User.email.ilike(f"%{_escape_like(value)}%", escape="\\")
+
+
+def search_members(db: Session, q: str, limit: int) -> list[tuple[User, float]]:
+    """Return up to `limit` (user, score) pairs, best match first."""
+    q = q.strip()
+    is_prefix = User.email.ilike(f"{_escape_like(q)}%", escape="\\")
+
+    if trigram_available(db):
+        score = func.word_similarity(q, User.email)
+        # `q <% email`: word_similarity above pg_trgm.word_similarity_threshold
+        condition = email_contains(q) | literal(q).op("<%")(User.email)
+    else:
+        score = cast(len(q), Float) / func.greatest(func.char_length(User.email), 1)
+        condition = email_contains(q)
+
+    rows = (
+        db.query(User, score.label("score"))
+        .filter(condition)
+        .order_by(
+            case((is_prefix, 0), else_=1),
+            score.desc(),
+            User.email,
+        )
+        .limit(limit)
+        .all()
+    )
+    return [(user, float(score)) for user, score in rows]
@@ -0,0 +1,59 @@
+# app/services/principal_cache.py
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import subscribe
+from app.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated user as seen by route handlers (no ORM state)."""
+
+    id: int
+    email: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+        )
+
+
+# user_id -> Principal
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def load_principal(db: Session, user_id: int) -> Principal | None:
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    version = principal_cache.version
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return None
+
+    principal = Principal.from_user(user)
+    principal_cache.set(user_id, principal, version=version)
+    return principal
+
+
+def invalidate_principals(key: str | None = None) -> None:
+    # role / active changes are rare – drop everything, no stale reader can
+    # re-insert an old principal (see TTLCache versioning)
+    principal_cache.invalidate()
+
+
+subscribe("users", invalidate_principals)
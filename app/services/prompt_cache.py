@@ -0,0 +1,19 @@
+# app/services/prompt_cache.py
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import subscribe
+
+# center_id (None = all centers) -> rendered AI chat system prompt
+prompt_cache = TTLCache(
+    maxsize=settings.PROMPT_CACHE_MAX_ENTRIES,
+    ttl=settings.PROMPT_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_prompts(key: str | None = None) -> None:
+    prompt_cache.invalidate()
+
+
+# the prompt embeds session times and class type names (not booked counts)
+for _topic in ("sessions", "class_types"):
+    subscribe(_topic, invalidate_prompts)
@@ -0,0 +1,72 @@
+# app/services/refresh_tokens.py
+"""
+Purge of dead refresh tokens.
+
+Every login and every rotation inserts a row; rotated, logged-out and expired
+tokens can never be used again. The purge deletes them in small batches, each
+in its own short transaction, so it never holds many row locks or blocks
+concurrent logins for long.
+"""
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# last run, exposed in /admin/metrics
+last_purge: dict = {}
+
+
+def purge_refresh_tokens(db: Session, *, batch_size: int | None = None) -> dict:
+    """Delete expired and revoked tokens; returns {"deleted", "batches", "seconds"}."""
+    batch_size = batch_size or settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+    started = time.perf_counter()
+    deleted = 0
+    batches = 0
+
+    while True:
+        count = db.execute(
+            text("""
+                DELETE FROM refresh_tokens
+                WHERE id IN (
+                    SELECT id FROM refresh_tokens
+                    WHERE is_revoked OR expires_at < now()
+                    LIMIT :batch_size
+                    FOR UPDATE SKIP LOCKED
+                )
+            """),
+            {"batch_size": batch_size},
+        ).rowcount
+        db.commit()
+
+        deleted += count
+        batches += 1
+        if count < batch_size:
+            break
+
+    result = {
+        "deleted": deleted,
+        "batches": batches,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    last_purge.clear()
+    last_purge.update(result)
+
+    logger.info(
+        "Purged %s refresh tokens in %s batches (%.3fs)",
+        deleted,
+        batches,
+        result["seconds"],
+    )
+    return result
+
+
+def run_refresh_token_purge_once() -> None:
+    """Background job."""
+    with SessionLocal() as db:
+        purge_refresh_tokens(db)
@@ -0,0 +1,19 @@
+# app/services/schedule_cache.py
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import subscribe
+
+# (center_id, day) -> serialized SessionOut list
+schedule_cache = TTLCache(
+    maxsize=settings.SCHEDULE_CACHE_MAX_ENTRIES,
+    ttl=settings.SCHEDULE_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_schedule(key: str | None = None) -> None:
+    schedule_cache.invalidate()
+
+
+# sessions, their booked_count and the embedded class type
+for _topic in ("sessions", "bookings", "class_types"):
+    subscribe(_topic, invalidate_schedule)
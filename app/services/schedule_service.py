@@ -1,7 +1,14 @@
-from sqlalchemy import text
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import Integer, Time, cast, extract, func, select
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.models.class_type import ClassType
+from app.models.session import Session as TrainingSession
+
+# ISO day of week (1 = Monday)
 WEEKDAYS_SI = {
     1: "Ponedeljek",
     2: "Torek",
@@ -9,15 +16,52 @@ WEEKDAYS_SI = {
     4: "Četrtek",
     5: "Petek",
     6: "Sobota",
-    0: "Nedelja",
+    7: "Nedelja",
 }
 
-def get_weekly_schedule_text(db: Session) -> str:
-    rows = db.execute(text("""
-        SELECT weekday, class_name, start_time, end_time
-        FROM weekly_schedule
-        ORDER BY weekday, start_time
-    """)).fetchall()
+
+def get_weekly_schedule(
+    db: Session,
+    center_id: int | None = None,
+    *,
+    days_back: int = 0,
+    days_ahead: int = 7,
+):
+    """
+    Distinct weekly slots (weekday, start_time, end_time, class_name) of the
+    active sessions in [now - days_back, now + days_ahead), in wall-clock
+    SCHEDULE_TIMEZONE time. One grouped query over a bounded start_time
+    range: the cost does not grow with the schedule's history.
+    """
+    now = datetime.now(UTC)
+    local_start = func.timezone(settings.SCHEDULE_TIMEZONE, TrainingSession.start_time)
+    local_end = func.timezone(settings.SCHEDULE_TIMEZONE, TrainingSession.end_time)
+
+    weekday = cast(extract("isodow", local_start), Integer).label("weekday")
+    start_time = cast(local_start, Time).label("start_time")
+    end_time = cast(local_end, Time).label("end_time")
+
+    query = (
+        select(weekday, start_time, end_time, ClassType.name.label("class_name"))
+        .select_from(TrainingSession)
+        .join(ClassType, ClassType.id == TrainingSession.class_type_id)
+        .where(
+            TrainingSession.is_active.is_(True),
+            TrainingSession.start_time >= now - timedelta(days=days_back),
+            TrainingSession.start_time < now + timedelta(days=days_ahead),
+        )
+        .group_by(weekday, start_time, end_time, ClassType.name)
+        .order_by(weekday, start_time, ClassType.name)
+    )
+
+    if center_id is not None:
+        query = query.where(TrainingSession.center_id == center_id)
+
+    return db.execute(query).all()
+
+
+def get_weekly_schedule_text(db: Session, center_id: int | None = None) -> str:
+    rows = get_weekly_schedule(db, center_id)
 
     schedule = {}
     for r in rows:
@@ -29,4 +73,4 @@ def get_weekly_schedule_text(db: Session) -> str:
     return "\n".join(
         f"{day}:\n" + "\n".join(items)
         for day, items in schedule.items()
-    )
\ No newline at end of file
+    )
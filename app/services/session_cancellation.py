@@ -0,0 +1,173 @@
+# app/services/session_cancellation.py
+"""
+Set-based session cancellation (a single session, a day, a center closure).
+
+Instead of one round trip per booking, a cancellation costs a fixed handful
+of statements, all in the caller's transaction:
+
+1. one UPDATE deactivates the sessions and resets booked_count. It locks
+   the session rows first, like `claim_seat`, `lock_active_session` and
+   `cancel_booking`, so it waits for in-flight bookings of those sessions
+   to commit and later ones see the session inactive;
+2. one UPDATE ... FROM cancels every active/waiting booking of those
+   sessions (a new statement: it sees the bookings committed meanwhile) and
+   returns the old status,
+3. one UPDATE ... FROM returns the used entries to the member's latest ticket
+   at that center (DISTINCT ON, same ticket `cancel_booking` refunds),
+4. one SELECT + one multi-row INSERT queue the notifications,
+5. one INSERT ... SELECT adjusts the booking rollups.
+"""
+from collections import Counter
+
+from sqlalchemy import Integer, column, select, update, values
+from sqlalchemy.orm import Session
+
+from app.core.email import render_template
+from app.models.booking import Booking
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session as TrainingSession
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.services.email_outbox import enqueue_emails
+from app.services.stats_rollups import record_bookings_bulk
+
+
+def cancel_sessions(db: Session, *criteria) -> dict:
+    """
+    Cancel the active sessions matching `criteria` (conditions on Session)
+    together with their bookings. The caller publishes and commits.
+    """
+    session_ids = db.execute(
+        update(TrainingSession)
+        .where(TrainingSession.is_active.is_(True), *criteria)
+        .values(is_active=False, booked_count=0)
+        .returning(TrainingSession.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+    affected = (
+        select(
+            Booking.id,
+            Booking.status,
+            TrainingSession.center_id,
+            User.email,
+        )
+        .join(TrainingSession, Booking.session_id == TrainingSession.id)
+        .join(User, Booking.user_id == User.id)
+        .where(
+            Booking.session_id.in_(session_ids),
+            Booking.status.in_(["active", "waiting"]),
+        )
+        .with_for_update(of=Booking)
+        .cte("affected")
+    )
+    bookings = db.execute(
+        update(Booking)
+        .where(Booking.id == affected.c.id)
+        .values(status="cancelled")
+        .returning(
+            Booking.user_id,
+            Booking.session_id,
+            affected.c.status,
+            affected.c.center_id,
+            affected.c.email,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    active = [b for b in bookings if b.status == "active"]
+    entries_refunded = _refund_entries(
+        db, Counter((b.user_id, b.center_id) for b in active)
+    )
+
+    _notify(db, bookings)
+    record_bookings_bulk(db, {
+        session_id: -count
+        for session_id, count in Counter(b.session_id for b in active).items()
+    })
+
+    return {
+        "session_ids": session_ids,
+        "bookings_cancelled": len(bookings),
+        "entries_refunded": entries_refunded,
+        "notifications": len(bookings),
+    }
+
+
+def _refund_entries(db: Session, entries: Counter) -> int:
+    """Add entries[(user_id, center_id)] to each member's latest limited ticket."""
+    if not entries:
+        return 0
+
+    refunds = values(
+        column("user_id", Integer),
+        column("center_id", Integer),
+        column("entries", Integer),
+        name="refunds",
+    ).data([(user_id, center_id, n) for (user_id, center_id), n in entries.items()])
+
+    latest = (
+        select(Ticket.id, refunds.c.entries)
+        .join_from(
+            refunds,
+            Ticket,
+            (Ticket.user_id == refunds.c.user_id) & (Ticket.center_id == refunds.c.center_id),
+        )
+        .distinct(Ticket.user_id, Ticket.center_id)
+        .order_by(Ticket.user_id, Ticket.center_id, Ticket.created_at.desc())
+        .subquery("latest")
+    )
+    refunded = db.execute(
+        update(Ticket)
+        .where(
+            Ticket.id == latest.c.id,
+            Ticket.remaining_entries.is_not(None),
+        )
+        .values(
+            remaining_entries=Ticket.remaining_entries + latest.c.entries,
+            is_active=True,
+        )
+        .returning(latest.c.entries)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+    return sum(refunded)
+
+
+def _notify(db: Session, bookings) -> None:
+    if not bookings:
+        return
+
+    sessions = db.execute(
+        select(
+            TrainingSession.id,
+            TrainingSession.start_time,
+            ClassType.name,
+            Center.name,
+        )
+        .join(ClassType, TrainingSession.class_type_id == ClassType.id)
+        .join(Center, TrainingSession.center_id == Center.id)
+        .where(TrainingSession.id.in_({b.session_id for b in bookings}))
+    ).all()
+
+    # the body only depends on the session: render once per session
+    bodies = {
+        session_id: render_template(
+            "session_cancelled.html",
+            class_name=class_name,
+            date=start_time.strftime("%d.%m.%Y"),
+            time=start_time.strftime("%H:%M"),
+            center_name=center_name,
+        )
+        for session_id, start_time, class_name, center_name in sessions
+    }
+
+    enqueue_emails(db, [
+        {
+            "to_email": b.email,
+            "subject": "Session cancelled ❌",
+            "html_body": bodies[b.session_id],
+        }
+        for b in bookings
+    ])
@@ -0,0 +1,107 @@
+# app/services/session_generator.py
+"""
+Materialize sessions from weekly SessionTemplates.
+
+One INSERT ... SELECT over generate_series() creates every occurrence in the
+range (no per-session round trips). Template times are wall-clock times in
+settings.SCHEDULE_TIMEZONE and are converted to UTC by postgres, so DST
+changes keep a 09:00 class at 09:00 local time.
+
+ON CONFLICT DO NOTHING on (template_id, start_time) makes the generator
+idempotent: rerunning a range only adds missing occurrences, and a generated
+session that was later cancelled is not recreated.
+"""
+from datetime import date
+
+from sqlalchemy import Date, DateTime, Interval, cast, extract, func, literal, literal_column, select, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session as TrainingSession
+from app.models.session_template import SessionTemplate
+
+
+def generate_sessions(
+    db: Session,
+    date_from: date,
+    date_to: date,
+    *,
+    center_id: int | None = None,
+    template_ids: list[int] | None = None,
+) -> list[int]:
+    """Insert missing sessions for [date_from, date_to]; return the new ids.
+
+    The caller publishes the "sessions" invalidation and commits.
+    """
+    days = select(
+        cast(
+            func.generate_series(
+                cast(literal(date_from), Date),
+                cast(literal(date_to), Date),
+                literal_column("interval '1 day'"),
+            ),
+            Date,
+        ).label("day")
+    ).subquery("days")
+
+    start_time = func.timezone(
+        settings.SCHEDULE_TIMEZONE,
+        days.c.day + SessionTemplate.start_time,
+        type_=DateTime(timezone=True),
+    )
+    end_time = start_time + ClassType.duration * literal_column("interval '1 minute'", Interval)
+
+    occurrences = (
+        select(
+            SessionTemplate.id,
+            SessionTemplate.center_id,
+            SessionTemplate.class_type_id,
+            start_time,
+            end_time,
+            SessionTemplate.capacity,
+            literal(0),
+            true(),
+            func.now(),
+        )
+        .select_from(SessionTemplate)
+        .join(ClassType, ClassType.id == SessionTemplate.class_type_id)
+        .join(Center, Center.id == SessionTemplate.center_id)
+        .join(days, true())
+        .where(
+            SessionTemplate.is_active.is_(True),
+            ClassType.is_active.is_(True),
+            Center.is_active.is_(True),
+            # isodow: 1 = Monday ... 7 = Sunday
+            extract("isodow", days.c.day) - 1 == SessionTemplate.weekday,
+            days.c.day >= SessionTemplate.valid_from,
+            (SessionTemplate.valid_until.is_(None)) | (days.c.day <= SessionTemplate.valid_until),
+        )
+    )
+    if center_id is not None:
+        occurrences = occurrences.where(SessionTemplate.center_id == center_id)
+    if template_ids:
+        occurrences = occurrences.where(SessionTemplate.id.in_(template_ids))
+
+    stmt = (
+        insert(TrainingSession)
+        .from_select(
+            [
+                "template_id",
+                "center_id",
+                "class_type_id",
+                "start_time",
+                "end_time",
+                "capacity",
+                "booked_count",
+                "is_active",
+                "created_at",
+            ],
+            occurrences,
+        )
+        .on_conflict_do_nothing(index_elements=["template_id", "start_time"])
+        .returning(TrainingSession.id)
+    )
+    return list(db.execute(stmt).scalars())
@@ -0,0 +1,241 @@
+# app/services/stats_rollups.py
+"""
+Rollup tables behind the admin dashboard.
+
+Writers call the `record_*` helpers inside their own transaction: each is one
+`INSERT ... ON CONFLICT DO UPDATE` adding a delta to a single rollup row, so
+the rollups commit (or roll back) together with the change they describe.
+
+`rebuild_rollups` recomputes a window of days from the source tables. The
+periodic catch-up job runs it for recent days to correct drift from writes
+that bypass the helpers (manual SQL, cascading deletes); run it without
+`since` for a full rebuild. It locks the rollup tables for the duration, so
+concurrent deltas wait and are applied on top of the rebuilt rows.
+"""
+import logging
+import time
+from datetime import date, datetime, timedelta, UTC
+
+from sqlalchemy import Integer, cast, column, delete, extract, func, literal, select, text, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import SessionLocal
+from app.models.booking import Booking
+from app.models.session import Session as TrainingSession
+from app.models.stats_rollup import (
+    StatsBookingsHourly,
+    StatsRevenueDaily,
+    StatsSignupsDaily,
+)
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_TABLES = (
+    StatsSignupsDaily.__table__,
+    StatsBookingsHourly.__table__,
+    StatsRevenueDaily.__table__,
+)
+
+
+# -------------------------------------------------
+# Incremental deltas
+# -------------------------------------------------
+def record_signup(db: Session, created_at: datetime) -> None:
+    stmt = insert(StatsSignupsDaily).values(
+        day=func.date(created_at),
+        signups=1,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[StatsSignupsDaily.day],
+            set_={"signups": StatsSignupsDaily.signups + stmt.excluded.signups},
+        )
+    )
+
+
+def record_ticket_sale(
+    db: Session,
+    created_at: datetime,
+    price_cents: int,
+    count: int = 1,
+) -> None:
+    stmt = insert(StatsRevenueDaily).values(
+        day=func.date(created_at),
+        revenue_cents=price_cents * count,
+        tickets_sold=count,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[StatsRevenueDaily.day],
+            set_={
+                "revenue_cents": StatsRevenueDaily.revenue_cents + stmt.excluded.revenue_cents,
+                "tickets_sold": StatsRevenueDaily.tickets_sold + stmt.excluded.tickets_sold,
+            },
+        )
+    )
+
+
+def record_bookings(
+    db: Session,
+    session_id: int,
+    *,
+    active: int = 0,
+    total: int = 0,
+) -> None:
+    """
+    Apply booking deltas to the session's (day, hour, class type) row:
+    `active` for status changes to/from "active", `total` for new bookings.
+    """
+    if not active and not total:
+        return
+
+    source = select(
+        func.date(TrainingSession.start_time),
+        cast(extract("hour", TrainingSession.start_time), Integer),
+        TrainingSession.class_type_id,
+        literal(active, Integer),
+        literal(total, Integer),
+    ).where(TrainingSession.id == session_id)
+
+    stmt = insert(StatsBookingsHourly).from_select(
+        ["day", "hour", "class_type_id", "active_bookings", "total_bookings"],
+        source,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                StatsBookingsHourly.day,
+                StatsBookingsHourly.hour,
+                StatsBookingsHourly.class_type_id,
+            ],
+            set_={
+                "active_bookings": StatsBookingsHourly.active_bookings + stmt.excluded.active_bookings,
+                "total_bookings": StatsBookingsHourly.total_bookings + stmt.excluded.total_bookings,
+            },
+        )
+    )
+
+
+def record_bookings_bulk(db: Session, active_by_session: dict[int, int]) -> None:
+    """
+    `record_bookings(active=...)` for many sessions in one statement; deltas
+    of sessions sharing a (day, hour, class type) row are summed first.
+    """
+    active_by_session = {k: v for k, v in active_by_session.items() if v}
+    if not active_by_session:
+        return
+
+    deltas = values(
+        column("session_id", Integer),
+        column("active", Integer),
+        name="deltas",
+    ).data(list(active_by_session.items()))
+
+    day = func.date(TrainingSession.start_time)
+    hour = cast(extract("hour", TrainingSession.start_time), Integer)
+    source = (
+        select(
+            day,
+            hour,
+            TrainingSession.class_type_id,
+            cast(func.sum(deltas.c.active), Integer),
+            literal(0, Integer),
+        )
+        .join_from(deltas, TrainingSession, TrainingSession.id == deltas.c.session_id)
+        .group_by(day, hour, TrainingSession.class_type_id)
+    )
+
+    stmt = insert(StatsBookingsHourly).from_select(
+        ["day", "hour", "class_type_id", "active_bookings", "total_bookings"],
+        source,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                StatsBookingsHourly.day,
+                StatsBookingsHourly.hour,
+                StatsBookingsHourly.class_type_id,
+            ],
+            set_={"active_bookings": StatsBookingsHourly.active_bookings + stmt.excluded.active_bookings},
+        )
+    )
+
+
+# -------------------------------------------------
+# Rebuild / catch-up
+# -------------------------------------------------
+def rebuild_rollups(db: Session, since: date | None = None) -> dict:
+    """Recompute rollup rows for days >= `since` (all days when None) and commit."""
+    started = time.perf_counter()
+
+    table_names = ", ".join(table.name for table in ROLLUP_TABLES)
+    db.execute(text(f"LOCK TABLE {table_names} IN EXCLUSIVE MODE"))
+
+    signup_day = func.date(User.created_at)
+    sale_day = func.date(Ticket.created_at)
+    session_day = func.date(TrainingSession.start_time)
+
+    signups = select(signup_day, func.count(User.id)).group_by(signup_day)
+    revenue = (
+        select(sale_day, func.sum(TicketPlan.price_cents), func.count(Ticket.id))
+        .join(TicketPlan, Ticket.plan_id == TicketPlan.id)
+        .group_by(sale_day)
+    )
+    session_hour = cast(extract("hour", TrainingSession.start_time), Integer)
+    bookings = (
+        select(
+            session_day,
+            session_hour,
+            TrainingSession.class_type_id,
+            func.count(Booking.id).filter(Booking.status == "active"),
+            func.count(Booking.id),
+        )
+        .join(TrainingSession, Booking.session_id == TrainingSession.id)
+        .group_by(session_day, session_hour, TrainingSession.class_type_id)
+    )
+
+    if since is not None:
+        signups = signups.where(signup_day >= since)
+        revenue = revenue.where(sale_day >= since)
+        bookings = bookings.where(session_day >= since)
+
+    rows = {}
+    for model, source, columns in (
+        (StatsSignupsDaily, signups, ["day", "signups"]),
+        (StatsRevenueDaily, revenue, ["day", "revenue_cents", "tickets_sold"]),
+        (
+            StatsBookingsHourly,
+            bookings,
+            ["day", "hour", "class_type_id", "active_bookings", "total_bookings"],
+        ),
+    ):
+        cleared = delete(model)
+        if since is not None:
+            cleared = cleared.where(model.day >= since)
+        db.execute(cleared)
+
+        rows[model.__tablename__] = db.execute(
+            insert(model).from_select(columns, source)
+        ).rowcount
+
+    db.commit()
+
+    result = {
+        "since": since.isoformat() if since else None,
+        "rows": rows,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    logger.info("Rebuilt stats rollups since %s: %s (%.3fs)", since, rows, result["seconds"])
+    return result
+
+
+def run_rollup_catch_up_once() -> None:
+    """Background job: rebuild the recent window."""
+    since = datetime.now(UTC).date() - timedelta(days=settings.STATS_ROLLUP_CATCH_UP_DAYS)
+    with SessionLocal() as db:
+        rebuild_rollups(db, since=since)
@@ -0,0 +1,81 @@
+# app/services/ticket_assignment.py
+"""
+Bulk ticket assignment (corporate onboarding, promotions).
+
+Users are resolved in one query and all tickets are inserted with one
+multi-row INSERT ... RETURNING, so the cost is a constant number of round
+trips no matter how many users are in the request. Each requested user id
+or email gets its own result row: assigned, not_found, inactive or duplicate.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Session
+
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+from app.services.stats_rollups import record_ticket_sale
+
+
+def assign_tickets_bulk(
+    db: Session,
+    plan: TicketPlan,
+    center_id: int,
+    now: datetime,
+    *,
+    user_ids: list[int],
+    emails: list[str],
+) -> list[dict]:
+    """Insert one ticket per resolved user; the caller publishes and commits."""
+    users = db.query(User.id, User.email, User.is_active).filter(
+        or_(User.id.in_(user_ids), User.email.in_(emails))
+    ).all()
+    by_id = {u.id: u for u in users}
+    by_email = {u.email: u for u in users}
+
+    results = []
+    seen: set[int] = set()
+    for ref, user in [(i, by_id.get(i)) for i in user_ids] + [(e, by_email.get(e)) for e in emails]:
+        if user is None:
+            results.append({"ref": ref, "status": "not_found"})
+        elif not user.is_active:
+            results.append({"ref": ref, "user_id": user.id, "status": "inactive"})
+        elif user.id in seen:
+            results.append({"ref": ref, "user_id": user.id, "status": "duplicate"})
+        else:
+            seen.add(user.id)
+            results.append({"ref": ref, "user_id": user.id, "status": "assigned"})
+
+    if not seen:
+        return results
+
+    valid_until = (
+        now + timedelta(days=plan.duration_days)
+        if plan.duration_days
+        else now + timedelta(days=365 * 10)  # “unlimited”
+    )
+    rows = db.execute(
+        insert(Ticket).returning(Ticket.id, Ticket.user_id),
+        [
+            {
+                "user_id": user_id,
+                "center_id": center_id,
+                "plan_id": plan.id,
+                "valid_from": now,
+                "valid_until": valid_until,
+                "remaining_entries": plan.max_entries,
+                "is_active": True,
+                "created_at": now,
+            }
+            for user_id in seen
+        ],
+    ).all()
+    ticket_ids = {user_id: ticket_id for ticket_id, user_id in rows}
+
+    for result in results:
+        if result["status"] == "assigned":
+            result["ticket_id"] = ticket_ids[result["user_id"]]
+
+    record_ticket_sale(db, now, plan.price_cents, count=len(seen))
+    return results
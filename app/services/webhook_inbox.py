@@ -0,0 +1,222 @@
+# app/services/webhook_inbox.py
+"""
+Durable inbox for payment provider webhooks.
+
+The webhook endpoint only verifies the signature and stores the event
+(`store_event`), keyed by the provider's event id, then answers 200. A
+redelivered event hits the unique key and is not stored twice.
+
+A background worker drains the inbox with `FOR UPDATE SKIP LOCKED`, like the
+email outbox. Each event is handled in its own savepoint: a failing handler
+rolls back only its own changes, the event is retried with exponential
+backoff and moved to `dead` after WEBHOOK_INBOX_MAX_ATTEMPTS, where an admin
+can inspect and requeue it.
+"""
+import logging
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.invalidation import publish
+from app.db import SessionLocal
+from app.models.order import Order
+from app.models.payment import Payment
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.webhook_event import WebhookEvent
+from app.services.stats_rollups import record_ticket_sale
+
+logger = logging.getLogger(__name__)
+
+
+def store_event(db: Session, provider: str, event: dict) -> bool:
+    """Insert a verified event; False if it was already received. Does not commit."""
+    stored = db.execute(
+        insert(WebhookEvent)
+        .values(
+            provider=provider,
+            event_id=event["id"],
+            event_type=event["type"],
+            payload=event,
+        )
+        .on_conflict_do_nothing(constraint="uq_webhook_events_provider_event_id")
+        .returning(WebhookEvent.id)
+    ).first()
+
+    return stored is not None
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=settings.WEBHOOK_INBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+
+
+# -------------------------------------------------
+# Handlers
+# -------------------------------------------------
+def handle_stripe_event(db: Session, event: dict) -> str:
+    """
+    Apply one Stripe event and return its outcome. Raises to have the event
+    retried. Does not commit.
+    """
+    if event["type"] != "checkout.session.completed":
+        return "ignored"
+
+    session = event["data"]["object"]
+
+    if session.get("payment_status") != "paid":
+        return "not paid"
+
+    order_id = int(session["metadata"]["order_id"])
+
+    order = db.get(Order, order_id)
+    if not order:
+        return "order not found"
+
+    # 🔒 IDEMPOTENCY (another event for the same checkout)
+    existing_payment = (
+        db.query(Payment)
+        .filter(Payment.order_id == order.id)
+        .first()
+    )
+    if existing_payment:
+        return "already processed"
+
+    plan = db.get(TicketPlan, order.ticket_plan_id)
+    if not plan:
+        raise LookupError(f"Ticket plan {order.ticket_plan_id} of order {order.id} missing")
+
+    order.status = "paid"
+
+    payment = Payment(
+        order_id=order.id,
+        provider="stripe",
+        provider_reference=session["id"],
+        status="succeeded",
+    )
+    db.add(payment)
+
+    now = datetime.now(UTC)
+
+    valid_until = (
+        now + timedelta(days=plan.duration_days)
+        if plan.duration_days
+        else now.replace(year=now.year + 10)
+    )
+
+    # 🎟️ ENTRY-BASED PLAN → ACCUMULATE
+    if plan.max_entries is not None:
+        existing_ticket = (
+            db.query(Ticket)
+            .filter(
+                Ticket.user_id == order.user_id,
+                Ticket.center_id == 1,  # TODO multi-center
+                Ticket.is_active.is_(True),
+                Ticket.remaining_entries.isnot(None),
+                Ticket.valid_until >= now,
+            )
+            .order_by(Ticket.valid_until.desc())
+            .first()
+        )
+
+        if existing_ticket:
+            existing_ticket.remaining_entries += plan.max_entries
+            existing_ticket.is_active = True
+            publish(db, "tickets", order.user_id)
+            return "entries accumulated"
+
+    # 🆕 CREATE NEW TICKET
+    ticket = Ticket(
+        user_id=order.user_id,
+        center_id=1,
+        plan_id=plan.id,
+        valid_from=now,
+        valid_until=valid_until,
+        remaining_entries=plan.max_entries,
+        is_active=True,
+        created_at=now,
+    )
+
+    db.add(ticket)
+    record_ticket_sale(db, now, plan.price_cents)
+    publish(db, "tickets", order.user_id)
+    return "ticket created"
+
+
+HANDLERS = {
+    "stripe": handle_stripe_event,
+}
+
+
+# -------------------------------------------------
+# Worker
+# -------------------------------------------------
+def drain_webhook_inbox(
+    db: Session,
+    *,
+    batch_size: int | None = None,
+    max_attempts: int | None = None,
+) -> dict:
+    """Processes ONE batch of due events. Returns counts for this batch."""
+    batch_size = batch_size or settings.WEBHOOK_INBOX_BATCH_SIZE
+    max_attempts = max_attempts or settings.WEBHOOK_INBOX_MAX_ATTEMPTS
+    now = datetime.now(UTC)
+
+    events = (
+        db.query(WebhookEvent)
+        .filter(
+            WebhookEvent.status == "pending",
+            WebhookEvent.next_attempt_at <= now,
+        )
+        .order_by(WebhookEvent.next_attempt_at, WebhookEvent.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    result = {"processed": 0, "retried": 0, "dead": 0}
+
+    for event in events:
+        try:
+            # begin_nested() first flushes the previous events' bookkeeping
+            with db.begin_nested():
+                outcome = HANDLERS[event.provider](db, event.payload)
+        except Exception as exc:
+            # bookkeeping only after the savepoint, so its rollback can't undo it
+            event.attempts += 1
+            logger.warning(
+                "Webhook event %s (%s) failed on attempt %d",
+                event.event_id,
+                event.event_type,
+                event.attempts,
+                exc_info=True,
+            )
+            event.last_error = f"{type(exc).__name__}: {exc}"
+
+            if event.attempts >= max_attempts:
+                event.status = "dead"
+                result["dead"] += 1
+            else:
+                event.next_attempt_at = now + retry_delay(event.attempts)
+                result["retried"] += 1
+            continue
+
+        event.attempts += 1
+        event.status = "processed"
+        event.outcome = outcome
+        event.processed_at = now
+        event.last_error = None
+        result["processed"] += 1
+
+    db.commit()
+    return result
+
+
+def run_webhook_worker_once() -> None:
+    """Background job: drain until there is nothing due."""
+    with SessionLocal() as db:
+        while True:
+            result = drain_webhook_inbox(db)
+            if sum(result.values()) < settings.WEBHOOK_INBOX_BATCH_SIZE:
+                break
@@ -8,8 +8,15 @@ from app.main import app
 from app.db.base import Base
 from app.db import get_db
 from app.core.config import settings
+from app.services.principal_cache import principal_cache
+from app.services.explanation_cache import explanation_cache
+from app.services.prompt_cache import prompt_cache
+from app.services.schedule_cache import schedule_cache
 
 
+# 🔹 no background threads against the real DB during tests
+settings.BACKGROUND_WORKERS_ENABLED = False
+
 # 🔹 Test DB engine
 engine = create_engine(settings.TEST_DATABASE_URL, future=True)
 
@@ -39,6 +46,16 @@ def db_session():
         connection.close()
 
 
+# 🔹 process-local caches must not leak between tests
+@pytest.fixture(autouse=True)
+def clear_caches():
+    schedule_cache.invalidate()
+    principal_cache.invalidate()
+    prompt_cache.invalidate()
+    explanation_cache.invalidate()
+    yield
+
+
 # 🔹 FastAPI client with overridden DB
 @pytest.fixture()
 def client(db_session):
@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from app.core.security import create_access_token
+from app.models.booking import Booking
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+from app.services.admin_export import bookings_query, stream_rows
+from app.services.admin_filters import BookingFilters
+
+
+@pytest.fixture()
+def export_data(db_session):
+    center = Center(name="Export Center", address="Street 1", city="Ljubljana")
+    admin = User(email="export-admin@test.com", hashed_password="x", role="admin")
+    members = [User(email=f"export-{i}@test.com", hashed_password="x") for i in range(3)]
+    plan = TicketPlan(name="Export month", code="export-month", price_cents=4000, duration_days=30)
+    db_session.add_all([center, admin, plan, *members])
+    db_session.flush()
+
+    class_type = ClassType(name="Export Spin", duration=45, center_id=center.id)
+    db_session.add(class_type)
+    db_session.flush()
+
+    session = Session(
+        center_id=center.id,
+        class_type_id=class_type.id,
+        start_time=datetime(2030, 6, 1, 9, 0, tzinfo=UTC),
+        end_time=datetime(2030, 6, 1, 9, 45, tzinfo=UTC),
+        capacity=10,
+    )
+    db_session.add(session)
+    db_session.flush()
+
+    now = datetime.now(UTC)
+    db_session.add_all(
+        [
+            Booking(
+                user_id=member.id,
+                session_id=session.id,
+                status="cancelled" if i == 0 else "active",
+            )
+            for i, member in enumerate(members)
+        ]
+        + [
+            Ticket(
+                user_id=member.id,
+                center_id=center.id,
+                plan_id=plan.id,
+                valid_from=now,
+                valid_until=now + timedelta(days=30),
+                is_active=i != 0,
+            )
+            for i, member in enumerate(members)
+        ]
+    )
+    db_session.flush()
+
+    token = create_access_token(subject=admin.email, role="admin", user_id=admin.id)
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "session_id": session.id,
+    }
+
+
+def test_export_bookings_csv_applies_list_filters(client, export_data):
+    res = client.get(
+        "/api/v1/admin/export/bookings",
+        headers=export_data["headers"],
+        params={"session_id": export_data["session_id"], "status": "active"},
+    )
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    assert 'filename="bookings.csv"' in res.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert [row["user_email"] for row in rows] == ["export-1@test.com", "export-2@test.com"]
+    assert rows[0]["class_name"] == "Export Spin"
+
+
+def test_export_tickets_ndjson_gzip(client, export_data):
+    res = client.get(
+        "/api/v1/admin/export/tickets",
+        headers=export_data["headers"],
+        params={"format": "ndjson", "gzip": True, "status": "active", "email": "export-"},
+    )
+
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+
+    # httpx decodes the gzip body transparently
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert sorted(line["user_email"] for line in lines) == ["export-1@test.com", "export-2@test.com"]
+    assert all(line["plan_code"] == "export-month" for line in lines)
+
+
+def test_stream_rows_emits_one_chunk_per_batch(db_session, export_data):
+    query = bookings_query(db_session, BookingFilters(session_id=export_data["session_id"]))
+
+    chunks = list(stream_rows(query, "ndjson", batch_size=2))
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from app.core.pagination import encode_cursor
+
+from app.core.security import create_access_token
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session
+from app.models.user import User
+
+
+def admin_headers(db_session):
+    admin = User(email="pager-admin@test.com", hashed_password="x", role="admin")
+    db_session.add(admin)
+    db_session.flush()
+    token = create_access_token(subject=admin.email, role="admin", user_id=admin.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def collect(client, url, headers, **params):
+    pages = []
+    cursor = None
+    while True:
+        if cursor:
+            params["cursor"] = cursor
+        res = client.get(url, headers=headers, params=params)
+        assert res.status_code == 200
+        body = res.json()
+        pages.append(body)
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_users_are_paged_newest_first_without_gaps(client, db_session):
+    headers = admin_headers(db_session)
+
+    # identical created_at for some rows – the id breaks ties
+    same_time = datetime(2030, 1, 1, tzinfo=UTC)
+    db_session.add_all([
+        User(
+            email=f"pager-{i}@test.com",
+            hashed_password="x",
+            created_at=same_time if i % 2 else same_time + timedelta(minutes=i),
+        )
+        for i in range(7)
+    ])
+    db_session.flush()
+
+    expected = [
+        u.id for u in db_session.query(User).order_by(User.created_at.desc(), User.id.desc())
+    ]
+
+    pages = collect(client, "/api/v1/admin/users", headers, limit=3)
+
+    ids = [item["id"] for page in pages for item in page["items"]]
+    assert ids == expected
+    assert all(len(page["items"]) <= 3 for page in pages)
+    assert isinstance(pages[0]["total_estimate"], int)
+    assert all(page["total_estimate"] is None for page in pages[1:])
+
+
+def test_sessions_are_paged_in_schedule_order(client, db_session):
+    headers = admin_headers(db_session)
+
+    center = Center(name="Pager Center", address="Street 1", city="Ljubljana")
+    db_session.add(center)
+    db_session.flush()
+    class_type = ClassType(name="Pager Pump", duration=60, center_id=center.id)
+    db_session.add(class_type)
+    db_session.flush()
+
+    start = datetime(2030, 2, 1, 8, 0, tzinfo=UTC)
+    db_session.add_all([
+        Session(
+            center_id=center.id,
+            class_type_id=class_type.id,
+            start_time=start + timedelta(hours=i // 2),
+            end_time=start + timedelta(hours=i // 2 + 1),
+            capacity=10,
+        )
+        for i in range(5)
+    ])
+    db_session.flush()
+
+    pages = collect(client, "/api/v1/admin/sessions", headers, center_id=center.id, limit=2)
+
+    starts = [item["start_time"] for page in pages for item in page["items"]]
+    assert len(starts) == 5
+    assert starts == sorted(starts)
+    assert len(pages) == 3
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    encode_cursor(["2030-01-01T00:00:00+00:00", "1 OR 1=1"]),
+    encode_cursor(["2030-01-01T00:00:00+00:00", 1.5]),
+    encode_cursor(["2030-01-01T00:00:00+00:00", True]),
+    encode_cursor([42, 1]),
+])
+def test_invalid_cursor_is_rejected(client, db_session, cursor):
+    res = client.get(
+        "/api/v1/admin/bookings",
+        headers=admin_headers(db_session),
+        params={"cursor": cursor},
+    )
+
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import event
+
+from app.core.chat_model import StreamLimiter
+from app.core.chat_model_fake import DEFAULT_TOKENS, FakeChatModel
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session
+from app.models.user import User
+from app.services.ai_chat import SYSTEM_PROMPT_PREFIX, stream_chat
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **params):
+        self.calls.append(params)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Pridi na jogo."))])
+
+
+@pytest.fixture()
+def completions(monkeypatch):
+    completions = FakeCompletions()
+    monkeypatch.setattr("app.services.ai_chat.client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    return completions
+
+
+@pytest.fixture()
+def gym(db_session):
+    admin = User(email="chat-admin@test.com", hashed_password="x", role="admin")
+    center = Center(name="Chat Center", address="Street 1", city="Ljubljana")
+    other = Center(name="Other Chat Center", address="Street 2", city="Ljubljana")
+    db_session.add_all([admin, center, other])
+    db_session.flush()
+
+    yoga = ClassType(name="Chat Yoga", duration=60, center_id=center.id)
+    pilates = ClassType(name="Chat Pilates", duration=45, center_id=other.id)
+    db_session.add_all([yoga, pilates])
+    db_session.flush()
+
+    start = (datetime.now(UTC) + timedelta(days=2)).replace(hour=16, minute=0, second=0, microsecond=0)
+    db_session.add_all([
+        Session(center_id=center.id, class_type_id=yoga.id, start_time=start,
+                end_time=start + timedelta(minutes=60), capacity=10),
+        Session(center_id=other.id, class_type_id=pilates.id, start_time=start,
+                end_time=start + timedelta(minutes=45), capacity=10),
+    ])
+    db_session.flush()
+
+    token = create_access_token(subject=admin.email, role="admin", user_id=admin.id)
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "center_id": center.id,
+        "class_type_id": yoga.id,
+        "start": start,
+    }
+
+
+def chat(client, gym, text="Kaj priporočaš?"):
+    return client.post(
+        "/api/v1/ai/chat",
+        headers=gym["headers"],
+        json={"messages": [{"role": "user", "content": text}], "center_id": gym["center_id"]},
+    )
+
+
+def test_chat_prompt_is_cached_per_center_with_static_prefix_first(client, db_session, completions, gym):
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        first = chat(client, gym)
+        second = chat(client, gym, "In jutri?")
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == {"reply": "Pridi na jogo."}
+
+    # one schedule query for both messages
+    assert sum("FROM sessions" in s for s in statements) == 1
+
+    system = [call["messages"][0]["content"] for call in completions.calls]
+    assert system[0] == system[1]
+    assert system[0].startswith(SYSTEM_PROMPT_PREFIX)
+
+    local = gym["start"].astimezone(ZoneInfo(settings.SCHEDULE_TIMEZONE))
+    assert f"- {local:%H:%M}–{local + timedelta(minutes=60):%H:%M} Chat Yoga" in system[0]
+    assert "Chat Pilates" not in system[0]
+
+    assert completions.calls[1]["messages"][1:] == [{"role": "user", "content": "In jutri?"}]
+
+
+def test_chat_prompt_invalidated_by_new_session(client, db_session, completions, gym):
+    chat(client, gym)
+
+    start = gym["start"] + timedelta(days=1, hours=2)
+    res = client.post(
+        "/api/v1/admin/sessions",
+        headers=gym["headers"],
+        json={
+            "center_id": gym["center_id"],
+            "class_type_id": gym["class_type_id"],
+            "start_time": start.isoformat(),
+            "capacity": 10,
+        },
+    )
+    assert res.status_code == 200
+
+    chat(client, gym)
+
+    local = start.astimezone(ZoneInfo(settings.SCHEDULE_TIMEZONE))
+    before, after = (call["messages"][0]["content"] for call in completions.calls)
+    assert f"- {local:%H:%M}–" not in before
+    assert f"- {local:%H:%M}–" in after
+
+
+# -------------------------------------------------
+# Streaming (SSE)
+# -------------------------------------------------
+@pytest.fixture()
+def chat_model(monkeypatch):
+    model = FakeChatModel(StreamLimiter(max_concurrent=1, acquire_timeout=0.05))
+    monkeypatch.setattr("app.routers.ai_assistant.get_chat_model", lambda: model)
+    return model
+
+
+def parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields.get("event", "message"), json.loads(fields["data"])))
+    return events
+
+
+def stream_chat_request(client, gym):
+    return client.post(
+        "/api/v1/ai/chat",
+        headers=gym["headers"],
+        json={
+            "messages": [{"role": "user", "content": "Kaj priporočaš?"}],
+            "center_id": gym["center_id"],
+            "stream": True,
+        },
+    )
+
+
+def test_chat_streams_tokens_as_server_sent_events(client, db_session, chat_model, gym):
+    res = stream_chat_request(client, gym)
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_sse(res.text)
+    assert [e for e, _ in events] == ["message"] * len(DEFAULT_TOKENS) + ["done"]
+    assert "".join(data["delta"] for _, data in events[:-1]) == "".join(DEFAULT_TOKENS)
+
+    (call,) = chat_model.calls
+    assert call["messages"][0]["content"].startswith(SYSTEM_PROMPT_PREFIX)
+    assert call["messages"][1:] == [{"role": "user", "content": "Kaj priporočaš?"}]
+    assert chat_model.limiter.stats()["active"] == 0
+
+
+def test_chat_stream_reports_provider_failure(client, db_session, chat_model, gym):
+    chat_model.fail_after = 2
+
+    events = parse_sse(stream_chat_request(client, gym).text)
+
+    assert [e for e, _ in events] == ["message", "message", "error"]
+    assert chat_model.limiter.stats()["active"] == 0
+
+
+def test_chat_stream_rejected_when_all_slots_busy(client, db_session, chat_model, gym):
+    asyncio.run(chat_model.limiter.acquire())  # the only slot
+
+    res = stream_chat_request(client, gym)
+
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "2"
+    assert chat_model.calls == []
+    assert chat_model.limiter.stats()["rejected"] == 1
+
+
+def test_first_token_is_forwarded_before_generation_ends():
+    model = FakeChatModel(
+        StreamLimiter(max_concurrent=1, acquire_timeout=1),
+        tokens=["a", "b", "c", "d"],
+        first_token_delay=0.02,
+        token_delay=0.1,
+    )
+
+    async def consume():
+        started = time.perf_counter()
+        arrivals = []
+        async for _ in stream_chat(model, "system", []):
+            arrivals.append(time.perf_counter() - started)
+        return arrivals
+
+    arrivals = asyncio.run(consume())
+
+    time_to_first_token, total = arrivals[0], arrivals[-1]
+    assert time_to_first_token < 0.1
+    assert total >= 0.3
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.ai_explanation import AiExplanation
+from app.services.ai_fitness_assistant import explain_recommendation
+from app.services.explanation_cache import explanation_cache, purge_explanations
+
+PLAN = {
+    "goal": "strength",
+    "days_per_week": 2,
+    "experience_level": "beginner",
+    "sessions": [
+        {"day": "Ponedeljek", "class": "BodyPump", "time": "18:00"},
+        {"day": "Sreda", "class": "Core", "time": "19:00"},
+    ],
+    "ticket": {"name": "Mesečna", "price": 50.0, "reason": "Optimalna izbira."},
+}
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+        self.failing = False
+
+    def create(self, **params):
+        self.calls += 1
+        if self.failing:
+            raise ConnectionError("provider down")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f"Razlaga {self.calls}"))])
+
+
+@pytest.fixture()
+def completions(monkeypatch):
+    completions = FakeCompletions()
+    monkeypatch.setattr(
+        "app.services.ai_fitness_assistant.client",
+        SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+    )
+    return completions
+
+
+def test_repeat_inputs_are_served_from_cache(db_session, completions):
+    first = explain_recommendation(db_session, **PLAN)
+    second = explain_recommendation(db_session, **PLAN)
+
+    assert first == second == "Razlaga 1"
+    assert completions.calls == 1
+
+    # another worker / after a restart: served from postgres
+    explanation_cache.invalidate()
+    assert explain_recommendation(db_session, **PLAN) == "Razlaga 1"
+    assert completions.calls == 1
+    assert db_session.query(AiExplanation).count() == 1
+
+    # any change of the inputs is a different key
+    assert explain_recommendation(db_session, **{**PLAN, "goal": "mobility"}) == "Razlaga 2"
+    assert completions.calls == 2
+
+
+def test_expired_rows_are_regenerated(db_session, completions):
+    explain_recommendation(db_session, **PLAN)
+    db_session.query(AiExplanation).update({"expires_at": datetime.now(UTC) - timedelta(seconds=1)})
+    explanation_cache.invalidate()
+
+    assert explain_recommendation(db_session, **PLAN) == "Razlaga 2"
+    assert db_session.query(AiExplanation).one().expires_at > datetime.now(UTC)
+
+
+def test_failures_fall_back_and_are_not_cached(db_session, completions):
+    completions.failing = True
+    fallback = explain_recommendation(db_session, **PLAN)
+
+    assert "Doslednost" in fallback
+    assert db_session.query(AiExplanation).count() == 0
+
+    completions.failing = False
+    assert explain_recommendation(db_session, **PLAN) == "Razlaga 2"
+
+
+def test_purge_drops_expired_and_oldest_rows(db_session):
+    now = datetime.now(UTC)
+    db_session.add_all([
+        AiExplanation(key="expired", explanation="x", created_at=now, expires_at=now - timedelta(seconds=1)),
+        *(
+            AiExplanation(key=f"k{i}", explanation="x", created_at=now - timedelta(minutes=i),
+                          expires_at=now + timedelta(days=1))
+            for i in range(4)
+        ),
+    ])
+    db_session.flush()
+
+    assert purge_explanations(db_session, max_rows=2) == 3
+    assert sorted(k for (k,) in db_session.query(AiExplanation.key)) == ["k0", "k1"]
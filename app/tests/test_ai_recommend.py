@@ -0,0 +1,129 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import event
+
+from app.ai.logic import WeeklySlot, index_slots, recommend_sessions
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session
+from app.models.user import User
+
+
+def test_recommend_sessions_uses_index_by_weekday_and_class():
+    slots = {
+        (1, "BodyPump"): [time(9), time(18)],
+        (1, "Kickbox"): [time(19)],
+        (3, "Core"): [time(7)],
+        (5, "BodyPump"): [time(17)],
+    }
+
+    plan = recommend_sessions(goal="strength", days_per_week=2, slots=slots)
+
+    # priority first, one session per weekday, earliest time
+    assert plan == [
+        WeeklySlot(1, "BodyPump", time(9)),
+        WeeklySlot(5, "BodyPump", time(17)),
+    ]
+    assert recommend_sessions(goal="mobility", days_per_week=3, slots=slots) == [
+        WeeklySlot(3, "Core", time(7)),
+    ]
+
+
+def test_index_slots_sorts_and_deduplicates():
+    rows = [
+        WeeklySlot(2, "Core", time(18)),
+        WeeklySlot(2, "Core", time(7)),
+        WeeklySlot(2, "Core", time(18)),  # same slot, another end time
+    ]
+
+    assert index_slots(rows) == {(2, "Core"): [time(7), time(18)]}
+
+
+@pytest.fixture()
+def gym(db_session, monkeypatch):
+    monkeypatch.setattr("app.routers.ai_assistant.explain_recommendation", lambda db, **kwargs: "ok")
+
+    member = User(email="recommend@test.com", hashed_password="x")
+    center = Center(name="Recommend Center", address="Street 1", city="Ljubljana")
+    db_session.add_all([member, center])
+    db_session.flush()
+
+    kickbox = ClassType(name="Kickbox", duration=60, center_id=center.id)
+    core = ClassType(name="Core", duration=45, center_id=center.id)
+    db_session.add_all([kickbox, core])
+    db_session.flush()
+
+    token = create_access_token(subject=member.email, role="user", user_id=member.id)
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "center_id": center.id,
+        "kickbox": kickbox,
+        "core": core,
+    }
+
+
+def add_weekly(db_session, gym, class_type, first: datetime, weeks: range):
+    db_session.add_all([
+        Session(
+            center_id=gym["center_id"],
+            class_type_id=class_type.id,
+            start_time=first + timedelta(weeks=w),
+            end_time=first + timedelta(weeks=w, minutes=class_type.duration),
+            capacity=10,
+        )
+        for w in weeks
+    ])
+    db_session.flush()
+
+
+def recommend(client, gym):
+    return client.post(
+        "/api/v1/ai/recommend",
+        headers=gym["headers"],
+        json={
+            "goal": "fat_loss",
+            "experience_level": "beginner",
+            "days_per_week": 3,
+            "preferred_center_id": gym["center_id"],
+        },
+    )
+
+
+def test_recommend_projects_weekly_template_in_one_query(client, db_session, gym):
+    zone = ZoneInfo(settings.SCHEDULE_TIMEZONE)
+    # aware arithmetic keeps the wall-clock time across DST changes
+    base = datetime.combine(datetime.now(zone).date() + timedelta(days=1), time(19), tzinfo=zone)
+
+    # a weekly Kickbox and Core class, repeated over past and future weeks
+    add_weekly(db_session, gym, gym["kickbox"], base, range(-3, 3))
+    add_weekly(db_session, gym, gym["core"], base + timedelta(days=2), range(-3, 3))
+    # long gone: a class outside the window does not count
+    add_weekly(db_session, gym, gym["kickbox"], base + timedelta(days=4) - timedelta(weeks=52), range(1))
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        res = recommend(client, gym)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+
+    assert res.status_code == 200
+
+    def slot(start, name):
+        local = start.astimezone(zone)
+        day = ["Ponedeljek", "Torek", "Sreda", "Četrtek", "Petek", "Sobota", "Nedelja"][local.weekday()]
+        return {"day": day, "class": name, "time": f"{local:%H:%M}"}
+
+    sessions = res.json()["recommended_sessions"]
+    assert len(sessions) == 2
+    assert sessions[0] == slot(base, "Kickbox")
+    assert sessions[1] == slot(base + timedelta(days=2), "Core")
+
+    # one grouped schedule query, no per-session class type loads
+    assert sum("FROM sessions" in s for s in statements) == 1
+    assert not any("FROM class_types" in s for s in statements)
@@ -0,0 +1,136 @@
+import threading
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import func
+
+from app.models.booking import Booking
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.email_outbox import EmailOutbox
+from app.models.session import Session
+from app.models.user import User
+from app.services.booking_service import claim_seat, lock_active_session
+from app.services.session_cancellation import cancel_sessions
+from app.tests.conftest import TestingSessionLocal
+
+CAPACITY = 5
+CLIENTS = 30
+
+
+@pytest.fixture()
+def committed_session():
+    """Real commits: concurrent transactions cannot share the rollback fixture."""
+    with TestingSessionLocal() as db:
+        center = Center(name="Rush Center", address="Street 3", city="Celje")
+        db.add(center)
+        db.flush()
+
+        class_type = ClassType(name="Spinning", duration=45, center_id=center.id)
+        db.add(class_type)
+        db.flush()
+
+        start = datetime.now(UTC) + timedelta(days=1)
+        session = Session(
+            center_id=center.id,
+            class_type_id=class_type.id,
+            start_time=start,
+            end_time=start + timedelta(minutes=45),
+            capacity=CAPACITY,
+        )
+        users = [
+            User(email=f"rush{i}@test.com", hashed_password="x")
+            for i in range(CLIENTS)
+        ]
+        db.add(session)
+        db.add_all(users)
+        db.commit()
+
+        ids = (center.id, session.id, [u.id for u in users])
+
+    yield ids
+
+    center_id, _, user_ids = ids
+    with TestingSessionLocal() as db:
+        db.query(EmailOutbox).filter(EmailOutbox.to_email.like("rush%@test.com")).delete(synchronize_session=False)
+        db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.query(Center).filter(Center.id == center_id).delete(synchronize_session=False)
+        db.commit()
+
+
+def test_concurrent_claims_never_overbook(committed_session):
+    _, session_id, user_ids = committed_session
+    barrier = threading.Barrier(CLIENTS)
+    errors = []
+
+    def book(user_id):
+        try:
+            with TestingSessionLocal() as db:
+                barrier.wait()
+                status = "active" if claim_seat(db, session_id) else "waiting"
+                db.add(Booking(user_id=user_id, session_id=session_id, status=status))
+                db.commit()
+        except Exception as e:  # pragma: no cover - surfaced below
+            errors.append(e)
+
+    threads = [threading.Thread(target=book, args=(u,)) for u in user_ids]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+
+    with TestingSessionLocal() as db:
+        booked_count = db.get(Session, session_id).booked_count
+        counts = dict(
+            db.query(Booking.status, func.count(Booking.id))
+            .filter(Booking.session_id == session_id)
+            .group_by(Booking.status)
+            .all()
+        )
+
+    assert booked_count == CAPACITY
+    assert counts == {"active": CAPACITY, "waiting": CLIENTS - CAPACITY}
+
+
+@pytest.mark.parametrize("status", ["active", "waiting"])
+def test_booking_in_flight_is_cancelled_with_its_session(committed_session, status):
+    _, session_id, user_ids = committed_session
+    result = {}
+
+    def cancel():
+        with TestingSessionLocal() as db:
+            result.update(cancel_sessions(db, Session.id == session_id))
+            db.commit()
+
+    with TestingSessionLocal() as db:
+        # the booking holds the session row, uncommitted
+        if status == "active":
+            assert claim_seat(db, session_id)
+        else:
+            assert lock_active_session(db, session_id)
+
+        canceller = threading.Thread(target=cancel)
+        canceller.start()
+        canceller.join(timeout=0.5)
+        assert canceller.is_alive()  # waits for the booking's transaction
+
+        db.add(Booking(user_id=user_ids[0], session_id=session_id, status=status))
+        db.commit()
+
+    canceller.join()
+
+    assert result["session_ids"] == [session_id]
+    assert result["bookings_cancelled"] == 1
+
+    with TestingSessionLocal() as db:
+        session = db.get(Session, session_id)
+        statuses = db.query(Booking.status).filter(Booking.session_id == session_id).all()
+
+        # later bookings see the session cancelled
+        assert not claim_seat(db, session_id)
+        assert not lock_active_session(db, session_id)
+
+    assert (session.is_active, session.booked_count) == (False, 0)
+    assert statuses == [("cancelled",)]
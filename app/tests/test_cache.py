@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from app.core.cache import SingleFlight, TTLCache
+
+
+def test_lru_eviction_is_counted():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_expired_entries_are_misses():
+    cache = TTLCache(maxsize=10, ttl=0)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_value_loaded_before_invalidation_is_not_stored():
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    version = cache.version
+    # ... a write commits and invalidates while the value is being loaded
+    cache.invalidate()
+    cache.set("a", "stale", version=version)
+
+    assert cache.get("a") is None
+
+    cache.set("a", "fresh", version=cache.version)
+    assert cache.get("a") == "fresh"
+
+
+def test_single_flight_shares_one_call():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+
+    deadline = time.monotonic() + 5
+    while flights.stats()["shared"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert flights.stats() == {"in_flight": 0, "calls": 1, "shared": 4}
+
+    # finished flights are not reused
+    assert flights.do("k", lambda: "again") == "again"
+
+
+def test_single_flight_propagates_errors():
+    flights = SingleFlight()
+
+    def boom():
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        flights.do("k", boom)
+    assert flights.stats()["in_flight"] == 0
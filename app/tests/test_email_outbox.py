@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, UTC
+
+from app.core.email_fake import FakeEmailProvider
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox import drain_outbox, enqueue_email, enqueue_emails
+
+
+def test_outbox_sends_due_messages_in_batches(db_session):
+    enqueue_emails(
+        db_session,
+        [
+            {"to_email": f"m{i}@test.com", "subject": "Hi", "html_body": "<p>x</p>"}
+            for i in range(5)
+        ],
+    )
+    db_session.commit()
+
+    provider = FakeEmailProvider()
+
+    assert drain_outbox(db_session, provider, batch_size=3) == {"sent": 3, "retried": 0, "failed": 0}
+    assert drain_outbox(db_session, provider, batch_size=3) == {"sent": 2, "retried": 0, "failed": 0}
+    assert drain_outbox(db_session, provider, batch_size=3) == {"sent": 0, "retried": 0, "failed": 0}
+
+    assert provider.batches == [3, 2]
+    assert {m["to_email"] for m in provider.sent} == {f"m{i}@test.com" for i in range(5)}
+    assert db_session.query(EmailOutbox).filter(EmailOutbox.status == "sent").count() == 5
+
+
+def test_outbox_retries_with_backoff_then_gives_up(db_session):
+    enqueue_email(db_session, to_email="flaky@test.com", subject="Hi", html_body="x")
+    db_session.commit()
+
+    provider = FakeEmailProvider(fail_times=10)
+    message = db_session.query(EmailOutbox).one()
+
+    assert drain_outbox(db_session, provider, max_attempts=2)["retried"] == 1
+    assert message.status == "pending"
+    assert message.attempts == 1
+    assert message.next_attempt_at > datetime.now(UTC)
+
+    # not due yet → untouched
+    assert drain_outbox(db_session, provider, max_attempts=2)["retried"] == 0
+
+    message.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    db_session.commit()
+
+    assert drain_outbox(db_session, provider, max_attempts=2)["failed"] == 1
+    assert message.status == "failed"
+    assert message.last_error == "fake provider failure"
@@ -0,0 +1,40 @@
+from app.core.invalidation import publish
+from app.models.center import Center
+
+
+def test_centers_not_modified_until_a_write(client, db_session):
+    first = client.get("/api/v1/centers/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"].startswith("public")
+
+    again = client.get("/api/v1/centers/", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+    db_session.add(Center(name="ETag Center", address="Street 2", city="Maribor"))
+    publish(db_session, "centers")
+    db_session.commit()
+
+    changed = client.get("/api/v1/centers/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert any(c["name"] == "ETag Center" for c in changed.json())
+
+
+def test_schedule_etag_depends_on_query_and_bookings(client, db_session):
+    a = client.get("/api/v1/sessions/", params={"day": "2030-01-01"})
+    b = client.get("/api/v1/sessions/", params={"day": "2030-01-02"})
+    assert a.headers["ETag"] != b.headers["ETag"]
+    assert a.headers["Cache-Control"] == "no-cache"
+
+    publish(db_session, "bookings", 1)
+    db_session.commit()
+
+    r = client.get(
+        "/api/v1/sessions/",
+        params={"day": "2030-01-01"},
+        headers={"If-None-Match": a.headers["ETag"]},
+    )
+    assert r.status_code == 200
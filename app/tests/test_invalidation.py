@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.core.invalidation import InvalidationListener, publish, subscribe
+from app.tests.conftest import engine, TestingSessionLocal
+
+
+class Recorder:
+    def __init__(self):
+        self.keys = []
+        self.received = threading.Event()
+
+    def __call__(self, key):
+        self.keys.append(key)
+        if key is not None:
+            self.received.set()
+
+
+@pytest.fixture()
+def listener():
+    listener = InvalidationListener(engine, poll_interval=0.2, reconnect_delay=0.1)
+    listener.start()
+    assert listener.listening.wait(5)
+
+    yield listener
+
+    listener.stop(timeout=5)
+
+
+def publish_committed(topic, key):
+    with TestingSessionLocal() as db:
+        publish(db, topic, key)
+        db.commit()
+
+
+def test_notify_reaches_listener_after_commit(listener):
+    recorder = Recorder()
+    subscribe("test_topic_commit", recorder)
+
+    # rolled back → never delivered
+    with TestingSessionLocal() as db:
+        publish(db, "test_topic_commit", "rolled-back")
+        db.rollback()
+
+    publish_committed("test_topic_commit", "42")
+
+    assert recorder.received.wait(5)
+    assert "rolled-back" not in recorder.keys
+    # once locally after commit, once through NOTIFY
+    assert recorder.keys.count("42") >= 1
+
+
+def test_listener_reconnects_and_invalidates_everything(listener):
+    recorder = Recorder()
+    subscribe("test_topic_reconnect", recorder)
+    old_pid = listener.backend_pid
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": old_pid})
+
+    # wait for the new connection
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if listener.backend_pid not in (None, old_pid):
+            break
+        time.sleep(0.05)
+    assert listener.backend_pid not in (None, old_pid)
+
+    # missed notifications → full invalidation on reconnect
+    assert None in recorder.keys
+
+    publish_committed("test_topic_reconnect", "7")
+    assert recorder.received.wait(5)
@@ -0,0 +1,64 @@
+import pytest
+
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services.admin_filters import BookingFilters
+from app.services.member_search import search_members, trigram_available
+
+
+@pytest.fixture()
+def members(db_session):
+    admin = User(email="search-admin@test.com", hashed_password="x", role="admin")
+    db_session.add_all([
+        admin,
+        User(email="maja.novak@search.test", hashed_password="x"),
+        User(email="novak.janez@search.test", hashed_password="x"),
+        User(email="ana_kos@search.test", hashed_password="x"),
+        User(email="anaxkos@search.test", hashed_password="x"),
+    ])
+    db_session.flush()
+    token = create_access_token(subject=admin.email, role="admin", user_id=admin.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_search_ranks_prefix_matches_first(client, members):
+    res = client.get(
+        "/api/v1/admin/users/search",
+        headers=members,
+        params={"q": "novak", "limit": 5},
+    )
+
+    assert res.status_code == 200
+    emails = [row["email"] for row in res.json()]
+    assert emails == ["novak.janez@search.test", "maja.novak@search.test"]
+    assert all(isinstance(row["score"], float) for row in res.json())
+
+
+def test_search_respects_limit(client, members):
+    res = client.get(
+        "/api/v1/admin/users/search",
+        headers=members,
+        params={"q": "search.test", "limit": 2},
+    )
+
+    assert res.status_code == 200
+    assert len(res.json()) == 2
+
+
+def test_like_wildcards_are_matched_literally(db_session, members):
+    emails = [user.email for user, _ in search_members(db_session, "ana_k", 10)]
+
+    assert emails == ["ana_kos@search.test"]
+
+    # same escaping in the admin list filters
+    query = BookingFilters(email="ana_k").apply(db_session.query(User.email))
+    assert [email for (email,) in query] == ["ana_kos@search.test"]
+
+
+def test_fuzzy_match_with_trigram_index(db_session, members):
+    if not trigram_available(db_session):
+        pytest.skip("pg_trgm extension not installed")
+
+    emails = [user.email for user, _ in search_members(db_session, "novac", 10)]
+
+    assert "maja.novak@search.test" in emails
@@ -0,0 +1,180 @@
+import asyncio
+
+import pytest
+
+from app.core.payment_fake import FakePaymentGateway
+from app.core.payment_gateway import CircuitBreaker, PaymentGatewayUnavailable
+from app.core.security import create_access_token
+from app.models.order import Order
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+
+
+@pytest.fixture()
+def gateway(monkeypatch):
+    gateway = FakePaymentGateway(CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    monkeypatch.setattr("app.routers.orders.get_payment_gateway", lambda: gateway)
+    return gateway
+
+
+@pytest.fixture()
+def buyer(db_session):
+    user = User(email="checkout@test.com", hashed_password="x")
+    plan = TicketPlan(name="Checkout month", code="checkout-month", price_cents=4500, duration_days=30)
+    db_session.add_all([user, plan])
+    db_session.flush()
+
+    token = create_access_token(subject=user.email, role="user", user_id=user.id)
+    # checkout closes the request session, which detaches these objects
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "user_id": user.id,
+        "plan_id": plan.id,
+    }
+
+
+def checkout(client, buyer):
+    return client.post(
+        "/api/v1/orders/checkout",
+        headers=buyer["headers"],
+        json={"plan_id": buyer["plan_id"]},
+    )
+
+
+def test_checkout_creates_order_and_provider_session(client, db_session, gateway, buyer):
+    in_transaction = []
+    original = gateway.create_checkout_session
+
+    async def spy(**params):
+        in_transaction.append(db_session.in_transaction())
+        return await original(**params)
+
+    gateway.create_checkout_session = spy
+
+    res = checkout(client, buyer)
+
+    assert res.status_code == 200
+    assert res.json() == {"url": "https://checkout.fake/cs_fake_1"}
+
+    # the provider is called with the request's DB session released
+    assert in_transaction == [False]
+
+    order = db_session.query(Order).filter(Order.user_id == buyer["user_id"]).one()
+    assert order.status == "pending"
+    assert gateway.sessions == [
+        {
+            "id": "cs_fake_1",
+            "order_id": order.id,
+            "product_name": "Checkout month",
+            "amount_cents": 4500,
+            "currency": "EUR",
+            "success_url": gateway.sessions[0]["success_url"],
+            "cancel_url": gateway.sessions[0]["cancel_url"],
+        }
+    ]
+    assert f"order_id={order.id}" in gateway.sessions[0]["success_url"]
+
+
+def test_checkout_unknown_plan(client, db_session, gateway, buyer):
+    res = client.post("/api/v1/orders/checkout", headers=buyer["headers"], json={"plan_id": 999999})
+
+    assert res.status_code == 404
+    assert gateway.sessions == []
+
+
+def test_provider_failure_marks_order_failed_and_opens_breaker(client, db_session, gateway, buyer):
+    gateway.fail_times = 2
+
+    for _ in range(2):
+        res = checkout(client, buyer)
+        assert res.status_code == 503
+        assert res.headers["Retry-After"] == "5"
+
+    statuses = [
+        o.status
+        for o in db_session.query(Order).filter(Order.user_id == buyer["user_id"])
+    ]
+    assert statuses == ["failed", "failed"]
+    assert gateway.breaker.state == "open"
+
+    # the provider would answer again, but the breaker fails fast
+    res = checkout(client, buyer)
+    assert res.status_code == 503
+    assert gateway.sessions == []
+    assert gateway.breaker.stats() == {"state": "open", "consecutive_failures": 2, "rejected": 1}
+
+
+def test_unexpected_provider_error_marks_order_failed(client, db_session, gateway, buyer):
+    async def rejected(**params):
+        raise RuntimeError("invalid API key")
+
+    gateway.create_checkout_session = rejected
+
+    with pytest.raises(RuntimeError):
+        checkout(client, buyer)
+
+    order = db_session.query(Order).filter(Order.user_id == buyer["user_id"]).one()
+    assert order.status == "failed"
+
+
+def test_breaker_half_open_lets_one_trial_through(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("app.core.payment_gateway.time.monotonic", lambda: clock[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+    breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(PaymentGatewayUnavailable):
+        breaker.before_call()
+
+    clock[0] += 30
+    assert breaker.state == "half_open"
+
+    breaker.before_call()  # the trial
+    with pytest.raises(PaymentGatewayUnavailable):
+        breaker.before_call()  # concurrent callers still fail fast
+
+    # a failed trial opens it again, a successful one closes it
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock[0] += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_cancelled_trial_reopens_breaker(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("app.core.payment_gateway.time.monotonic", lambda: clock[0])
+    gateway = FakePaymentGateway(CircuitBreaker(failure_threshold=1, reset_timeout=30), latency=10)
+
+    gateway.breaker.record_failure()
+    clock[0] += 30
+    assert gateway.breaker.state == "half_open"
+
+    async def cancelled_trial():
+        task = asyncio.create_task(gateway.create_checkout_session(order_id=1))
+        await asyncio.sleep(0)  # the trial is now waiting on the provider
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled_trial())
+
+    # the trial counts as failed: open again, and a new trial after the reset
+    assert gateway.breaker.state == "open"
+    clock[0] += 30
+    gateway.latency = 0
+    session = asyncio.run(gateway.create_checkout_session(order_id=2))
+    assert session.id == "cs_fake_1"
+    assert gateway.breaker.state == "closed"
+
+
+def test_cancelled_call_does_not_count_while_closed():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+    breaker.before_call()
+    breaker.record_aborted()
+
+    assert breaker.stats() == {"state": "closed", "consecutive_failures": 0, "rejected": 0}
@@ -0,0 +1,56 @@
+import threading
+import time
+
+import pytest
+
+from app.core.password_hashing import PasswordHasher, PasswordHasherBusy
+
+
+@pytest.fixture()
+def saturated():
+    # one worker, no queue – occupied by a call that waits on `release`
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    release = threading.Event()
+    running = threading.Thread(target=hasher.run, args=("hash", release.wait))
+    running.start()
+
+    while hasher.stats()["in_flight"] == 0:
+        time.sleep(0.01)
+
+    yield hasher
+
+    release.set()
+    running.join()
+
+
+def test_hash_and_verify_roundtrip():
+    hasher = PasswordHasher(max_workers=2, max_queue=2)
+
+    hashed = hasher.hash("secret123")
+
+    assert hasher.verify("secret123", hashed)
+    assert not hasher.verify("wrong", hashed)
+
+    stats = hasher.stats()
+    assert stats["hash"]["calls"] == 1
+    assert stats["verify"]["calls"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_overload_is_rejected_immediately(saturated):
+    with pytest.raises(PasswordHasherBusy):
+        saturated.verify("secret123", "$2b$12$invalid")
+
+    assert saturated.stats()["rejected"] == 1
+
+
+def test_register_returns_503_when_hasher_is_saturated(client, saturated, monkeypatch):
+    monkeypatch.setattr("app.routers.auth.password_hasher", saturated)
+
+    res = client.post(
+        "/api/v1/auth/register",
+        json={"email": "burst@test.com", "password": "secret123"},
+    )
+
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
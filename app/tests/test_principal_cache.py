@@ -0,0 +1,85 @@
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services.principal_cache import principal_cache
+from app.tests.test_sessions import count_queries
+
+
+def make_user(db_session, email, role="user"):
+    user = User(email=email, hashed_password="x", role=role)
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def auth_headers(user):
+    token = create_access_token(subject=user.email, role=user.role, user_id=user.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def user_selects(statements):
+    return [s for s in statements if "FROM users" in s]
+
+
+def test_me_is_served_from_principal_cache(client, db_session):
+    user = make_user(db_session, "principal@test.com")
+    headers = auth_headers(user)
+
+    with count_queries() as first:
+        res = client.get("/api/v1/users/me", headers=headers)
+    assert res.status_code == 200
+    assert res.json() == {"id": user.id, "email": "principal@test.com", "role": "user"}
+    assert len(user_selects(first)) == 1
+
+    with count_queries() as second:
+        res = client.get("/api/v1/users/me", headers=headers)
+    assert res.status_code == 200
+    assert user_selects(second) == []
+
+
+def test_role_change_invalidates_principal(client, db_session):
+    admin = make_user(db_session, "principal-admin@test.com", role="admin")
+    user = make_user(db_session, "promoted@test.com")
+    user_headers = auth_headers(user)
+
+    assert client.get("/api/v1/users/me", headers=user_headers).json()["role"] == "user"
+    assert principal_cache.get(user.id) is not None
+
+    res = client.patch(
+        f"/api/v1/admin/users/{user.id}/role",
+        params={"role": "admin"},
+        headers=auth_headers(admin),
+    )
+    assert res.status_code == 200
+
+    # token still says "user" – the principal comes from the database
+    assert client.get("/api/v1/users/me", headers=user_headers).json()["role"] == "admin"
+
+
+def test_deactivated_user_is_rejected(client, db_session):
+    admin = make_user(db_session, "deactivator@test.com", role="admin")
+    user = make_user(db_session, "leaving@test.com")
+    user_headers = auth_headers(user)
+
+    assert client.get("/api/v1/users/me", headers=user_headers).status_code == 200
+
+    res = client.patch(
+        f"/api/v1/admin/users/{user.id}/deactivate",
+        headers=auth_headers(admin),
+    )
+    assert res.status_code == 200
+
+    res = client.get("/api/v1/users/me", headers=user_headers)
+    assert res.status_code == 403
+    assert res.json()["detail"] == "Inactive user"
+
+
+def test_token_without_user_id_still_works(client, db_session):
+    user = make_user(db_session, "legacy@test.com")
+    token = create_access_token(subject=user.email, role=user.role)
+
+    res = client.get(
+        "/api/v1/users/me",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert res.status_code == 200
+    assert res.json()["id"] == user.id
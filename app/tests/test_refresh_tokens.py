@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, UTC
+
+from app.core.security import create_refresh_token, hash_refresh_token
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.services.refresh_tokens import purge_refresh_tokens
+
+
+def make_user(db_session):
+    user = User(email="tokens@test.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def add_token(db_session, user, *, expires_in=timedelta(days=30), revoked=False):
+    value = create_refresh_token()
+    db_session.add(
+        RefreshToken(
+            token_hash=hash_refresh_token(value),
+            user_id=user.id,
+            expires_at=datetime.now(UTC) + expires_in,
+            is_revoked=revoked,
+        )
+    )
+    db_session.flush()
+    return value
+
+
+def test_refresh_rotates_and_stores_only_digests(client, db_session):
+    user = make_user(db_session)
+    old_value = add_token(db_session, user)
+
+    r = client.post("/api/v1/auth/refresh", json={"refresh_token": old_value})
+    assert r.status_code == 200
+    new_value = r.json()["refresh_token"]
+
+    stored = {t.token_hash: t for t in db_session.query(RefreshToken).all()}
+    assert stored[hash_refresh_token(old_value)].is_revoked
+    assert not stored[hash_refresh_token(new_value)].is_revoked
+    assert all(len(digest) == 64 for digest in stored)
+    assert old_value not in stored and new_value not in stored
+
+    # rotated token is single-use
+    r = client.post("/api/v1/auth/refresh", json={"refresh_token": old_value})
+    assert r.status_code == 401
+
+
+def test_purge_deletes_expired_and_revoked_in_batches(db_session):
+    user = make_user(db_session)
+    live = add_token(db_session, user)
+    for _ in range(3):
+        add_token(db_session, user, expires_in=timedelta(days=-1))
+    for _ in range(2):
+        add_token(db_session, user, revoked=True)
+
+    result = purge_refresh_tokens(db_session, batch_size=2)
+
+    assert result["deleted"] == 5
+    assert result["batches"] == 3
+    assert result["seconds"] >= 0
+
+    remaining = [t.token_hash for t in db_session.query(RefreshToken).all()]
+    assert remaining == [hash_refresh_token(live)]
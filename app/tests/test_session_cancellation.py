@@ -0,0 +1,176 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import event
+
+from app.core.security import create_access_token
+from app.models.booking import Booking
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.email_outbox import EmailOutbox
+from app.models.session import Session
+from app.models.stats_rollup import StatsBookingsHourly
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+from app.services.stats_rollups import record_bookings
+
+
+@pytest.fixture()
+def closure(db_session):
+    admin = User(email="closure-admin@test.com", hashed_password="x", role="admin")
+    center = Center(name="Closure Center", address="Street 1", city="Ljubljana")
+    other_center = Center(name="Open Center", address="Street 2", city="Ljubljana")
+    plan = TicketPlan(name="Closure 10", code="closure-10", price_cents=3000, max_entries=10)
+    members = [User(email=f"closure-{i}@test.com", hashed_password="x") for i in range(3)]
+    db_session.add_all([admin, center, other_center, plan, *members])
+    db_session.flush()
+
+    class_type = ClassType(name="Closure Box", duration=60, center_id=center.id)
+    db_session.add(class_type)
+    db_session.flush()
+
+    # 2030-05-06 10:00 / 17:00 UTC = 12:00 / 19:00 in Ljubljana
+    day = datetime(2030, 5, 6, tzinfo=UTC)
+
+    def make_session(center_id, hours):
+        session = Session(
+            center_id=center_id,
+            class_type_id=class_type.id,
+            start_time=day + timedelta(hours=hours),
+            end_time=day + timedelta(hours=hours + 1),
+            capacity=2,
+        )
+        db_session.add(session)
+        db_session.flush()
+        return session
+
+    morning = make_session(center.id, 10)
+    evening = make_session(center.id, 17)
+    elsewhere = make_session(other_center.id, 10)
+    next_day = make_session(center.id, 34)
+
+    now = datetime.now(UTC)
+    tickets = {
+        m.id: Ticket(
+            user_id=m.id,
+            center_id=center.id,
+            plan_id=plan.id,
+            valid_from=now,
+            valid_until=now + timedelta(days=30),
+            remaining_entries=5,
+        )
+        for m in members
+    }
+    db_session.add_all(tickets.values())
+
+    # morning: two active + one waiting; evening: member 0 again
+    bookings = [
+        (morning, members[0], "active"),
+        (morning, members[1], "active"),
+        (morning, members[2], "waiting"),
+        (evening, members[0], "active"),
+        (elsewhere, members[1], "active"),
+        (next_day, members[2], "active"),
+    ]
+    for session, member, status in bookings:
+        db_session.add(Booking(user_id=member.id, session_id=session.id, status=status))
+        if status == "active":
+            session.booked_count += 1
+        record_bookings(
+            db_session,
+            session.id,
+            active=1 if status == "active" else 0,
+            total=1,
+        )
+    db_session.flush()
+
+    token = create_access_token(subject=admin.email, role="admin", user_id=admin.id)
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "center_id": center.id,
+        "class_type_id": class_type.id,
+        "sessions": (morning, evening, elsewhere, next_day),
+        "members": members,
+        "tickets": tickets,
+    }
+
+
+def test_day_closure_cancels_bookings_refunds_and_notifies(client, db_session, closure):
+    morning, evening, elsewhere, next_day = closure["sessions"]
+    members = closure["members"]
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        res = client.post(
+            "/api/v1/admin/sessions/cancel-bulk",
+            headers=closure["headers"],
+            json={"date_from": "2030-05-06", "center_id": closure["center_id"]},
+        )
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+
+    assert res.status_code == 200
+    assert res.json() == {
+        "sessions_cancelled": 2,
+        "bookings_cancelled": 4,
+        "entries_refunded": 3,
+        "notifications": 4,
+    }
+    # a fixed number of statements, not one per booking
+    assert len(statements) <= 12
+
+    db_session.expire_all()
+    assert [s.is_active for s in (morning, evening, elsewhere, next_day)] == [False, False, True, True]
+    assert morning.booked_count == evening.booked_count == 0
+
+    statuses = {
+        (b.session_id, b.user_id): b.status
+        for b in db_session.query(Booking).filter(
+            Booking.session_id.in_([s.id for s in closure["sessions"]])
+        )
+    }
+    assert statuses[(morning.id, members[2].id)] == "cancelled"  # waiting too
+    assert statuses[(elsewhere.id, members[1].id)] == "active"
+    assert statuses[(next_day.id, members[2].id)] == "active"
+
+    # member 0 had two active bookings that day, member 2 only a waiting one
+    tickets = closure["tickets"]
+    assert [tickets[m.id].remaining_entries for m in members] == [7, 6, 5]
+
+    emails = db_session.query(EmailOutbox).filter(
+        EmailOutbox.subject == "Session cancelled ❌"
+    ).all()
+    assert sorted(e.to_email for e in emails) == sorted(
+        ["closure-0@test.com", "closure-0@test.com", "closure-1@test.com", "closure-2@test.com"]
+    )
+    assert all("Closure Box" in e.html_body for e in emails)
+
+    # the 10:00 row also counts the open center's session (same class type)
+    rollup = db_session.get(StatsBookingsHourly, (morning.start_time.date(), 10, closure["class_type_id"]))
+    assert (rollup.active_bookings, rollup.total_bookings) == (1, 4)
+
+
+def test_cancel_single_session(client, db_session, closure):
+    morning, evening, *_ = closure["sessions"]
+
+    res = client.patch(
+        f"/api/v1/admin/sessions/{morning.id}/cancel",
+        headers=closure["headers"],
+    )
+
+    assert res.status_code == 200
+    assert res.json()["is_active"] is False
+    assert res.json()["booked_count"] == 0
+
+    db_session.expire_all()
+    assert evening.is_active is True
+    assert closure["tickets"][closure["members"][0].id].remaining_entries == 6
+
+    again = client.patch(
+        f"/api/v1/admin/sessions/{morning.id}/cancel",
+        headers=closure["headers"],
+    )
+    assert again.status_code == 404
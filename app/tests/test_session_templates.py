@@ -0,0 +1,150 @@
+from datetime import date, datetime, UTC
+
+import pytest
+
+from app.core.security import create_access_token
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session
+from app.models.user import User
+
+
+@pytest.fixture()
+def setup(db_session):
+    admin = User(email="template-admin@test.com", hashed_password="x", role="admin")
+    center = Center(name="Template Center", address="Street 1", city="Ljubljana")
+    db_session.add_all([admin, center])
+    db_session.flush()
+    class_type = ClassType(name="Template Yoga", duration=60, center_id=center.id)
+    db_session.add(class_type)
+    db_session.flush()
+
+    token = create_access_token(subject=admin.email, role="admin", user_id=admin.id)
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "center_id": center.id,
+        "class_type_id": class_type.id,
+    }
+
+
+def create_template(client, setup, **overrides):
+    payload = {
+        "center_id": setup["center_id"],
+        "class_type_id": setup["class_type_id"],
+        "weekday": 0,  # Monday
+        "start_time": "09:00:00",
+        "capacity": 12,
+        "valid_from": "2030-03-01",
+        "valid_until": "2030-04-30",
+    } | overrides
+    res = client.post("/api/v1/admin/session-templates", headers=setup["headers"], json=payload)
+    assert res.status_code == 200
+    return res.json()
+
+
+def generate(client, setup, date_from, date_to):
+    res = client.post(
+        "/api/v1/admin/session-templates/generate",
+        headers=setup["headers"],
+        json={"date_from": date_from, "date_to": date_to, "center_id": setup["center_id"]},
+    )
+    assert res.status_code == 200
+    return res.json()
+
+
+def test_generator_materializes_weekly_sessions_once(client, db_session, setup):
+    template = create_template(client, setup)
+
+    # March 2030 has four Mondays: 4, 11, 18, 25
+    first = generate(client, setup, "2030-03-01", "2030-03-31")
+    assert first["created"] == 4
+
+    sessions = (
+        db_session.query(Session)
+        .filter(Session.template_id == template["id"])
+        .order_by(Session.start_time)
+        .all()
+    )
+    assert [s.start_time.date() for s in sessions] == [
+        date(2030, 3, 4), date(2030, 3, 11), date(2030, 3, 18), date(2030, 3, 25),
+    ]
+    assert all(s.capacity == 12 and s.booked_count == 0 for s in sessions)
+    assert all((s.end_time - s.start_time).total_seconds() == 3600 for s in sessions)
+
+    # rerun over an overlapping range only adds the missing occurrences
+    second = generate(client, setup, "2030-03-15", "2030-04-10")
+    assert second["created"] == 2  # April 1 and 8
+
+
+def test_generator_keeps_local_time_across_dst(client, db_session, setup):
+    create_template(client, setup)
+
+    # Europe/Ljubljana switches to CEST on 2030-03-31
+    generate(client, setup, "2030-03-25", "2030-04-01")
+
+    starts = sorted(
+        s.start_time.astimezone(UTC)
+        for s in db_session.query(Session).filter(Session.center_id == setup["center_id"])
+    )
+    assert starts == [
+        datetime(2030, 3, 25, 8, 0, tzinfo=UTC),  # 09:00 CET
+        datetime(2030, 4, 1, 7, 0, tzinfo=UTC),  # 09:00 CEST
+    ]
+
+
+def test_generator_respects_validity_window_and_deactivation(client, db_session, setup):
+    template = create_template(client, setup, valid_from="2030-03-10", valid_until="2030-03-20")
+    other = create_template(client, setup, weekday=2, start_time="18:30:00")
+
+    res = client.patch(
+        f"/api/v1/admin/session-templates/{other['id']}/deactivate",
+        headers=setup["headers"],
+    )
+    assert res.status_code == 200
+
+    result = generate(client, setup, "2030-03-01", "2030-03-31")
+
+    assert result["created"] == 2  # March 11 and 18 only
+    assert {
+        s.template_id
+        for s in db_session.query(Session).filter(Session.id.in_(result["session_ids"]))
+    } == {template["id"]}
+
+
+def test_generate_rejects_inverted_range(client, setup):
+    res = client.post(
+        "/api/v1/admin/session-templates/generate",
+        headers=setup["headers"],
+        json={"date_from": "2030-03-31", "date_to": "2030-03-01"},
+    )
+
+    assert res.status_code == 400
+
+
+def test_create_template_rejects_unknown_or_foreign_center(client, db_session, setup):
+    payload = {
+        "class_type_id": setup["class_type_id"],
+        "weekday": 0,
+        "start_time": "09:00:00",
+        "capacity": 12,
+        "valid_from": "2030-03-01",
+    }
+    closed = Center(name="Closed Template Center", address="Street 2", city="Ljubljana", is_active=False)
+    other = Center(name="Other Template Center", address="Street 3", city="Ljubljana")
+    db_session.add_all([closed, other])
+    db_session.flush()
+
+    def post(center_id):
+        return client.post(
+            "/api/v1/admin/session-templates",
+            headers=setup["headers"],
+            json=payload | {"center_id": center_id},
+        )
+
+    assert post(999999).status_code == 404
+    assert post(closed.id).status_code == 404
+
+    # the class type belongs to the template center, not this one
+    res = post(other.id)
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Class type does not belong to this center"
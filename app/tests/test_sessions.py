@@ -0,0 +1,145 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import event
+
+from app.models.booking import Booking
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session
+from app.models.user import User
+from app.services.schedule_cache import invalidate_schedule
+from app.tests.conftest import engine
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def seed_day(db_session, n_sessions):
+    center = Center(name="Schedule Center", address="Street 1", city="Ljubljana")
+    db_session.add(center)
+    db_session.flush()
+
+    class_type = ClassType(name="Pilates", duration=45, center_id=center.id)
+    user = User(email="schedule@test.com", hashed_password="x")
+    db_session.add_all([class_type, user])
+    db_session.flush()
+
+    start = datetime(2030, 3, 4, 8, 0, tzinfo=UTC)
+    sessions = []
+    for i in range(n_sessions):
+        s = Session(
+            center_id=center.id,
+            class_type_id=class_type.id,
+            start_time=start + timedelta(minutes=30 * i),
+            end_time=start + timedelta(minutes=30 * i + 45),
+            capacity=10,
+            booked_count=1,
+        )
+        sessions.append(s)
+    db_session.add_all(sessions)
+    db_session.flush()
+
+    db_session.add_all(
+        Booking(user_id=user.id, session_id=s.id, status="active")
+        for s in sessions
+    )
+    center_id = center.id
+    db_session.commit()
+
+    return center_id
+
+
+def test_list_sessions_uses_single_query(client, db_session):
+    center_id = seed_day(db_session, n_sessions=20)
+
+    with count_queries() as statements:
+        r = client.get(
+            "/api/v1/sessions/",
+            params={"center_id": center_id, "day": "2030-03-04"},
+        )
+
+    assert r.status_code == 200
+    body = r.json()
+    assert len(body) == 20
+    assert all(s["booked_count"] == 1 for s in body)
+    assert all(s["class_type"]["name"] == "Pilates" for s in body)
+
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
+
+
+def test_list_sessions_is_served_from_cache_until_invalidated(client, db_session):
+    center_id = seed_day(db_session, n_sessions=3)
+    params = {"center_id": center_id, "day": "2030-03-04"}
+
+    first = client.get("/api/v1/sessions/", params=params)
+
+    with count_queries() as statements:
+        second = client.get("/api/v1/sessions/", params=params)
+
+    assert second.json() == first.json()
+    assert statements == []
+
+    db_session.query(Session).filter(Session.center_id == center_id).update(
+        {Session.booked_count: 5}
+    )
+    db_session.commit()
+    invalidate_schedule()
+
+    third = client.get("/api/v1/sessions/", params=params)
+    assert all(s["booked_count"] == 5 for s in third.json())
+
+
+def test_sessions_range_returns_columnar_week(client, db_session):
+    center_id = seed_day(db_session, n_sessions=4)
+    other_type = ClassType(name="Core", duration=30, center_id=center_id)
+    db_session.add(other_type)
+    db_session.flush()
+    db_session.add(
+        Session(
+            center_id=center_id,
+            class_type_id=other_type.id,
+            start_time=datetime(2030, 3, 9, 18, 0, tzinfo=UTC),
+            end_time=datetime(2030, 3, 9, 18, 30, tzinfo=UTC),
+            capacity=8,
+        )
+    )
+    db_session.commit()
+
+    with count_queries() as statements:
+        r = client.get(
+            "/api/v1/sessions/range",
+            params={"from": "2030-03-03", "to": "2030-03-09", "center_id": center_id},
+        )
+
+    assert r.status_code == 200
+    assert len(statements) == 1
+
+    body = r.json()
+    assert sorted(ct["name"] for ct in body["class_types"].values()) == ["Core", "Pilates"]
+
+    columns = body["sessions"]
+    assert len(columns["id"]) == 5
+    assert all(len(values) == 5 for values in columns.values())
+    assert all(str(ct_id) in body["class_types"] for ct_id in columns["class_type_id"])
+    assert columns["capacity"][-1] == 8
+
+
+def test_sessions_range_rejects_invalid_ranges(client):
+    r = client.get("/api/v1/sessions/range", params={"from": "2030-03-09", "to": "2030-03-03"})
+    assert r.status_code == 400
+
+    r = client.get("/api/v1/sessions/range", params={"from": "2030-03-01", "to": "2030-05-01"})
+    assert r.status_code == 400
@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import func
+
+from app.core.security import create_access_token
+from app.models.booking import Booking
+from app.models.center import Center
+from app.models.class_type import ClassType
+from app.models.session import Session
+from app.models.stats_rollup import (
+    StatsBookingsHourly,
+    StatsRevenueDaily,
+    StatsSignupsDaily,
+)
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+from app.services.stats_rollups import rebuild_rollups
+
+
+def headers(user):
+    token = create_access_token(subject=user.email, role=user.role, user_id=user.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def snapshot(db_session):
+    return {
+        "signups": sorted(
+            db_session.query(StatsSignupsDaily.day, StatsSignupsDaily.signups).all()
+        ),
+        "revenue": sorted(
+            db_session.query(
+                StatsRevenueDaily.day,
+                StatsRevenueDaily.revenue_cents,
+                StatsRevenueDaily.tickets_sold,
+            ).all()
+        ),
+        "bookings": sorted(
+            db_session.query(
+                StatsBookingsHourly.day,
+                StatsBookingsHourly.hour,
+                StatsBookingsHourly.class_type_id,
+                StatsBookingsHourly.active_bookings,
+                StatsBookingsHourly.total_bookings,
+            ).all()
+        ),
+    }
+
+
+@pytest.fixture()
+def gym(db_session):
+    center = Center(name="Rollup Center", address="Street 1", city="Ljubljana")
+    db_session.add(center)
+    db_session.flush()
+
+    class_type = ClassType(name="Rollup Yoga", duration=60, center_id=center.id)
+    plan = TicketPlan(name="Rollup month", code="rollup-month", price_cents=4500, duration_days=30)
+    admin = User(email="rollup-admin@test.com", hashed_password="x", role="admin")
+    members = [User(email=f"rollup-{i}@test.com", hashed_password="x") for i in range(2)]
+    db_session.add_all([class_type, plan, admin, *members])
+    db_session.flush()
+
+    session = Session(
+        center_id=center.id,
+        class_type_id=class_type.id,
+        start_time=datetime(2030, 5, 6, 18, 0, tzinfo=UTC),
+        end_time=datetime(2030, 5, 6, 19, 0, tzinfo=UTC),
+        capacity=1,
+    )
+    now = datetime.now(UTC)
+    db_session.add(session)
+    db_session.add_all([
+        Ticket(
+            user_id=member.id,
+            center_id=center.id,
+            plan_id=plan.id,
+            valid_from=now - timedelta(days=1),
+            valid_until=now + timedelta(days=30),
+        )
+        for member in members
+    ])
+    db_session.flush()
+
+    # baseline for rows seeded above without going through the routers
+    rebuild_rollups(db_session)
+
+    return {
+        "center": center,
+        "plan": plan,
+        "admin": admin,
+        "members": members,
+        "session": session,
+    }
+
+
+def test_incremental_rollups_match_rebuild(client, db_session, gym):
+    first, second = gym["members"]
+    session_id = gym["session"].id
+
+    booked = client.post(
+        "/api/v1/bookings/",
+        params={"session_id": session_id},
+        headers=headers(first),
+    )
+    waiting = client.post(
+        "/api/v1/bookings/",
+        params={"session_id": session_id},
+        headers=headers(second),
+    )
+    assert booked.json()["status"] == "active"
+    assert waiting.json()["status"] == "waiting"
+
+    # cancel → second member promoted
+    assert client.delete(
+        f"/api/v1/bookings/{booked.json()['id']}",
+        headers=headers(first),
+    ).status_code == 200
+
+    assert client.post(
+        "/api/v1/auth/register",
+        json={"email": "rollup-new@test.com", "password": "password123"},
+    ).status_code == 201
+
+    assert client.post(
+        "/api/v1/admin/tickets/assign",
+        json={
+            "user_id": first.id,
+            "center_id": gym["center"].id,
+            "plan_id": gym["plan"].id,
+        },
+        headers=headers(gym["admin"]),
+    ).status_code == 200
+
+    incremental = snapshot(db_session)
+    row = next(r for r in incremental["bookings"] if r.class_type_id == gym["session"].class_type_id)
+    assert (row.hour, row.active_bookings, row.total_bookings) == (18, 1, 2)
+
+    rebuild_rollups(db_session)
+
+    assert snapshot(db_session) == incremental
+
+
+def test_stats_endpoint_reads_rollups(client, db_session, gym):
+    res = client.get("/api/v1/admin/stats", headers=headers(gym["admin"]))
+    assert res.status_code == 200
+    body = res.json()
+
+    assert body["kpis"]["users"] == db_session.query(func.count(User.id)).scalar()
+    assert body["kpis"]["bookings"] == (
+        db_session.query(func.count(Booking.id)).filter(Booking.status == "active").scalar()
+    )
+    assert {"day": datetime.now(UTC).date().isoformat(), "revenue": 90.0} in body["revenue_by_day"]
+    assert body["kpis"]["revenue"] >= 90.0
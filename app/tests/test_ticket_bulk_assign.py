@@ -0,0 +1,100 @@
+from datetime import datetime, UTC
+
+import pytest
+
+from app.core.security import create_access_token
+from app.models.center import Center
+from app.models.stats_rollup import StatsRevenueDaily
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+
+
+@pytest.fixture()
+def setup(db_session):
+    admin = User(email="bulk-admin@test.com", hashed_password="x", role="admin")
+    center = Center(name="Bulk Center", address="Street 1", city="Ljubljana")
+    plan = TicketPlan(
+        name="Bulk 10",
+        code="bulk-10",
+        price_cents=2500,
+        duration_days=60,
+        max_entries=10,
+    )
+    members = [User(email=f"bulk-{i}@test.com", hashed_password="x") for i in range(3)]
+    inactive = User(email="bulk-inactive@test.com", hashed_password="x", is_active=False)
+    db_session.add_all([admin, center, plan, inactive, *members])
+    db_session.flush()
+
+    token = create_access_token(subject=admin.email, role="admin", user_id=admin.id)
+    return {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "center_id": center.id,
+        "plan_id": plan.id,
+        "members": members,
+        "inactive": inactive,
+    }
+
+
+def test_bulk_assign_reports_each_row(client, db_session, setup):
+    members = setup["members"]
+    revenue_before = db_session.get(StatsRevenueDaily, datetime.now(UTC).date())
+    sold_before = revenue_before.tickets_sold if revenue_before else 0
+
+    res = client.post(
+        "/api/v1/admin/tickets/assign-bulk",
+        headers=setup["headers"],
+        json={
+            "center_id": setup["center_id"],
+            "plan_id": setup["plan_id"],
+            "user_ids": [members[0].id, members[1].id, 999999],
+            # bulk-0 is also listed by id
+            "emails": ["bulk-2@test.com", "bulk-0@test.com", "bulk-inactive@test.com"],
+        },
+    )
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["assigned"] == 3
+    assert [(r["ref"], r["status"]) for r in body["results"]] == [
+        (members[0].id, "assigned"),
+        (members[1].id, "assigned"),
+        (999999, "not_found"),
+        ("bulk-2@test.com", "assigned"),
+        ("bulk-0@test.com", "duplicate"),
+        ("bulk-inactive@test.com", "inactive"),
+    ]
+
+    tickets = db_session.query(Ticket).filter(Ticket.plan_id == setup["plan_id"]).all()
+    assert {t.user_id for t in tickets} == {m.id for m in members}
+    assert all(t.remaining_entries == 10 and t.center_id == setup["center_id"] for t in tickets)
+
+    by_user = {r["user_id"]: r["ticket_id"] for r in body["results"] if r["status"] == "assigned"}
+    assert by_user == {t.user_id: t.id for t in tickets}
+
+    db_session.expire_all()
+    assert db_session.get(StatsRevenueDaily, datetime.now(UTC).date()).tickets_sold == sold_before + 3
+
+
+def test_bulk_assign_unknown_plan(client, setup):
+    res = client.post(
+        "/api/v1/admin/tickets/assign-bulk",
+        headers=setup["headers"],
+        json={
+            "center_id": setup["center_id"],
+            "plan_id": 999999,
+            "user_ids": [setup["members"][0].id],
+        },
+    )
+
+    assert res.status_code == 404
+
+
+def test_bulk_assign_requires_users(client, setup):
+    res = client.post(
+        "/api/v1/admin/tickets/assign-bulk",
+        headers=setup["headers"],
+        json={"center_id": setup["center_id"], "plan_id": setup["plan_id"]},
+    )
+
+    assert res.status_code == 400
@@ -0,0 +1,134 @@
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from app.core.config import settings
+from app.models.center import Center
+from app.models.order import Order
+from app.models.payment import Payment
+from app.models.ticket import Ticket
+from app.models.ticket_plan import TicketPlan
+from app.models.user import User
+from app.models.webhook_event import WebhookEvent
+from app.services.webhook_inbox import drain_webhook_inbox, store_event
+
+
+def signed(event: dict, secret: str | None = None) -> tuple[bytes, dict]:
+    """Serialize and sign an event the way Stripe does (v1 scheme)."""
+    payload = json.dumps(event).encode()
+    timestamp = int(time.time())
+    signature = hmac.new(
+        (secret or settings.STRIPE_WEBHOOK_SECRET).encode(),
+        f"{timestamp}.".encode() + payload,
+        hashlib.sha256,
+    ).hexdigest()
+    return payload, {"Stripe-Signature": f"t={timestamp},v1={signature}"}
+
+
+def checkout_completed(event_id: str, order_id) -> dict:
+    return {
+        "id": event_id,
+        "type": "checkout.session.completed",
+        "data": {
+            "object": {
+                "id": f"cs_{event_id}",
+                "payment_status": "paid",
+                "metadata": {"order_id": str(order_id)},
+            }
+        },
+    }
+
+
+@pytest.fixture()
+def order(db_session):
+    # the handler still books tickets on center 1 (multi-center TODO)
+    if not db_session.get(Center, 1):
+        db_session.add(Center(id=1, name="Main Center", address="Street 1", city="Ljubljana"))
+    user = User(email="webhook@test.com", hashed_password="x")
+    plan = TicketPlan(name="Webhook month", code="webhook-month", price_cents=5000, duration_days=30)
+    db_session.add_all([user, plan])
+    db_session.flush()
+
+    order = Order(user_id=user.id, ticket_plan_id=plan.id, price_cents=5000)
+    db_session.add(order)
+    db_session.flush()
+    return order
+
+
+def test_webhook_stores_event_and_acknowledges(client, db_session, order):
+    payload, headers = signed(checkout_completed("evt_inbox_1", order.id))
+
+    res = client.post("/api/v1/webhooks/stripe", content=payload, headers=headers)
+
+    assert res.status_code == 200
+    assert res.json() == {"status": "queued"}
+
+    # nothing processed yet
+    assert order.status == "pending"
+    event = db_session.query(WebhookEvent).filter(WebhookEvent.event_id == "evt_inbox_1").one()
+    assert event.status == "pending"
+    assert event.payload["data"]["object"]["metadata"]["order_id"] == str(order.id)
+
+    # Stripe redelivers: stored once
+    again = client.post("/api/v1/webhooks/stripe", content=payload, headers=headers)
+    assert again.json() == {"status": "duplicate"}
+    assert db_session.query(WebhookEvent).filter(WebhookEvent.event_id == "evt_inbox_1").count() == 1
+
+
+def test_webhook_rejects_bad_signature(client, db_session, order):
+    payload, headers = signed(checkout_completed("evt_inbox_forged", order.id), secret="whsec_wrong")
+
+    res = client.post("/api/v1/webhooks/stripe", content=payload, headers=headers)
+
+    assert res.status_code == 400
+    assert db_session.query(WebhookEvent).filter(WebhookEvent.event_id == "evt_inbox_forged").count() == 0
+
+
+def test_worker_processes_checkout_once(db_session, order):
+    store_event(db_session, "stripe", checkout_completed("evt_inbox_2", order.id))
+    # a second event for the same checkout (e.g. async payment succeeded)
+    store_event(db_session, "stripe", checkout_completed("evt_inbox_3", order.id))
+    db_session.commit()
+
+    assert drain_webhook_inbox(db_session) == {"processed": 2, "retried": 0, "dead": 0}
+
+    assert order.status == "paid"
+    assert db_session.query(Payment).filter(Payment.order_id == order.id).count() == 1
+    assert db_session.query(Ticket).filter(Ticket.user_id == order.user_id).count() == 1
+    outcomes = [
+        e.outcome
+        for e in db_session.query(WebhookEvent)
+        .filter(WebhookEvent.event_id.in_(["evt_inbox_2", "evt_inbox_3"]))
+        .order_by(WebhookEvent.id)
+    ]
+    assert outcomes == ["ticket created", "already processed"]
+
+
+def test_failing_event_is_retried_then_dead_lettered(db_session, order):
+    store_event(db_session, "stripe", checkout_completed("evt_inbox_bad", "not-a-number"))
+    store_event(db_session, "stripe", checkout_completed("evt_inbox_good", order.id))
+    db_session.commit()
+
+    # the failing event does not roll back its neighbour
+    assert drain_webhook_inbox(db_session, max_attempts=2) == {"processed": 1, "retried": 1, "dead": 0}
+    assert order.status == "paid"
+
+    bad = db_session.query(WebhookEvent).filter(WebhookEvent.event_id == "evt_inbox_bad").one()
+    assert bad.status == "pending"
+    assert bad.attempts == 1
+    assert bad.next_attempt_at > datetime.now(UTC)
+    assert bad.last_error.startswith("ValueError")
+
+    # not due yet → untouched
+    assert drain_webhook_inbox(db_session, max_attempts=2)["retried"] == 0
+
+    bad.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    db_session.commit()
+
+    assert drain_webhook_inbox(db_session, max_attempts=2)["dead"] == 1
+    assert bad.status == "dead"
+    assert bad.attempts == 2
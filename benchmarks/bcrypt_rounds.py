@@ -0,0 +1,90 @@
+"""
+Pick BCRYPT_ROUNDS against a login latency budget.
+
+For every cost factor in the range, times password verification on one thread
+(latency) and on --workers threads (throughput of the hashing pool), then
+recommends the highest cost whose p95 verify latency stays within the budget.
+
+    python -m benchmarks.bcrypt_rounds --min-rounds 10 --max-rounds 14 \
+        --budget-ms 250 --workers 4
+
+Run it on the production instance type – bcrypt cost is CPU-bound.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+PASSWORD = "correct horse battery staple"
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def measure(rounds: int, samples: int, workers: int) -> dict:
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    hashed = context.hash(PASSWORD)
+
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+
+    calls = samples * workers
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        started = time.perf_counter()
+        list(pool.map(lambda _: context.verify(PASSWORD, hashed), range(calls)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "rounds": rounds,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "logins_per_s": calls / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--budget-ms", type=float, default=250.0,
+                        help="p95 verify latency allowed per login")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="PASSWORD_HASH_WORKERS to size throughput for")
+    parser.add_argument("--samples", type=int, default=10)
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'rounds':>6} {'p50 ms':>9} {'p95 ms':>9} {'logins/s':>10}  "
+          f"(with {args.workers} workers)")
+
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        result = measure(rounds, args.samples, args.workers)
+        results.append(result)
+        within = "ok" if result["p95_ms"] <= args.budget_ms else "over budget"
+        print(f"{rounds:6} {result['p50_ms']:9.1f} {result['p95_ms']:9.1f} "
+              f"{result['logins_per_s']:10.1f}  {within}")
+
+        if result["p95_ms"] > args.budget_ms * 2:
+            # every further round doubles the cost
+            break
+
+    fitting = [r for r in results if r["p95_ms"] <= args.budget_ms]
+    if not fitting:
+        print(f"\nNo cost factor fits {args.budget_ms:.0f} ms – "
+              f"lower --min-rounds (OWASP minimum is 10).")
+        return
+
+    best = fitting[-1]
+    print(f"\nRecommended BCRYPT_ROUNDS={best['rounds']} "
+          f"(p95 {best['p95_ms']:.0f} ms, ~{best['logins_per_s']:.0f} logins/s "
+          f"with PASSWORD_HASH_WORKERS={args.workers})")
+
+
+if __name__ == "__main__":
+    main()
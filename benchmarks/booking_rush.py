@@ -0,0 +1,463 @@
+"""
+Replay a class-opening booking rush against a running API and check invariants.
+
+Seeds one session plus N members with valid tickets, then fires all bookings
+for that session at once through an async HTTP client ("rush"), followed by a
+concurrent wave of cancellations that promotes members from the waiting list.
+
+    python -m benchmarks.booking_rush \
+        --database-url postgresql+psycopg2://postgres@localhost/fitness_bench \
+        --spawn-server --members 300 --capacity 40 --cancel-ratio 0.25
+
+With --spawn-server a local uvicorn is started on the same database with
+rate limiting off and the fake email provider. Without it, point --base-url at
+a server that shares SECRET_KEY and DATABASE_URL and runs with
+RATE_LIMIT_ENABLED=false (the per-IP limits would otherwise turn the rush
+into 429s).
+
+Reported: p50/p95/p99 latency and throughput per phase, lock wait time
+sampled from pg_stat_activity, and the invariants
+  * sessions.booked_count == number of active bookings
+  * active bookings <= capacity (no overbooking)
+  * promoted bookings are the oldest waiting ones (waitlist order)
+Exit code is 1 when an invariant fails, so runs can gate changes to
+app/routers/bookings.py. Seeded rows are removed afterwards unless --keep.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+import httpx
+from sqlalchemy import create_engine, text
+
+from app.core.security import create_access_token
+
+BOOKINGS_URL = "/api/v1/bookings/"
+
+
+@dataclass
+class Result:
+    status_code: int
+    latency: float
+    body: dict = field(default_factory=dict)
+
+
+@dataclass
+class PhaseStats:
+    name: str
+    results: list[Result]
+    wall_seconds: float
+
+    def latencies(self) -> list[float]:
+        return sorted(r.latency for r in self.results)
+
+    def summary(self) -> dict:
+        lat = self.latencies()
+        return {
+            "requests": len(self.results),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_rps": round(len(self.results) / self.wall_seconds, 1)
+            if self.wall_seconds
+            else 0.0,
+            "p50_ms": round(percentile(lat, 50) * 1000, 1),
+            "p95_ms": round(percentile(lat, 95) * 1000, 1),
+            "p99_ms": round(percentile(lat, 99) * 1000, 1),
+            "max_ms": round(lat[-1] * 1000, 1) if lat else 0.0,
+            "status_codes": dict(Counter(r.status_code for r in self.results)),
+        }
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+# -------------------------------------------------------------------
+# Seeding / cleanup
+# -------------------------------------------------------------------
+def seed(engine, run: str, members: int, capacity: int) -> dict:
+    with engine.begin() as conn:
+        center_id = conn.execute(text("""
+            INSERT INTO centers (name, address, city, is_active, created_at)
+            VALUES ('rush-' || :run, 'Rush street 1', 'Ljubljana', true, now())
+            RETURNING id
+        """), {"run": run}).scalar_one()
+
+        class_type_id = conn.execute(text("""
+            INSERT INTO class_types (name, description, center_id, created_at, is_active, duration)
+            VALUES ('BodyPump', NULL, :center_id, now(), true, 60)
+            RETURNING id
+        """), {"center_id": center_id}).scalar_one()
+
+        session_id = conn.execute(text("""
+            INSERT INTO sessions (class_type_id, center_id, start_time, end_time,
+                                  capacity, is_active, booked_count, created_at)
+            VALUES (:class_type_id, :center_id,
+                    date_trunc('hour', now()) + interval '1 day',
+                    date_trunc('hour', now()) + interval '1 day 1 hour',
+                    :capacity, true, 0, now())
+            RETURNING id
+        """), {
+            "class_type_id": class_type_id,
+            "center_id": center_id,
+            "capacity": capacity,
+        }).scalar_one()
+
+        plan_id = conn.execute(text("""
+            INSERT INTO ticket_plans (name, code, price_cents, duration_days, max_entries, is_active)
+            VALUES ('Rush monthly', 'rush-' || :run, 5000, 30, NULL, true)
+            RETURNING id
+        """), {"run": run}).scalar_one()
+
+        members_rows = conn.execute(text("""
+            INSERT INTO users (email, hashed_password, role, is_active, created_at)
+            SELECT 'rush-' || :run || '-' || g || '@example.com', 'x', 'user', true, now()
+            FROM generate_series(1, :members) g
+            RETURNING id, email
+        """), {"run": run, "members": members}).all()
+
+        conn.execute(text("""
+            INSERT INTO tickets (user_id, center_id, plan_id, valid_from, valid_until,
+                                 remaining_entries, is_active, created_at)
+            SELECT u.id, :center_id, :plan_id, now() - interval '1 day',
+                   now() + interval '30 days', NULL, true, now()
+            FROM users u
+            WHERE u.email LIKE 'rush-' || :run || '-%'
+        """), {"run": run, "center_id": center_id, "plan_id": plan_id})
+
+    return {
+        "center_id": center_id,
+        "session_id": session_id,
+        "plan_id": plan_id,
+        "members": [(row.id, row.email) for row in members_rows],
+    }
+
+
+def cleanup(engine, run: str, seeded: dict) -> None:
+    with engine.begin() as conn:
+        pattern = {"pattern": f"rush-{run}-%"}
+        conn.execute(text("DELETE FROM email_outbox WHERE to_email LIKE :pattern"), pattern)
+        # bookings and tickets cascade with their users / center
+        conn.execute(text("DELETE FROM users WHERE email LIKE :pattern"), pattern)
+        conn.execute(text("DELETE FROM centers WHERE id = :id"), {"id": seeded["center_id"]})
+        conn.execute(text("DELETE FROM ticket_plans WHERE id = :id"), {"id": seeded["plan_id"]})
+
+
+# -------------------------------------------------------------------
+# Lock wait sampling
+# -------------------------------------------------------------------
+class LockWaitSampler(threading.Thread):
+    """
+    Polls pg_stat_activity for backends waiting on heavyweight locks.
+
+    waited_seconds approximates total backend-seconds spent in lock waits
+    (waiting backends x time since the previous sample).
+    """
+
+    def __init__(self, engine, interval: float = 0.01):
+        super().__init__(name="lock-wait-sampler", daemon=True)
+        self.engine = engine
+        self.interval = interval
+        self.samples = 0
+        self.waited_seconds = 0.0
+        self.max_waiting = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        with self.engine.connect() as conn:
+            last = time.perf_counter()
+            while not self._stop_event.is_set():
+                waiting = conn.execute(text("""
+                    SELECT count(*) FROM pg_stat_activity
+                    WHERE datname = current_database()
+                      AND wait_event_type = 'Lock'
+                """)).scalar_one()
+                conn.rollback()
+
+                now = time.perf_counter()
+                self.samples += 1
+                self.waited_seconds += waiting * (now - last)
+                last = now
+                self.max_waiting = max(self.max_waiting, waiting)
+                self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def summary(self) -> dict:
+        return {
+            "waited_seconds": round(self.waited_seconds, 3),
+            "max_concurrent_waiters": self.max_waiting,
+            "samples": self.samples,
+        }
+
+
+# -------------------------------------------------------------------
+# Load phases
+# -------------------------------------------------------------------
+async def timed(client: httpx.AsyncClient, gate: asyncio.Event, method: str, url: str, **kwargs) -> Result:
+    await gate.wait()
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError:
+        # dropped / timed out – counted as status 0
+        return Result(0, time.perf_counter() - started)
+    latency = time.perf_counter() - started
+
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+
+    return Result(response.status_code, latency, body if isinstance(body, dict) else {})
+
+
+async def run_phase(client: httpx.AsyncClient, name: str, requests: list[tuple]) -> PhaseStats:
+    # every request waits on the same gate → they all leave at once
+    gate = asyncio.Event()
+    tasks = [
+        asyncio.create_task(timed(client, gate, method, url, **kwargs))
+        for method, url, kwargs in requests
+    ]
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    gate.set()
+    results = await asyncio.gather(*tasks)
+    return PhaseStats(name, list(results), time.perf_counter() - started)
+
+
+def auth(token: str) -> dict:
+    return {"headers": {"Authorization": f"Bearer {token}"}}
+
+
+async def rush(base_url: str, concurrency: int, session_id: int, tokens: list[str], cancel_ratio: float, rng: random.Random):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        booking = await run_phase(client, "booking rush", [
+            ("POST", BOOKINGS_URL, {"params": {"session_id": session_id}, **auth(token)})
+            for token in tokens
+        ])
+
+        booked = [
+            (token, result.body["id"])
+            for token, result in zip(tokens, booking.results)
+            if result.status_code == 201 and result.body.get("status") == "active"
+        ]
+        to_cancel = rng.sample(booked, int(len(booked) * cancel_ratio))
+
+        cancel = await run_phase(client, "cancellation wave", [
+            ("DELETE", f"{BOOKINGS_URL}{booking_id}", auth(token))
+            for token, booking_id in to_cancel
+        ])
+
+    return booking, cancel, {booking_id for _, booking_id in to_cancel}
+
+
+# -------------------------------------------------------------------
+# Invariants
+# -------------------------------------------------------------------
+def check_invariants(engine, session_id: int, rush_results: list[Result], cancelled_ids: set[int]) -> dict:
+    with engine.connect() as conn:
+        session = conn.execute(text(
+            "SELECT capacity, booked_count FROM sessions WHERE id = :id"
+        ), {"id": session_id}).mappings().one()
+
+        rows = conn.execute(text("""
+            SELECT id, status FROM bookings
+            WHERE session_id = :id
+            ORDER BY created_at, id
+        """), {"id": session_id}).all()
+
+    active = [booking_id for booking_id, status in rows if status == "active"]
+
+    # waitlist as handed out by the rush, in queue order
+    waiting_at_rush = {
+        r.body["id"] for r in rush_results
+        if r.status_code == 201 and r.body.get("status") == "waiting"
+    }
+    queue = [booking_id for booking_id, _ in rows if booking_id in waiting_at_rush]
+    promoted = [booking_id for booking_id in queue if booking_id in active]
+    seats_freed = min(len(cancelled_ids), len(queue))
+
+    checks = {
+        "booked_count_matches_active": session["booked_count"] == len(active),
+        "no_overbooking": len(active) <= session["capacity"],
+        "waitlist_order_respected": promoted == queue[:seats_freed],
+    }
+
+    return {
+        "capacity": session["capacity"],
+        "booked_count": session["booked_count"],
+        "active_bookings": len(active),
+        "waiting_after_rush": len(queue),
+        "cancelled": len(cancelled_ids),
+        "promoted": len(promoted),
+        "checks": checks,
+        "ok": all(checks.values()),
+    }
+
+
+# -------------------------------------------------------------------
+# Local server
+# -------------------------------------------------------------------
+def spawn_server(
+    database_url: str,
+    port: int,
+    workers: int,
+    extra_env: dict[str, str] | None = None,
+) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "RATE_LIMIT_ENABLED": "false",
+        "EMAIL_PROVIDER": "fake",
+        **(extra_env or {}),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--workers", str(workers),
+            "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+def wait_for_health(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit(f"Server at {base_url} did not become healthy in {timeout:.0f}s")
+
+
+def print_report(report: dict) -> None:
+    print(f"\nBooking rush: {report['members']} members, capacity {report['capacity']}, "
+          f"concurrency {report['concurrency']}")
+
+    print(f"\n{'phase':20} {'reqs':>6} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8}  status codes")
+    for name, phase in report["phases"].items():
+        print(f"{name:20} {phase['requests']:6} {phase['throughput_rps']:8} "
+              f"{phase['p50_ms']:8} {phase['p95_ms']:8} {phase['p99_ms']:8} "
+              f"{phase['max_ms']:8}  {phase['status_codes']}")
+
+    locks = report["lock_waits"]
+    print(f"\nLock waits: ~{locks['waited_seconds']}s backend time, "
+          f"max {locks['max_concurrent_waiters']} concurrent waiters "
+          f"({locks['samples']} samples)")
+
+    inv = report["invariants"]
+    print(f"\nSession: booked_count={inv['booked_count']} active={inv['active_bookings']} "
+          f"waiting_after_rush={inv['waiting_after_rush']} cancelled={inv['cancelled']} "
+          f"promoted={inv['promoted']}")
+    for name, ok in inv["checks"].items():
+        print(f"  [{'PASS' if ok else 'FAIL'}] {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8765")
+    parser.add_argument("--spawn-server", action="store_true", help="start a local uvicorn")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers (with --spawn-server)")
+    parser.add_argument("--members", type=int, default=300)
+    parser.add_argument("--capacity", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=100, help="max open connections")
+    parser.add_argument("--cancel-ratio", type=float, default=0.25,
+                        help="share of active bookings cancelled after the rush")
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="also write the report as JSON")
+    parser.add_argument("--keep", action="store_true", help="keep seeded rows")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, future=True)
+    run = str(int(time.time()))
+    rng = random.Random(args.random_seed)
+
+    server = None
+    if args.spawn_server:
+        port = httpx.URL(args.base_url).port or 80
+        server = spawn_server(args.database_url, port, args.workers)
+
+    seeded = seed(engine, run, args.members, args.capacity)
+    tokens = [
+        create_access_token(subject=email, role="user", user_id=user_id)
+        for user_id, email in seeded["members"]
+    ]
+    rng.shuffle(tokens)
+
+    sampler = LockWaitSampler(engine)
+
+    try:
+        wait_for_health(args.base_url)
+
+        sampler.start()
+        booking, cancel, cancelled_ids = asyncio.run(rush(
+            args.base_url,
+            args.concurrency,
+            seeded["session_id"],
+            tokens,
+            args.cancel_ratio,
+            rng,
+        ))
+        sampler.stop()
+
+        report = {
+            "members": args.members,
+            "capacity": args.capacity,
+            "concurrency": args.concurrency,
+            "phases": {
+                booking.name: booking.summary(),
+                cancel.name: cancel.summary(),
+            },
+            "lock_waits": sampler.summary(),
+            "invariants": check_invariants(
+                engine, seeded["session_id"], booking.results, cancelled_ids
+            ),
+        }
+    finally:
+        if sampler.is_alive():
+            sampler.stop()
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if not args.keep:
+            cleanup(engine, run, seeded)
+
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    sys.exit(0 if report["invariants"]["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Measure checkout throughput offline against the fake payment gateway.
+
+Seeds N members and a ticket plan, then fires one POST /api/v1/orders/checkout
+per member at once. The server runs with PAYMENT_PROVIDER=fake and a
+simulated provider round trip (--gateway-latency-ms), so the run shows how
+many checkouts the API sustains while the provider is slow, without
+touching Stripe.
+
+    python -m benchmarks.checkout_throughput \\
+        --database-url postgresql+psycopg2://postgres@localhost/fitness_bench \\
+        --spawn-server --members 200 --gateway-latency-ms 300
+
+Reported: p50/p95/p99 latency and throughput, and the peak number of
+connections sitting "idle in transaction" (sampled from pg_stat_activity).
+While the endpoint was a sync def holding its DB session across the provider
+call, every in-flight checkout pinned a worker thread and one such
+connection for the whole round trip, and a burst larger than the pool
+(5 + 10) timed out on QueuePool. Seeded rows are removed afterwards unless
+--keep.
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+from sqlalchemy import create_engine, text
+
+from app.core.security import create_access_token
+from benchmarks.booking_rush import auth, run_phase, spawn_server, wait_for_health
+
+CHECKOUT_URL = "/api/v1/orders/checkout"
+
+
+def seed(engine, run: str, members: int) -> dict:
+    with engine.begin() as conn:
+        plan_id = conn.execute(text("""
+            INSERT INTO ticket_plans (name, code, price_cents, duration_days, max_entries, is_active)
+            VALUES ('Checkout monthly', 'checkout-' || :run, 5000, 30, NULL, true)
+            RETURNING id
+        """), {"run": run}).scalar_one()
+
+        rows = conn.execute(text("""
+            INSERT INTO users (email, hashed_password, role, is_active, created_at)
+            SELECT 'checkout-' || :run || '-' || g || '@example.com', 'x', 'user', true, now()
+            FROM generate_series(1, :members) g
+            RETURNING id, email
+        """), {"run": run, "members": members}).all()
+
+    return {"plan_id": plan_id, "members": [(row.id, row.email) for row in rows]}
+
+
+def cleanup(engine, run: str, seeded: dict) -> None:
+    with engine.begin() as conn:
+        # orders cascade with their users
+        conn.execute(
+            text("DELETE FROM users WHERE email LIKE :pattern"),
+            {"pattern": f"checkout-{run}-%"},
+        )
+        conn.execute(text("DELETE FROM ticket_plans WHERE id = :id"), {"id": seeded["plan_id"]})
+
+
+class IdleInTransactionSampler(threading.Thread):
+    """Peak number of backends 'idle in transaction' (held across the provider call)."""
+
+    def __init__(self, engine, interval: float = 0.01):
+        super().__init__(name="idle-in-transaction-sampler", daemon=True)
+        self.engine = engine
+        self.interval = interval
+        self.peak = 0
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        with self.engine.connect() as conn:
+            while not self._stop_event.is_set():
+                held = conn.execute(text("""
+                    SELECT count(*) FROM pg_stat_activity
+                    WHERE datname = current_database()
+                      AND state = 'idle in transaction'
+                      AND pid <> pg_backend_pid()
+                """)).scalar_one()
+                conn.rollback()
+                self.samples += 1
+                self.peak = max(self.peak, held)
+                self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+async def checkout_burst(base_url: str, concurrency: int, plan_id: int, tokens: list[str]):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        return await run_phase(client, "checkout burst", [
+            ("POST", CHECKOUT_URL, {"json": {"plan_id": plan_id}, **auth(token)})
+            for token in tokens
+        ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8766")
+    parser.add_argument("--spawn-server", action="store_true", help="start a local uvicorn")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers (with --spawn-server)")
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=100, help="max open connections")
+    parser.add_argument("--gateway-latency-ms", type=int, default=300,
+                        help="simulated provider round trip (with --spawn-server)")
+    parser.add_argument("--json", dest="json_path", help="also write the report as JSON")
+    parser.add_argument("--keep", action="store_true", help="keep seeded rows")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, future=True)
+    run = str(int(time.time()))
+
+    server = None
+    if args.spawn_server:
+        port = httpx.URL(args.base_url).port or 80
+        server = spawn_server(args.database_url, port, args.workers, {
+            "PAYMENT_PROVIDER": "fake",
+            "PAYMENT_FAKE_LATENCY_MS": str(args.gateway_latency_ms),
+        })
+
+    seeded = seed(engine, run, args.members)
+    tokens = [
+        create_access_token(subject=email, role="user", user_id=user_id)
+        for user_id, email in seeded["members"]
+    ]
+
+    sampler = IdleInTransactionSampler(engine)
+
+    try:
+        wait_for_health(args.base_url)
+
+        sampler.start()
+        burst = asyncio.run(checkout_burst(args.base_url, args.concurrency, seeded["plan_id"], tokens))
+        sampler.stop()
+
+        report = {
+            "members": args.members,
+            "concurrency": args.concurrency,
+            "gateway_latency_ms": args.gateway_latency_ms,
+            "checkout": burst.summary(),
+            "peak_idle_in_transaction": sampler.peak,
+        }
+    finally:
+        if sampler.is_alive():
+            sampler.stop()
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if not args.keep:
+            cleanup(engine, run, seeded)
+
+    checkout = report["checkout"]
+    print(f"\nCheckout burst: {args.members} members, concurrency {args.concurrency}, "
+          f"gateway latency {args.gateway_latency_ms} ms")
+    print(f"  {checkout['requests']} requests in {checkout['wall_seconds']}s "
+          f"({checkout['throughput_rps']} rps)")
+    print(f"  p50 {checkout['p50_ms']} ms, p95 {checkout['p95_ms']} ms, "
+          f"p99 {checkout['p99_ms']} ms, max {checkout['max_ms']} ms")
+    print(f"  status codes: {checkout['status_codes']}")
+    print(f"  peak connections idle in transaction: {report['peak_idle_in_transaction']}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    sys.exit(0 if set(checkout["status_codes"]) == {200} else 1)
+
+
+if __name__ == "__main__":
+    main()
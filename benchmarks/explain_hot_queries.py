@@ -0,0 +1,282 @@
+"""
+EXPLAIN ANALYZE the hot query shapes before and after the hot-query indexes.
+
+Seeds a synthetic dataset into a SCRATCH database, then for every hot query
+captures the plan without the indexes ("before") and with them ("after").
+
+    python -m benchmarks.explain_hot_queries \
+        --database-url postgresql+psycopg2://postgres@localhost/fitness_bench \
+        --seed --scale 1.0 --output bench_output.txt
+
+The schema is created with Base.metadata.create_all when missing. Never point
+this at a production database: it drops and recreates indexes.
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, UTC
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.db.base import Base
+import app.models  # noqa: F401  (register all tables)
+from app.models.order import Order  # noqa: F401
+from app.models.payment import Payment  # noqa: F401
+
+HOT_INDEXES = [
+    "ix_sessions_center_id_start_time_active",
+    "ix_sessions_start_time_active",
+    "ix_bookings_session_id_status_created_at",
+    "ix_tickets_user_id_center_id_valid_until_active",
+    "ix_orders_user_id_status",
+    "ix_refresh_tokens_user_id",
+]
+
+# (label, SQL, params) – shapes issued by the routers
+HOT_QUERIES = [
+    (
+        "sessions: schedule for a center and day",
+        """
+        SELECT s.*, ct.*
+        FROM sessions s JOIN class_types ct ON ct.id = s.class_type_id
+        WHERE s.is_active AND s.center_id = :center_id
+          AND s.start_time >= :day AND s.start_time < :day + interval '1 day'
+        ORDER BY s.start_time
+        """,
+        {"center_id": 3},
+    ),
+    (
+        "sessions: schedule for a day (all centers)",
+        """
+        SELECT s.*
+        FROM sessions s
+        WHERE s.is_active
+          AND s.start_time >= :day AND s.start_time < :day + interval '1 day'
+        ORDER BY s.start_time
+        """,
+        {},
+    ),
+    (
+        "bookings: next waiting booking (waitlist promotion)",
+        """
+        SELECT * FROM bookings
+        WHERE session_id = :session_id AND status = 'waiting'
+        ORDER BY created_at
+        LIMIT 1
+        """,
+        {},
+    ),
+    (
+        "tickets: active ticket for user and center",
+        """
+        SELECT * FROM tickets
+        WHERE user_id = :user_id AND center_id = :center_id AND is_active
+          AND valid_from <= now() AND valid_until >= now()
+        ORDER BY valid_until DESC
+        LIMIT 1
+        """,
+        {"center_id": 1},
+    ),
+    (
+        "orders: orders of a user by status",
+        "SELECT * FROM orders WHERE user_id = :user_id AND status = 'pending'",
+        {},
+    ),
+    (
+        "refresh_tokens: tokens of a user",
+        "SELECT * FROM refresh_tokens WHERE user_id = :user_id",
+        {},
+    ),
+]
+
+
+def seed(conn, scale: float) -> None:
+    users = int(50_000 * scale)
+    sessions_per_day = 30
+    days = int(365 * 2 * max(scale, 0.1))
+    centers = 5
+    bookings_per_session = 20
+    run = int(time.time())
+
+    print(f"Seeding ~{users} users, {days * sessions_per_day} sessions, "
+          f"~{days * sessions_per_day * bookings_per_session} bookings ...")
+
+    statements = [
+        ("""
+        INSERT INTO centers (name, address, city, is_active, created_at)
+        SELECT 'bench-' || :run || '-' || g, 'Street ' || g, 'Ljubljana', true, now()
+        FROM generate_series(1, :centers) g
+        """, {"centers": centers}),
+        ("""
+        INSERT INTO class_types (name, description, center_id, created_at, is_active, duration)
+        SELECT (ARRAY['BodyPump','Core','Kickbox','BodyBalance'])[1 + g % 4], NULL,
+               c.id, now(), true, 60
+        FROM centers c CROSS JOIN generate_series(1, 4) g
+        WHERE c.name LIKE 'bench-' || :run || '-%'
+        """, {}),
+        ("""
+        INSERT INTO ticket_plans (name, code, price_cents, duration_days, max_entries, is_active)
+        VALUES ('Bench monthly', 'bench-' || :run, 5000, 30, NULL, true)
+        """, {}),
+        ("""
+        INSERT INTO users (email, hashed_password, role, is_active, created_at)
+        SELECT 'bench-' || :run || '-' || g || '@example.com', 'x', 'user', true,
+               now() - (g % 700) * interval '1 day'
+        FROM generate_series(1, :users) g
+        """, {"users": users}),
+        ("""
+        INSERT INTO sessions (class_type_id, center_id, start_time, end_time,
+                              capacity, is_active, booked_count, created_at)
+        SELECT ct.id, ct.center_id, t, t + interval '1 hour', 20, (random() > 0.05),
+               0, t - interval '30 days'
+        FROM generate_series(
+                 date_trunc('day', now()) - :days * interval '1 day',
+                 date_trunc('day', now()),
+                 interval '1 day') d
+        CROSS JOIN generate_series(0, :per_day - 1) slot
+        CROSS JOIN LATERAL (
+            SELECT id, center_id FROM class_types
+            ORDER BY id DESC
+            OFFSET slot % 20 LIMIT 1
+        ) ct
+        CROSS JOIN LATERAL (SELECT d + (6 + slot % 15) * interval '1 hour' AS t) ts
+        """, {"days": days, "per_day": sessions_per_day}),
+        ("""
+        INSERT INTO bookings (user_id, session_id, created_at, status)
+        SELECT u.min_id + (random() * (u.max_id - u.min_id))::int, s.id,
+               s.start_time - random() * interval '7 days',
+               CASE WHEN random() < 0.8 THEN 'active'
+                    WHEN random() < 0.5 THEN 'waiting' ELSE 'cancelled' END
+        FROM sessions s
+        CROSS JOIN generate_series(1, :per_session) g
+        CROSS JOIN (SELECT min(id) AS min_id, max(id) AS max_id FROM users) u
+        """, {"per_session": bookings_per_session}),
+        ("""
+        INSERT INTO tickets (user_id, center_id, plan_id, valid_from, valid_until,
+                             remaining_entries, is_active, created_at)
+        SELECT u.id, 1 + (u.id % :centers),
+               (SELECT id FROM ticket_plans WHERE code = 'bench-' || :run),
+               now() - k * interval '30 days', now() - (k - 1) * interval '30 days',
+               NULL, k = 1, now() - k * interval '30 days'
+        FROM users u CROSS JOIN generate_series(1, 3) k
+        WHERE u.email LIKE 'bench-' || :run || '-%'
+        """, {"centers": centers}),
+        ("""
+        INSERT INTO orders (user_id, ticket_plan_id, price_cents, currency, status, created_at)
+        SELECT u.id, (SELECT id FROM ticket_plans WHERE code = 'bench-' || :run),
+               5000, 'EUR', (ARRAY['pending','paid','paid','failed'])[1 + k % 4],
+               now() - k * interval '30 days'
+        FROM users u CROSS JOIN generate_series(1, 3) k
+        WHERE u.email LIKE 'bench-' || :run || '-%'
+        """, {}),
+        ("""
+        INSERT INTO refresh_tokens (token_hash, user_id, expires_at, is_revoked)
+        SELECT encode(sha256(convert_to(u.id || '-' || k || '-' || :run, 'UTF8')), 'hex'), u.id,
+               now() + (k - 5) * interval '10 days', k < 5
+        FROM users u CROSS JOIN generate_series(1, 8) k
+        WHERE u.email LIKE 'bench-' || :run || '-%'
+        """, {}),
+    ]
+
+    for sql, params in statements:
+        conn.execute(text(sql), {"run": str(run), **params})
+
+    conn.execute(text("""
+        UPDATE sessions s SET booked_count = b.n
+        FROM (SELECT session_id, count(*) AS n FROM bookings
+              WHERE status = 'active' GROUP BY session_id) b
+        WHERE b.session_id = s.id
+    """))
+
+
+def sample_params(conn) -> dict:
+    row = conn.execute(text("""
+        SELECT
+            (SELECT session_id FROM bookings WHERE status = 'waiting' LIMIT 1) AS session_id,
+            (SELECT user_id FROM tickets WHERE is_active LIMIT 1) AS user_id,
+            (SELECT date_trunc('day', max(start_time)) - interval '3 days'
+             FROM sessions) AS day
+    """)).mappings().one()
+    return dict(row)
+
+
+def explain(conn, sql: str, params: dict) -> tuple[float, str]:
+    rows = conn.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params
+    ).scalar_one()
+    plan = rows[0] if isinstance(rows, list) else json.loads(rows)[0]
+
+    text_plan = conn.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params
+    ).scalars().all()
+    return plan["Execution Time"], "\n".join(text_plan)
+
+
+def drop_hot_indexes(conn) -> None:
+    for name in HOT_INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def create_hot_indexes(conn) -> None:
+    by_name = {
+        index.name: index
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+    }
+    for name in HOT_INDEXES:
+        by_name[name].create(conn, checkfirst=True)
+
+
+def capture(conn, params: dict, label: str, out) -> dict[str, float]:
+    conn.execute(text("ANALYZE"))
+    timings = {}
+
+    print(f"\n{'=' * 70}\n{label.upper()}\n{'=' * 70}", file=out)
+    for name, sql, extra in HOT_QUERIES:
+        ms, plan = explain(conn, sql, {**params, **extra})
+        timings[name] = ms
+        print(f"\n--- {name} ({ms:.2f} ms)\n{plan}", file=out)
+
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--seed", action="store_true", help="add synthetic data first")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--output", default="-", help="file for full plans (- = stdout)")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, future=True)
+
+    if not inspect(engine).has_table("sessions"):
+        Base.metadata.create_all(engine)
+
+    if args.seed:
+        with engine.begin() as conn:
+            seed(conn, args.scale)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+
+    with engine.begin() as conn:
+        params = sample_params(conn)
+
+        drop_hot_indexes(conn)
+        before = capture(conn, params, "before (no hot indexes)", out)
+
+        create_hot_indexes(conn)
+        after = capture(conn, params, "after (hot indexes)", out)
+
+    print(f"\nSummary ({datetime.now(UTC):%Y-%m-%d %H:%M} UTC)")
+    print(f"{'query':55} {'before ms':>10} {'after ms':>10}")
+    for name in before:
+        print(f"{name:55} {before[name]:10.2f} {after[name]:10.2f}")
+
+    if out is not sys.stdout:
+        out.close()
+
+
+if __name__ == "__main__":
+    main()